@@ -0,0 +1,38 @@
+"""Composite (company_id, created_at, id) indexes for keyset pagination on assets and projects.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; avoids locking large tenants' tables for writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_assets_company_created_id",
+            "assets",
+            ["company_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_projects_company_created_id",
+            "projects",
+            ["company_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_projects_company_created_id", table_name="projects", postgresql_concurrently=True)
+        op.drop_index("ix_assets_company_created_id", table_name="assets", postgresql_concurrently=True)
@@ -0,0 +1,77 @@
+"""Indexed search: pg_trgm GIN indexes and generated tsvector columns on assets and projects.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "003"
+down_revision = "002"
+branch_labels = None
+depends_on = None
+
+ASSET_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, coalesce(name, '') || ' ' || "
+    "coalesce(serial_number, '') || ' ' || coalesce(asset_type, ''))"
+)
+PROJECT_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, coalesce(name, '') || ' ' || "
+    "coalesce(code, '') || ' ' || coalesce(description, ''))"
+)
+
+# (index name, table, column) served by gin_trgm_ops: ILIKE '%q%' (contains) and <% (fuzzy)
+TRGM_INDEXES = [
+    ("ix_assets_name_trgm", "assets", "name"),
+    ("ix_assets_serial_number_trgm", "assets", "serial_number"),
+    ("ix_assets_asset_type_trgm", "assets", "asset_type"),
+    ("ix_projects_name_trgm", "projects", "name"),
+    ("ix_projects_code_trgm", "projects", "code"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Stored generated columns rewrite the table once; schedule on large installs accordingly
+    op.add_column(
+        "assets",
+        sa.Column("search_vector", postgresql.TSVECTOR(), sa.Computed(ASSET_DOCUMENT, persisted=True)),
+    )
+    op.add_column(
+        "projects",
+        sa.Column("search_vector", postgresql.TSVECTOR(), sa.Computed(PROJECT_DOCUMENT, persisted=True)),
+    )
+
+    with op.get_context().autocommit_block():
+        for table in ("assets", "projects"):
+            op.create_index(
+                f"ix_{table}_search_vector",
+                table,
+                ["search_vector"],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, column in TRGM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(TRGM_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+        for table in ("projects", "assets"):
+            op.drop_index(f"ix_{table}_search_vector", table_name=table, postgresql_concurrently=True)
+    op.drop_column("projects", "search_vector")
+    op.drop_column("assets", "search_vector")
@@ -0,0 +1,36 @@
+"""Stripe webhook event log (idempotency by event id) and per-tenant event ordering on subscriptions.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stripe_events",
+        sa.Column("id", sa.String(255), primary_key=True),
+        sa.Column("type", sa.String(128), nullable=False),
+        sa.Column("company_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("companies.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("stripe_created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("received_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("outcome", sa.String(32), nullable=True),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+    )
+    op.create_index("ix_stripe_events_company_created", "stripe_events", ["company_id", "stripe_created_at"])
+    op.add_column("subscriptions", sa.Column("last_event_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("subscriptions", "last_event_at")
+    op.drop_index("ix_stripe_events_company_created", table_name="stripe_events")
+    op.drop_table("stripe_events")
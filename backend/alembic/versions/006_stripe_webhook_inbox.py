@@ -0,0 +1,40 @@
+"""Stripe webhook inbox: processing state on stripe_events and a partial index over pending rows.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("stripe_events", sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("stripe_events", sa.Column("attempts", sa.Integer(), server_default="0", nullable=False))
+    op.add_column(
+        "stripe_events",
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.add_column("stripe_events", sa.Column("last_error", sa.Text(), nullable=True))
+    # Events logged before the inbox were applied inline by the webhook
+    op.execute("UPDATE stripe_events SET processed_at = received_at WHERE outcome IS NOT NULL")
+    op.create_index(
+        "ix_stripe_events_pending",
+        "stripe_events",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stripe_events_pending", table_name="stripe_events")
+    op.drop_column("stripe_events", "last_error")
+    op.drop_column("stripe_events", "next_attempt_at")
+    op.drop_column("stripe_events", "attempts")
+    op.drop_column("stripe_events", "processed_at")
@@ -0,0 +1,45 @@
+"""Per-tenant usage counters for plan entitlements, backfilled from the current row counts.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tenant_usage",
+        sa.Column(
+            "company_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("companies.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("projects", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("users", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("assets", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.execute(
+        """
+        INSERT INTO tenant_usage (company_id, projects, users, assets)
+        SELECT c.id,
+               (SELECT count(*) FROM projects p WHERE p.company_id = c.id),
+               (SELECT count(*) FROM users u WHERE u.company_id = c.id),
+               (SELECT count(*) FROM assets a WHERE a.company_id = c.id)
+        FROM companies c
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("tenant_usage")
@@ -0,0 +1,32 @@
+"""(company_id, created_at|scheduled_at|completed_at, id) indexes for audit listings and calendar ranges.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_audits_company_created_id": ["company_id", "created_at", "id"],
+    "ix_audits_company_scheduled_id": ["company_id", "scheduled_at", "id"],
+    "ix_audits_company_completed_id": ["company_id", "completed_at", "id"],
+}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; avoids blocking audit writes while building
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(name, "audits", columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in reversed(INDEXES):
+            op.drop_index(name, table_name="audits", postgresql_concurrently=True)
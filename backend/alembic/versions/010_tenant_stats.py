@@ -0,0 +1,127 @@
+"""Per-company counts by status, appended as deltas by statement-level triggers; replaces tenant_usage.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+# Counted tables -> their status expression
+TRACKED_TABLES = {
+    "projects": "status",
+    "users": "CASE WHEN is_active THEN 'active' ELSE 'inactive' END",
+    "assets": "status",
+    "audits": "status",
+    "rfqs": "status",
+}
+
+TRACK_FUNCTION = """
+CREATE OR REPLACE FUNCTION tenant_stats_track_{table}() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO tenant_stat_deltas (company_id, entity, status, n)
+        SELECT company_id, '{table}', {status}, count(*) FROM new_rows GROUP BY 1, 3;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO tenant_stat_deltas (company_id, entity, status, n)
+        SELECT company_id, '{table}', {status}, -count(*) FROM old_rows GROUP BY 1, 3;
+    ELSE
+        INSERT INTO tenant_stat_deltas (company_id, entity, status, n)
+        SELECT company_id, '{table}', status, sum(n)
+        FROM (
+            SELECT company_id, {status} AS status, 1 AS n FROM new_rows
+            UNION ALL
+            SELECT company_id, {status}, -1 FROM old_rows
+        ) changed
+        GROUP BY 1, 3
+        HAVING sum(n) <> 0;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+TRIGGERS = {
+    "insert": "REFERENCING NEW TABLE AS new_rows",
+    "update": "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "delete": "REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tenant_stats",
+        sa.Column(
+            "company_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("companies.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("entity", sa.String(32), primary_key=True),
+        sa.Column("status", sa.String(32), primary_key=True),
+        sa.Column("n", sa.BigInteger(), nullable=False),
+    )
+    op.create_table(
+        "tenant_stat_deltas",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column("company_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("entity", sa.String(32), nullable=False),
+        sa.Column("status", sa.String(32), nullable=False),
+        sa.Column("n", sa.BigInteger(), nullable=False),
+    )
+    op.create_index("ix_tenant_stat_deltas_company", "tenant_stat_deltas", ["company_id"])
+    # CREATE TRIGGER blocks writes to the table until this migration commits, so the backfill
+    # below counts exactly the rows the triggers will record changes to from then on
+    for table, status in TRACKED_TABLES.items():
+        op.execute(TRACK_FUNCTION.format(table=table, status=status))
+        for op_name, transition in TRIGGERS.items():
+            op.execute(
+                f"CREATE TRIGGER {table}_tenant_stats_{op_name} AFTER {op_name.upper()} ON {table} "
+                f"{transition} FOR EACH STATEMENT EXECUTE FUNCTION tenant_stats_track_{table}()"
+            )
+        op.execute(
+            f"INSERT INTO tenant_stats (company_id, entity, status, n) "
+            f"SELECT company_id, '{table}', {status}, count(*) FROM {table} GROUP BY 1, 3"
+        )
+    # Plan limits read the same counts now
+    op.drop_table("tenant_usage")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "tenant_usage",
+        sa.Column(
+            "company_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("companies.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("projects", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("users", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("assets", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.execute(
+        """
+        INSERT INTO tenant_usage (company_id, projects, users, assets)
+        SELECT c.id,
+               (SELECT count(*) FROM projects p WHERE p.company_id = c.id),
+               (SELECT count(*) FROM users u WHERE u.company_id = c.id),
+               (SELECT count(*) FROM assets a WHERE a.company_id = c.id)
+        FROM companies c
+        """
+    )
+    for table in TRACKED_TABLES:
+        for op_name in TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_tenant_stats_{op_name} ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS tenant_stats_track_{table}()")
+    op.drop_table("tenant_stat_deltas")
+    op.drop_table("tenant_stats")
@@ -0,0 +1,28 @@
+"""Per column group webhook watermarks on subscriptions (plan vs status) instead of one last_event_at.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("subscriptions", sa.Column("plan_event_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("subscriptions", sa.Column("status_event_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE subscriptions SET plan_event_at = last_event_at, status_event_at = last_event_at")
+    op.drop_column("subscriptions", "last_event_at")
+
+
+def downgrade() -> None:
+    op.add_column("subscriptions", sa.Column("last_event_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE subscriptions SET last_event_at = greatest(plan_event_at, status_event_at)")
+    op.drop_column("subscriptions", "status_event_at")
+    op.drop_column("subscriptions", "plan_event_at")
@@ -1,29 +1,35 @@
 """API dependencies: JWT extraction, current user, company/tenant context, role-based access."""
 import uuid
-from typing import Annotated, List
+from typing import Annotated, Any, List
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
+from app.core.principal import Principal
+from app.core.security import decode_token
 from app.core.tenant import TenantContext
-from app.database import get_db
+from app.database import get_db, get_read_sessionmaker  # noqa: F401 - re-exported for routers
 from app.models.user import User, UserRole
+from app.repositories.pagination import Cursor, decode_cursor
 from app.services.auth import auth_service
 
-
-def _effective_role_code(user: User) -> str:
-    """Role code for RBAC (Role.code or fallback 'user')."""
-    if user.role is not None:
-        return user.role.code
-    return "user"
-
+settings = get_settings()
 
 # Prefer Bearer token (clients send Authorization: Bearer <token>)
 security = HTTPBearer(auto_error=False)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
 
 
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
 async def get_token(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
     token: Annotated[str | None, Depends(oauth2_scheme)],
@@ -34,70 +40,135 @@ async def get_token(
     return token
 
 
+async def get_token_claims(
+    request: Request,
+    token: Annotated[str | None, Depends(get_token)],
+) -> dict[str, Any] | None:
+    """
+    Verified JWT claims, or None when no/invalid token. Reuses the payload the auth-context
+    middleware already verified for this request, so the token is checked once per request.
+    """
+    if not token:
+        return None
+    if getattr(request.state, "auth_token", None) == token:
+        return request.state.auth_payload
+    return decode_token(token)
+
+
 async def get_current_user(
     db: Annotated[AsyncSession, Depends(get_db)],
     token: Annotated[str | None, Depends(get_token)],
+    claims: Annotated[dict[str, Any] | None, Depends(get_token_claims)],
 ) -> User:
-    """Validate JWT and load current user; 401 if missing or invalid."""
+    """Validate JWT and load the full current User row; 401 if missing or invalid."""
     if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    user = await auth_service.get_user_from_token(db, token)
+        raise _unauthorized("Not authenticated")
+    user = await auth_service.get_user_from_claims(db, claims)
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Invalid or expired token")
     return user
 
 
+async def get_current_principal(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    token: Annotated[str | None, Depends(get_token)],
+    claims: Annotated[dict[str, Any] | None, Depends(get_token_claims)],
+) -> Principal:
+    """
+    Validate JWT and resolve the caller (id, company, role, active) from the principal cache.
+    Use instead of get_current_user when the endpoint does not need the full User row.
+    """
+    if not token:
+        raise _unauthorized("Not authenticated")
+    principal = await auth_service.get_principal_from_claims(db, claims)
+    if not principal:
+        raise _unauthorized("Invalid or expired token")
+    return principal
+
+
 async def get_current_tenant(
-    current_user: Annotated[User, Depends(get_current_user)],
+    principal: Annotated[Principal, Depends(get_current_principal)],
 ) -> TenantContext:
-    """Build tenant/company context from current user (for scoped queries)."""
+    """Build tenant/company context from current principal (for scoped queries)."""
     return TenantContext(
-        tenant_id=current_user.company_id,
-        tenant_slug=getattr(current_user.company, "slug", None),
-        role=_effective_role_code(current_user),
+        tenant_id=principal.company_id,
+        tenant_slug=principal.tenant_slug,
+        role=principal.role,
     )
 
 
+async def get_claims_company_id(
+    token: Annotated[str | None, Depends(get_token)],
+    claims: Annotated[dict[str, Any] | None, Depends(get_token_claims)],
+) -> uuid.UUID:
+    """Claims-only company_id: verified JWT signature/exp, no DB or cache lookup."""
+    if not token:
+        raise _unauthorized("Not authenticated")
+    company_id = auth_service.company_id_from_claims(claims)
+    if company_id is None:
+        raise _unauthorized("Invalid or expired token")
+    return company_id
+
+
 async def get_company_id(
-    tenant: Annotated[TenantContext, Depends(get_current_tenant)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    token: Annotated[str | None, Depends(get_token)],
+    claims: Annotated[dict[str, Any] | None, Depends(get_token_claims)],
 ) -> uuid.UUID:
     """
     Dependency that returns the current company_id (tenant_id) from JWT.
     Use this so every query is explicitly scoped: list(company_id), get(id, company_id), etc.
     Never accept company_id from request body for create/update; always use this.
+
+    With auth_claims_only_company_id the DB is skipped entirely (a disabled user keeps access
+    until the token expires); otherwise the cached principal also confirms the user is active.
     """
-    return tenant.tenant_id
+    if settings.auth_claims_only_company_id:
+        return await get_claims_company_id(token, claims)
+    principal = await get_current_principal(db, token, claims)
+    return principal.company_id
 
 
 def require_roles(allowed_roles: List[UserRole]):
-    """Dependency factory: require current user to have one of the given roles (by Role.code)."""
+    """Dependency factory: require current principal to have one of the given roles (by Role.code)."""
+    allowed_codes = [r.value for r in allowed_roles]
 
     async def _require(
-        current_user: Annotated[User, Depends(get_current_user)],
-    ) -> User:
-        role_code = _effective_role_code(current_user)
-        allowed_codes = [r.value for r in allowed_roles]
-        if role_code not in allowed_codes:
+        principal: Annotated[Principal, Depends(get_current_principal)],
+    ) -> Principal:
+        if principal.role not in allowed_codes:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions",
             )
-        return current_user
+        return principal
 
     return _require
 
 
+def parse_cursor(cursor: str | None, ranked: bool = False) -> Cursor | None:
+    """
+    Decode a list endpoint's ?cursor=; None or empty means start from the newest row. 400 if malformed,
+    or if the listing is ordered by search relevance (ranked), which cursors cannot express.
+    """
+    if cursor is not None and ranked:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination is not available for ranked search; use page",
+        )
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
 # Type aliases for secure dependency injection
 CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentPrincipal = Annotated[Principal, Depends(get_current_principal)]
 CurrentTenant = Annotated[TenantContext, Depends(get_current_tenant)]
 CompanyId = Annotated[uuid.UUID, Depends(get_company_id)]
-RequireAdmin = Annotated[User, Depends(require_roles([UserRole.ADMIN]))]
-RequireManager = Annotated[User, Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER]))]
+ClaimsCompanyId = Annotated[uuid.UUID, Depends(get_claims_company_id)]
+RequireAdmin = Annotated[Principal, Depends(require_roles([UserRole.ADMIN]))]
+RequireManager = Annotated[Principal, Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER]))]
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1 import auth, example, users, tenants, projects, assets, billing
+from app.api.v1 import auth, example, users, tenants, projects, assets, audits, rfqs, dashboard, billing
 
 api_router = APIRouter()
 
@@ -10,4 +10,7 @@ api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(tenants.router, prefix="/tenants", tags=["tenants"])
 api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
 api_router.include_router(assets.router, prefix="/assets", tags=["assets"])
+api_router.include_router(audits.router, prefix="/audits", tags=["audits"])
+api_router.include_router(rfqs.router, prefix="/rfqs", tags=["rfqs"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
 api_router.include_router(billing.router, prefix="/billing", tags=["billing"])
\ No newline at end of file
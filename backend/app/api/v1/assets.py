@@ -1,19 +1,34 @@
 """Asset CRUD: RESTful, company-scoped, pagination, filtering, Bubble-friendly JSON."""
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.api.deps import CompanyId, CurrentUser, get_db
+from app.api.deps import CompanyId, get_db, get_read_sessionmaker, parse_cursor
 from app.core.multitenant import assert_same_company
-from app.schemas.asset import AssetCreate, AssetRead, AssetUpdate
+from app.repositories.pagination import CountMode
+from app.repositories.search import SearchMode
+from app.schemas.asset import (
+    AssetBulkResult,
+    AssetBulkSelection,
+    AssetBulkUpdate,
+    AssetCreate,
+    AssetImportReport,
+    AssetListItem,
+    AssetRead,
+    AssetUpdate,
+)
 from app.schemas.common import PaginatedResponse
 from app.services.asset import asset_service
+from app.services.asset_import import ImportFileError, ImportFormat, asset_import_service
+from app.services.export import ExportFormat
+from app.services.project import project_service
 
 router = APIRouter()
 
 
-@router.get("", response_model=PaginatedResponse[AssetRead])
+@router.get("", response_model=PaginatedResponse[AssetListItem])
 async def list_assets(
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -21,44 +36,76 @@ async def list_assets(
     status: str | None = Query(None, description="Filter by status (e.g. active, inactive)"),
     asset_type: str | None = Query(None, description="Filter by asset type"),
     search: str | None = Query(None, alias="q", description="Search by name, serial_number, or type"),
-    current_user: CurrentUser = None,
+    search_mode: SearchMode = Query(
+        SearchMode.CONTAINS,
+        description="contains (substring), fuzzy (typo tolerant, ranked) or fulltext (words, ranked)",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="Cursor mode: send empty for the first page, then each response's next_cursor",
+    ),
+    count: CountMode = Query(CountMode.EXACT, description="true (exact), false (skip), or estimate"),
     company_id: CompanyId = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
     List assets for the current company. Bubble-friendly: results, count, page, per_page.
+    Passing cursor switches from OFFSET paging to keyset paging on (created_at, id).
+    Ranked search modes order by relevance and return rank/highlight per row.
     """
-    skip = (page - 1) * per_page
-    items = await asset_service.list(
+    after = parse_cursor(cursor, ranked=bool(search and search.strip()) and search_mode.ranked)
+    result = await asset_service.page(
         db,
         company_id,
-        skip=skip,
+        skip=(page - 1) * per_page,
         limit=per_page,
         project_id=project_id,
         status=status,
         asset_type=asset_type,
         search=search,
+        search_mode=search_mode,
+        keyset=cursor is not None,
+        after=after,
+        count=count,
     )
-    total = await asset_service.count(
-        db,
+    return PaginatedResponse.from_page(result, AssetListItem, page, per_page)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_assets(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson (one object per line) or csv"),
+    project_id: uuid.UUID | None = Query(None, description="Filter by project id"),
+    status: str | None = Query(None, description="Filter by status (e.g. active, inactive)"),
+    asset_type: str | None = Query(None, description="Filter by asset type"),
+    search: str | None = Query(None, alias="q", description="Search by name, serial_number, or type"),
+    search_mode: SearchMode = Query(SearchMode.CONTAINS, description="contains, fuzzy or fulltext"),
+    company_id: CompanyId = None,
+    read_sessionmaker: async_sessionmaker[AsyncSession] = Depends(get_read_sessionmaker),
+):
+    """
+    Every asset matching the list filters, newest first, streamed from a server-side cursor.
+    CSV uses the POST /assets/import layout (metadata as JSON), so it can be imported again.
+    """
+    body = asset_service.export(
+        read_sessionmaker,
         company_id,
+        format,
         project_id=project_id,
         status=status,
         asset_type=asset_type,
         search=search,
+        search_mode=search_mode,
     )
-    return PaginatedResponse(
-        results=[AssetRead.model_validate(a) for a in items],
-        count=total,
-        page=page,
-        per_page=per_page,
+    return StreamingResponse(
+        body,
+        media_type=format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="assets.{format.value}"'},
     )
 
 
 @router.get("/{asset_id}", response_model=AssetRead)
 async def get_asset(
     asset_id: uuid.UUID,
-    current_user: CurrentUser = None,
     company_id: CompanyId = None,
     db: AsyncSession = Depends(get_db),
 ):
@@ -73,7 +120,6 @@ async def get_asset(
 @router.post("", response_model=AssetRead, status_code=status.HTTP_201_CREATED)
 async def create_asset(
     data: AssetCreate,
-    current_user: CurrentUser = None,
     company_id: CompanyId = None,
     db: AsyncSession = Depends(get_db),
 ):
@@ -93,11 +139,86 @@ async def create_asset(
     return AssetRead.model_validate(asset)
 
 
+@router.post("/import", response_model=AssetImportReport)
+async def import_assets(
+    request: Request,
+    format: ImportFormat | None = Query(
+        None, description="csv or ndjson; defaults from Content-Type (text/csv, application/x-ndjson)"
+    ),
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Bulk create assets from a CSV (header row; columns as in POST /assets, metadata as JSON) or
+    NDJSON body, read as a stream. Valid rows are inserted, invalid ones reported by row number.
+    """
+    fmt = format or ImportFormat.from_content_type(request.headers.get("content-type"))
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or pass ?format=",
+        )
+    try:
+        report = await asset_import_service.import_stream(db, company_id, request.stream(), fmt)
+    except ImportFileError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return AssetImportReport(
+        inserted=report.inserted,
+        failed=report.failed,
+        errors=report.errors,
+        errors_truncated=report.errors_truncated,
+    )
+
+
+@router.post("/bulk/update", response_model=AssetBulkResult)
+async def bulk_update_assets(
+    data: AssetBulkUpdate,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Apply the same changes to many assets in one UPDATE: the given ids, or up to limit assets
+    matching filter (repeat with cursor=next_cursor until it is null). 404 if values.project_id
+    is not a project of this company.
+    """
+    values = data.values.model_dump(exclude_unset=True)
+    if values.get("project_id") is not None:
+        if not await project_service.get_by_id(db, values["project_id"], company_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+    result = await asset_service.bulk_update(
+        db,
+        company_id,
+        values,
+        ids=data.ids,
+        filters=data.filter.model_dump(exclude_none=True) if data.filter else None,
+        after=data.cursor,
+        limit=data.limit,
+    )
+    return AssetBulkResult(affected=result.affected, not_found=result.not_found, next_cursor=result.next_cursor)
+
+
+@router.post("/bulk/delete", response_model=AssetBulkResult)
+async def bulk_delete_assets(
+    data: AssetBulkSelection,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete many assets in one DELETE: the given ids, or up to limit assets matching filter (see bulk/update)."""
+    result = await asset_service.bulk_delete(
+        db,
+        company_id,
+        ids=data.ids,
+        filters=data.filter.model_dump(exclude_none=True) if data.filter else None,
+        after=data.cursor,
+        limit=data.limit,
+    )
+    return AssetBulkResult(affected=result.affected, not_found=result.not_found, next_cursor=result.next_cursor)
+
+
 @router.patch("/{asset_id}", response_model=AssetRead)
 async def update_asset(
     asset_id: uuid.UUID,
     data: AssetUpdate,
-    current_user: CurrentUser = None,
     company_id: CompanyId = None,
     db: AsyncSession = Depends(get_db),
 ):
@@ -118,7 +239,6 @@ async def update_asset(
 @router.delete("/{asset_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_asset(
     asset_id: uuid.UUID,
-    current_user: CurrentUser = None,
     company_id: CompanyId = None,
     db: AsyncSession = Depends(get_db),
 ):
@@ -0,0 +1,168 @@
+"""Audit scheduling: company-scoped CRUD, calendar range queries and bulk scheduling."""
+import uuid
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import CompanyId, get_db, parse_cursor
+from app.core.multitenant import assert_same_company
+from app.repositories.audit import AuditDateField
+from app.repositories.pagination import CountMode
+from app.schemas.audit import AuditBulkCreate, AuditCreate, AuditRead, AuditUpdate
+from app.schemas.common import PaginatedResponse
+from app.services.audit import AuditReferenceNotFound, audit_service
+
+router = APIRouter()
+
+
+def _not_found(e: AuditReferenceNotFound) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.get("", response_model=PaginatedResponse[AuditRead])
+async def list_audits(
+    page: int = Query(1, ge=1, description="Page number (1-based)"),
+    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    asset_id: uuid.UUID | None = Query(None, description="Filter by asset id"),
+    project_id: uuid.UUID | None = Query(None, description="Filter by project id"),
+    auditor_id: uuid.UUID | None = Query(None, description="Filter by auditor (user id)"),
+    audit_status: str | None = Query(None, alias="status", description="Filter by status (e.g. scheduled, completed)"),
+    audit_type: str | None = Query(None, description="Filter by audit type"),
+    cursor: str | None = Query(
+        None,
+        description="Cursor mode: send empty for the first page, then each response's next_cursor",
+    ),
+    count: CountMode = Query(CountMode.EXACT, description="true (exact), false (skip), or estimate"),
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """List audits for the current company, newest first. Bubble-friendly: results, count, page, per_page."""
+    result = await audit_service.page(
+        db,
+        company_id,
+        skip=(page - 1) * per_page,
+        limit=per_page,
+        keyset=cursor is not None,
+        after=parse_cursor(cursor),
+        count=count,
+        asset_id=asset_id,
+        project_id=project_id,
+        auditor_id=auditor_id,
+        status=audit_status,
+        audit_type=audit_type,
+    )
+    return PaginatedResponse.from_page(result, AuditRead, page, per_page)
+
+
+@router.get("/calendar", response_model=PaginatedResponse[AuditRead])
+async def audit_calendar(
+    start: datetime = Query(..., alias="from", description="Range start (inclusive), ISO 8601 with offset"),
+    end: datetime = Query(..., alias="to", description="Range end (exclusive)"),
+    field: AuditDateField = Query(AuditDateField.SCHEDULED, description="scheduled_at or completed_at"),
+    per_page: int = Query(100, ge=1, le=500, description="Items per page"),
+    asset_id: uuid.UUID | None = Query(None, description="Filter by asset id"),
+    project_id: uuid.UUID | None = Query(None, description="Filter by project id"),
+    auditor_id: uuid.UUID | None = Query(None, description="Filter by auditor (user id)"),
+    audit_status: str | None = Query(None, alias="status", description="Filter by status"),
+    audit_type: str | None = Query(None, description="Filter by audit type"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Audits whose scheduled_at (or completed_at) falls in [from, to), earliest first.
+    Follow next_cursor for more; count is not computed (null).
+    """
+    if end <= start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'to' must be after 'from'")
+    result = await audit_service.calendar(
+        db,
+        company_id,
+        field,
+        start,
+        end,
+        limit=per_page,
+        after=parse_cursor(cursor),
+        asset_id=asset_id,
+        project_id=project_id,
+        auditor_id=auditor_id,
+        status=audit_status,
+        audit_type=audit_type,
+    )
+    return PaginatedResponse.from_page(result, AuditRead, 1, per_page)
+
+
+@router.get("/{audit_id}", response_model=AuditRead)
+async def get_audit(
+    audit_id: uuid.UUID,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get one audit by id. 404 if not found or different company."""
+    audit = await audit_service.get_by_id(db, audit_id, company_id)
+    if not audit:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audit not found")
+    assert_same_company(audit.company_id, company_id, "Audit")
+    return AuditRead.model_validate(audit)
+
+
+@router.post("", response_model=AuditRead, status_code=status.HTTP_201_CREATED)
+async def create_audit(
+    data: AuditCreate,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Create an audit in the current company. 404 if project, asset or auditor is not the company's."""
+    try:
+        audit = await audit_service.create(db, company_id, data.model_dump())
+    except AuditReferenceNotFound as e:
+        raise _not_found(e)
+    return AuditRead.model_validate(audit)
+
+
+@router.post("/bulk", response_model=list[AuditRead], status_code=status.HTTP_201_CREATED)
+async def schedule_audits(
+    data: AuditBulkCreate,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Create up to 1000 audits in one INSERT, all or nothing; returned in request order."""
+    try:
+        audits = await audit_service.schedule_many(db, company_id, [a.model_dump() for a in data.audits])
+    except AuditReferenceNotFound as e:
+        raise _not_found(e)
+    return [AuditRead.model_validate(a) for a in audits]
+
+
+@router.patch("/{audit_id}", response_model=AuditRead)
+async def update_audit(
+    audit_id: uuid.UUID,
+    data: AuditUpdate,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Update audit. 404 if not found, different company, or a new reference is not the company's."""
+    audit = await audit_service.get_by_id(db, audit_id, company_id)
+    if not audit:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audit not found")
+    assert_same_company(audit.company_id, company_id, "Audit")
+    try:
+        audit = await audit_service.update(db, audit, company_id, data.model_dump(exclude_unset=True))
+    except AuditReferenceNotFound as e:
+        raise _not_found(e)
+    return AuditRead.model_validate(audit)
+
+
+@router.delete("/{audit_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_audit(
+    audit_id: uuid.UUID,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete audit. 404 if not found or different company."""
+    audit = await audit_service.get_by_id(db, audit_id, company_id)
+    if not audit:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audit not found")
+    assert_same_company(audit.company_id, company_id, "Audit")
+    await audit_service.delete(db, audit)
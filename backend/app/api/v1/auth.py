@@ -4,12 +4,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUser
-from app.core.security import get_password_hash
+from app.core.passwords import password_hasher
 from app.database import get_db
 from app.schemas.auth import LoginRequest, LoginResponse, UserInResponse
 from app.services.auth import auth_service
+from app.services.entitlements import Resource, entitlement_service
 from app.repositories.user import user_repository
 from app.repositories.company import company_repository
+from app.repositories.load_profiles import LoadProfile
 
 router = APIRouter()
 
@@ -74,36 +76,45 @@ async def register(
         raise HTTPException(status_code=400, detail="Password must contain at least one number")
 
     # Check if email already exists
-    existing = await user_repository.get_by_email_any_company(db, payload.email)
+    existing = await user_repository.get_by_email_any_company(
+        db, payload.email, profile=LoadProfile.LIST
+    )
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     # Create or find company
+    default_slug = "default"
     company = None
+    joined_existing = False
     if payload.company_name:
         slug = re.sub(r'[^a-z0-9]+', '-', payload.company_name.lower()).strip('-')
         company = await company_repository.get_by_slug(db, slug)
+        joined_existing = company is not None
         if not company:
             company = await company_repository.create(db, name=payload.company_name, slug=slug)
 
     if not company:
         # Default company for standalone users
-        default_slug = "default"
         company = await company_repository.get_by_slug(db, default_slug)
         if not company:
             company = await company_repository.create(db, name="Default", slug=default_slug)
 
+    # Joining an existing tenant takes one of its plan's user seats; standalone signups share the
+    # default company, which is not limited
+    if joined_existing and company.slug != default_slug:
+        await entitlement_service.consume(db, company.id, Resource.USERS)
+
     # Create user
     from app.models.user import User
     user = User(
         company_id=company.id,
         email=payload.email,
-        hashed_password=get_password_hash(payload.password),
+        hashed_password=await password_hasher.hash(payload.password),
         full_name=payload.full_name,
         is_active=True,
     )
     db.add(user)
-    await db.flush()
+    await db.flush()  # counted by the users trigger
     await db.refresh(user, ["company", "role"])
 
     # Generate JWT
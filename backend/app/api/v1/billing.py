@@ -3,7 +3,9 @@ Billing / Subscription endpoints — Stripe integration.
 
 4 tiers: start (free), basic ($10/mo), standard ($50/mo), premium ($200/mo).
 Handles: plans, subscriptions, checkout, portal, webhooks, customer creation.
+Calls to Stripe go through the async billing gateway (app/services/billing_gateway.py).
 """
+import json
 import os
 import uuid
 import logging
@@ -15,7 +17,11 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUser, CurrentTenant, get_db
-from app.database import get_db
+from app.database import read_write
+from app.services.billing_gateway import BillingUnavailable, billing_gateway
+from app.services.entitlements import entitlement_service
+from app.services.stripe_events import stripe_event_service
+from app.services.subscription import SubscriptionState, subscription_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -60,6 +66,12 @@ class CreateSubscriptionResponse(BaseModel):
 class PortalResponse(BaseModel):
     url: str
 
+class UsageOut(BaseModel):
+    plan_id: str
+    effective_plan_id: str  # "start" while a paid subscription is lapsed
+    usage: dict[str, int]
+    limits: dict[str, int | None]  # None: unlimited
+
 class SubscriptionOut(BaseModel):
     plan_id: str
     status: str
@@ -70,6 +82,7 @@ class SubscriptionOut(BaseModel):
 
 # ── Plan definitions (4 tiers: start, basic, standard, premium) ─
 # Seller plans start from Free. Buyer plans start from Basic (different prices).
+# The user/project limits listed here are enforced from PLAN_LIMITS in app/services/entitlements.py.
 
 PLANS = [
     PlanOut(id="start", name="Free (Seller)", price=0, interval="month", tier=0, features=[
@@ -98,42 +111,40 @@ STRIPE_PRICE_IDS: dict[str, str] = {
 }
 
 
-# ── In-memory subscription store (replace with DB table in production) ─
-
-_subscriptions: dict[str, dict] = {}  # tenant_id -> subscription data
-_stripe_customers: dict[str, str] = {}  # tenant_id -> stripe_customer_id
-
+# ── Subscription store (subscriptions table, cached per worker; see app/services/subscription.py) ─
 
-def _get_sub(tenant_id: str) -> dict:
-    return _subscriptions.get(tenant_id, {
-        "plan_id": "start",
-        "status": "active",
-        "current_period_end": None,
-        "cancel_at_period_end": False,
-        "trial_ends_at": None,
-    })
+def _sub_out(state: SubscriptionState) -> SubscriptionOut:
+    return SubscriptionOut(
+        plan_id=state.plan_id,
+        status=state.status,
+        current_period_end=state.current_period_end.isoformat() if state.current_period_end else None,
+        cancel_at_period_end=state.cancel_at_period_end,
+        trial_ends_at=state.trial_ends_at.isoformat() if state.trial_ends_at else None,
+    )
 
 
-def _set_sub(tenant_id: str, **kwargs):
-    current = _get_sub(tenant_id)
-    current.update(kwargs)
-    _subscriptions[tenant_id] = current
-    logger.info(f"[Billing] Subscription updated for tenant {tenant_id}: {current}")
+async def _set_sub(db: AsyncSession, company_id: uuid.UUID, **values: Any) -> SubscriptionState:
+    state = await subscription_service.update(db, company_id, **values)
+    logger.info(f"[Billing] Subscription updated for tenant {company_id}: {state}")
+    return state
 
 
-async def _get_or_create_stripe_customer(tenant_id: str, email: str, name: str = None) -> str:
+async def _get_or_create_stripe_customer(
+    db: AsyncSession, company_id: uuid.UUID, email: str, name: str = None
+) -> str:
     """Get or create a Stripe Customer mapped to a tenant."""
-    if tenant_id in _stripe_customers:
-        return _stripe_customers[tenant_id]
+    state = await subscription_service.get(db, company_id)
+    if state.stripe_customer_id:
+        return state.stripe_customer_id
     if not STRIPE_CONFIGURED:
         raise HTTPException(status_code=503, detail="Stripe not configured")
-    customer = stripe.Customer.create(
+    customer = await billing_gateway.create_customer(
         email=email,
         name=name or email,
-        metadata={"tenant_id": tenant_id},
+        metadata={"tenant_id": str(company_id)},
     )
-    _stripe_customers[tenant_id] = customer.id
-    return customer.id
+    # A concurrent request may have stored one first; keep whichever the table holds
+    return await subscription_service.set_customer(db, company_id, customer.id)
 
 
 # ── Endpoints ────────────────────────────────────────────────
@@ -145,40 +156,47 @@ async def list_plans():
 
 
 @router.get("/subscription", response_model=SubscriptionOut)
+@read_write  # downgrades an expired trial in place
 async def get_subscription(
-    current_user: CurrentUser = None,
     tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
 ):
-    """Get current subscription for the authenticated tenant."""
-    sub = _get_sub(str(tenant.tenant_id))
+    """Get current subscription for the authenticated tenant (served from the worker cache when warm)."""
+    sub = await subscription_service.get(db, tenant.tenant_id)
 
     # Check trial expiry
-    if sub.get("status") == "trialing" and sub.get("trial_ends_at"):
-        trial_end = datetime.fromisoformat(sub["trial_ends_at"])
-        if trial_end < datetime.now(timezone.utc):
-            _set_sub(str(tenant.tenant_id), plan_id="start", status="active", trial_ends_at=None)
-            sub = _get_sub(str(tenant.tenant_id))
+    if sub.trial_expired(datetime.now(timezone.utc)):
+        sub = await _set_sub(db, tenant.tenant_id, plan_id="start", status="active", trial_ends_at=None)
 
-    return SubscriptionOut(**sub)
+    return _sub_out(sub)
+
+
+@router.get("/usage", response_model=UsageOut)
+async def get_usage(
+    tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Plan-limited resources in use by the tenant and the limits that apply to new ones."""
+    return UsageOut(**await entitlement_service.usage(db, tenant.tenant_id))
 
 
 @router.post("/trial")
 async def start_trial(
     current_user: CurrentUser = None,
     tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
 ):
     """Start a 14-day free trial of premium features."""
-    tid = str(tenant.tenant_id)
-    current = _get_sub(tid)
-    if current.get("status") == "trialing":
+    current = await subscription_service.get(db, tenant.tenant_id)
+    if current.status == "trialing":
         raise HTTPException(status_code=400, detail="Trial already active")
-    if current.get("plan_id") not in ("start", "free"):
+    if current.plan_id not in ("start", "free"):
         raise HTTPException(status_code=400, detail="Already on a paid plan")
 
     from datetime import timedelta
-    trial_end = (datetime.now(timezone.utc) + timedelta(days=14)).isoformat()
-    _set_sub(tid, plan_id="premium", status="trialing", trial_ends_at=trial_end)
-    return {"status": "trialing", "trial_ends_at": trial_end}
+    trial_end = datetime.now(timezone.utc) + timedelta(days=14)
+    await _set_sub(db, tenant.tenant_id, plan_id="premium", status="trialing", trial_ends_at=trial_end)
+    return {"status": "trialing", "trial_ends_at": trial_end.isoformat()}
 
 
 @router.post("/checkout", response_model=CheckoutResponse)
@@ -186,6 +204,7 @@ async def create_checkout(
     payload: CheckoutRequest,
     current_user: CurrentUser = None,
     tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a Stripe Checkout Session for plan upgrade."""
     if not STRIPE_CONFIGURED:
@@ -197,12 +216,12 @@ async def create_checkout(
 
     tid = str(tenant.tenant_id)
     customer_id = await _get_or_create_stripe_customer(
-        tid, current_user.email,
+        db, tenant.tenant_id, current_user.email,
         current_user.full_name,
     )
 
     try:
-        session = stripe.checkout.Session.create(
+        session = await billing_gateway.create_checkout_session(
             mode="subscription",
             customer=customer_id,
             payment_method_types=["card"],
@@ -216,6 +235,8 @@ async def create_checkout(
             metadata={"tenant_id": tid, "plan_id": payload.plan_id},
         )
         return CheckoutResponse(session_id=session.id)
+    except BillingUnavailable:
+        raise
     except Exception as e:
         logger.error(f"[Billing] Checkout error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -226,6 +247,7 @@ async def create_subscription(
     payload: CreateSubscriptionRequest,
     current_user: CurrentUser = None,
     tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Create a Stripe subscription directly using a PaymentMethod ID.
@@ -240,23 +262,23 @@ async def create_subscription(
 
     tid = str(tenant.tenant_id)
     customer_id = await _get_or_create_stripe_customer(
-        tid, current_user.email, current_user.full_name,
+        db, tenant.tenant_id, current_user.email, current_user.full_name,
     )
 
     try:
         # Attach the payment method to the customer
-        stripe.PaymentMethod.attach(payload.payment_method_id, customer=customer_id)
+        await billing_gateway.attach_payment_method(payload.payment_method_id, customer=customer_id)
         # Set as default payment method
-        stripe.Customer.modify(
+        await billing_gateway.update_customer(
             customer_id,
             invoice_settings={"default_payment_method": payload.payment_method_id},
         )
 
         # Create the subscription
-        subscription = stripe.Subscription.create(
+        subscription = await billing_gateway.create_subscription(
             customer=customer_id,
             items=[{"price": price_id}],
-            expand=["latest_invoice.payment_intent"],
+            expand=["latest_invoice.confirmation_secret"],
             metadata={"tenant_id": tid, "plan_id": payload.plan_id},
         )
 
@@ -265,15 +287,20 @@ async def create_subscription(
 
         if sub_status == "active":
             # Payment succeeded immediately
-            _set_sub(tid, plan_id=payload.plan_id, status="active", trial_ends_at=None)
+            await _set_sub(
+                db, tenant.tenant_id, plan_id=payload.plan_id, status="active", trial_ends_at=None,
+                stripe_subscription_id=subscription.id,
+            )
         elif sub_status == "incomplete":
-            # Requires additional authentication (3D Secure / SCA)
-            payment_intent = subscription.latest_invoice.payment_intent
-            if payment_intent and payment_intent.status == "requires_action":
-                client_secret = payment_intent.client_secret
+            # Requires additional authentication (3D Secure / SCA): the client confirms the first
+            # invoice's payment with its confirmation secret (Invoice.payment_intent is gone since
+            # API version 2025-03-31.basil)
+            confirmation = getattr(subscription.latest_invoice, "confirmation_secret", None)
+            if confirmation and confirmation.client_secret:
+                client_secret = confirmation.client_secret
             else:
                 # Other incomplete reason
-                logger.warning(f"[Billing] Subscription incomplete for tenant {tid}: {payment_intent}")
+                logger.warning(f"[Billing] Subscription incomplete for tenant {tid}: {subscription.latest_invoice}")
 
         return CreateSubscriptionResponse(
             subscription_id=subscription.id,
@@ -283,6 +310,8 @@ async def create_subscription(
 
     except stripe.error.CardError as e:
         raise HTTPException(status_code=400, detail=f"Card error: {e.user_message}")
+    except BillingUnavailable:
+        raise
     except Exception as e:
         logger.error(f"[Billing] Create subscription error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -292,17 +321,17 @@ async def create_subscription(
 async def create_portal(
     current_user: CurrentUser = None,
     tenant: CurrentTenant = None,
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a Stripe Customer Portal session for managing billing."""
     if not STRIPE_CONFIGURED:
         raise HTTPException(status_code=503, detail="Stripe is not configured")
 
-    tid = str(tenant.tenant_id)
-    customer_id = _stripe_customers.get(tid)
+    customer_id = (await subscription_service.get(db, tenant.tenant_id)).stripe_customer_id
     if not customer_id:
         raise HTTPException(status_code=400, detail="No billing account found. Subscribe to a plan first.")
 
-    session = stripe.billing_portal.Session.create(
+    session = await billing_gateway.create_portal_session(
         customer=customer_id,
         return_url=os.getenv("FRONTEND_URL", "http://localhost:5173") + "/plans",
     )
@@ -310,9 +339,10 @@ async def create_portal(
 
 
 @router.post("/webhook")
-async def stripe_webhook(request: Request):
+async def stripe_webhook(request: Request, db: AsyncSession = Depends(get_db)):
     """
-    Stripe webhook handler — processes subscription lifecycle events.
+    Stripe webhook handler — verifies the signature, queues the event and acknowledges.
+    The inbox processor (app/services/stripe_inbox.py) applies it in the background.
     """
     if not STRIPE_CONFIGURED:
         raise HTTPException(status_code=503, detail="Stripe is not configured")
@@ -327,40 +357,8 @@ async def stripe_webhook(request: Request):
     except stripe.error.SignatureVerificationError:
         raise HTTPException(status_code=400, detail="Invalid signature")
 
-    event_type = event["type"]
-    data = event["data"]["object"]
-    logger.info(f"[Billing] Webhook: {event_type}")
-
-    if event_type == "checkout.session.completed":
-        tenant_id = data.get("metadata", {}).get("tenant_id")
-        plan_id = data.get("metadata", {}).get("plan_id")
-        if tenant_id and plan_id:
-            _set_sub(tenant_id, plan_id=plan_id, status="active", trial_ends_at=None)
-            logger.info(f"[Billing] Tenant {tenant_id} upgraded to {plan_id}")
-
-    elif event_type == "customer.subscription.updated":
-        tenant_id = data.get("metadata", {}).get("tenant_id")
-        status = data.get("status", "active")
-        cancel_at = data.get("cancel_at_period_end", False)
-        period_end = data.get("current_period_end")
-        period_end_iso = datetime.fromtimestamp(period_end, tz=timezone.utc).isoformat() if period_end else None
-        if tenant_id:
-            _set_sub(tenant_id, status=status, cancel_at_period_end=cancel_at, current_period_end=period_end_iso)
-
-    elif event_type == "customer.subscription.deleted":
-        tenant_id = data.get("metadata", {}).get("tenant_id")
-        if tenant_id:
-            _set_sub(tenant_id, plan_id="start", status="active", cancel_at_period_end=False,
-                     current_period_end=None, trial_ends_at=None)
-            logger.info(f"[Billing] Tenant {tenant_id} downgraded to start (subscription deleted)")
-
-    elif event_type == "invoice.payment_failed":
-        customer_id = data.get("customer")
-        # Find tenant by customer_id
-        for tid, cid in _stripe_customers.items():
-            if cid == customer_id:
-                _set_sub(tid, status="past_due")
-                logger.warning(f"[Billing] Tenant {tid} payment failed — marked past_due")
-                break
-
-    return {"status": "ok"}
+    # Verified above; queue the plain JSON rather than the SDK object
+    queued = await stripe_event_service.receive(db, json.loads(payload))
+    logger.info(f"[Billing] Webhook: {event['type']} {event['id']} {'queued' if queued else 'duplicate'}")
+
+    return {"status": "ok", "outcome": "queued" if queued else "duplicate"}
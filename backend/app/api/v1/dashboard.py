@@ -0,0 +1,21 @@
+"""Dashboard: per-company counts by status, read from trigger-maintained tenant_stats."""
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import CompanyId, get_db
+from app.schemas.dashboard import DashboardSummary
+from app.services.tenant_stats import tenant_stats_service
+
+router = APIRouter()
+
+
+@router.get("/summary", response_model=DashboardSummary)
+async def dashboard_summary(
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Projects, users, assets, audits and RFQs of the current company: total and count per status.
+    One statement over the company's tenant_stats rows and pending deltas, however many rows it has.
+    """
+    return DashboardSummary.model_validate(await tenant_stats_service.summary(db, company_id))
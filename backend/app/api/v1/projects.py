@@ -2,47 +2,81 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.api.deps import CompanyId, CurrentUser, get_db
+from app.api.deps import CompanyId, CurrentPrincipal, get_db, get_read_sessionmaker, parse_cursor
 from app.core.multitenant import assert_same_company
+from app.repositories.pagination import CountMode
+from app.repositories.search import SearchMode
 from app.schemas.common import PaginatedResponse
-from app.schemas.project import ProjectCreate, ProjectRead, ProjectUpdate
+from app.schemas.project import ProjectCreate, ProjectListItem, ProjectRead, ProjectUpdate
+from app.services.export import ExportFormat
 from app.services.project import project_service
 
 router = APIRouter()
 
 
-@router.get("", response_model=PaginatedResponse[ProjectRead])
+@router.get("", response_model=PaginatedResponse[ProjectListItem])
 async def list_projects(
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     status: str | None = Query(None, description="Filter by status (e.g. draft, active)"),
-    search: str | None = Query(None, alias="q", description="Search by name or code"),
-    current_user: CurrentUser = None,
+    search: str | None = Query(None, alias="q", description="Search by name or code (fulltext also covers description)"),
+    search_mode: SearchMode = Query(
+        SearchMode.CONTAINS,
+        description="contains (substring), fuzzy (typo tolerant, ranked) or fulltext (words, ranked)",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="Cursor mode: send empty for the first page, then each response's next_cursor",
+    ),
+    count: CountMode = Query(CountMode.EXACT, description="true (exact), false (skip), or estimate"),
     company_id: CompanyId = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
     List projects for the current company. Bubble-friendly: results, count, page, per_page.
+    Passing cursor switches from OFFSET paging to keyset paging on (created_at, id).
+    Ranked search modes order by relevance and return rank/highlight per row.
     """
-    skip = (page - 1) * per_page
-    items = await project_service.list(
-        db, company_id, skip=skip, limit=per_page, status=status, search=search
+    after = parse_cursor(cursor, ranked=bool(search and search.strip()) and search_mode.ranked)
+    result = await project_service.page(
+        db,
+        company_id,
+        skip=(page - 1) * per_page,
+        limit=per_page,
+        status=status,
+        search=search,
+        search_mode=search_mode,
+        keyset=cursor is not None,
+        after=after,
+        count=count,
     )
-    total = await project_service.count(db, company_id, status=status, search=search)
-    return PaginatedResponse(
-        results=[ProjectRead.model_validate(p) for p in items],
-        count=total,
-        page=page,
-        per_page=per_page,
+    return PaginatedResponse.from_page(result, ProjectListItem, page, per_page)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_projects(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson (one object per line) or csv"),
+    status: str | None = Query(None, description="Filter by status (e.g. draft, active)"),
+    search: str | None = Query(None, alias="q", description="Search by name or code (fulltext also covers description)"),
+    search_mode: SearchMode = Query(SearchMode.CONTAINS, description="contains, fuzzy or fulltext"),
+    company_id: CompanyId = None,
+    read_sessionmaker: async_sessionmaker[AsyncSession] = Depends(get_read_sessionmaker),
+):
+    """Every project matching the list filters, newest first, streamed from a server-side cursor."""
+    body = project_service.export(read_sessionmaker, company_id, format, status=status, search=search, search_mode=search_mode)
+    return StreamingResponse(
+        body,
+        media_type=format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="projects.{format.value}"'},
     )
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
 async def get_project(
     project_id: uuid.UUID,
-    current_user: CurrentUser = None,
     company_id: CompanyId = None,
     db: AsyncSession = Depends(get_db),
 ):
@@ -57,7 +91,7 @@ async def get_project(
 @router.post("", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
 async def create_project(
     data: ProjectCreate,
-    current_user: CurrentUser = None,
+    current_user: CurrentPrincipal = None,
     company_id: CompanyId = None,
     db: AsyncSession = Depends(get_db),
 ):
@@ -80,7 +114,6 @@ async def create_project(
 async def update_project(
     project_id: uuid.UUID,
     data: ProjectUpdate,
-    current_user: CurrentUser = None,
     company_id: CompanyId = None,
     db: AsyncSession = Depends(get_db),
 ):
@@ -97,7 +130,6 @@ async def update_project(
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: uuid.UUID,
-    current_user: CurrentUser = None,
     company_id: CompanyId = None,
     db: AsyncSession = Depends(get_db),
 ):
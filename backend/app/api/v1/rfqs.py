@@ -0,0 +1,179 @@
+"""RFQs: company-scoped CRUD; line items written in bulk with their RFQ and read page by page or streamed."""
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.deps import CompanyId, CurrentPrincipal, get_db, get_read_sessionmaker, parse_cursor
+from app.core.multitenant import assert_same_company
+from app.models.rfq import Rfq
+from app.repositories.pagination import CountMode
+from app.repositories.rfq import RfqNumberTaken
+from app.schemas.common import PaginatedResponse
+from app.schemas.rfq import RfqCreate, RfqLineItemRead, RfqRead, RfqUpdate
+from app.services.export import ExportFormat, content_disposition
+from app.services.rfq import RfqProjectNotFound, rfq_service
+
+router = APIRouter()
+
+
+async def _get_rfq(db: AsyncSession, rfq_id: uuid.UUID, company_id: uuid.UUID) -> Rfq:
+    rfq = await rfq_service.get_by_id(db, rfq_id, company_id)
+    if not rfq:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="RFQ not found")
+    assert_same_company(rfq.company_id, company_id, "RFQ")
+    return rfq
+
+
+def _write_error(e: RfqProjectNotFound | RfqNumberTaken) -> HTTPException:
+    if isinstance(e, RfqNumberTaken):
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.get("", response_model=PaginatedResponse[RfqRead])
+async def list_rfqs(
+    page: int = Query(1, ge=1, description="Page number (1-based)"),
+    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    project_id: uuid.UUID | None = Query(None, description="Filter by project id"),
+    rfq_status: str | None = Query(None, alias="status", description="Filter by status (e.g. draft, issued)"),
+    cursor: str | None = Query(
+        None,
+        description="Cursor mode: send empty for the first page, then each response's next_cursor",
+    ),
+    count: CountMode = Query(CountMode.EXACT, description="true (exact), false (skip), or estimate"),
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """List RFQs (without line items) for the current company, newest first."""
+    result = await rfq_service.page(
+        db,
+        company_id,
+        skip=(page - 1) * per_page,
+        limit=per_page,
+        project_id=project_id,
+        status=rfq_status,
+        keyset=cursor is not None,
+        after=parse_cursor(cursor),
+        count=count,
+    )
+    return PaginatedResponse.from_page(result, RfqRead, page, per_page)
+
+
+@router.get("/{rfq_id}", response_model=RfqRead)
+async def get_rfq(
+    rfq_id: uuid.UUID,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get one RFQ by id (line items via /{rfq_id}/line-items). 404 if not found or different company."""
+    return RfqRead.model_validate(await _get_rfq(db, rfq_id, company_id))
+
+
+@router.get("/{rfq_id}/line-items", response_model=PaginatedResponse[RfqLineItemRead])
+async def list_rfq_line_items(
+    rfq_id: uuid.UUID,
+    per_page: int = Query(100, ge=1, le=1000, description="Items per page"),
+    cursor: int | None = Query(None, ge=0, description="next_cursor of the previous page (a line_number)"),
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """The RFQ's line items in line_number order; follow next_cursor for more. count is not computed (null)."""
+    await _get_rfq(db, rfq_id, company_id)
+    result = await rfq_service.line_items(db, company_id, rfq_id, limit=per_page, after_line=cursor)
+    return PaginatedResponse.from_page(result, RfqLineItemRead, 1, per_page)
+
+
+@router.get("/{rfq_id}/line-items/export", response_class=StreamingResponse)
+async def export_rfq_line_items(
+    rfq_id: uuid.UUID,
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson (one object per line) or csv"),
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+    read_sessionmaker: async_sessionmaker[AsyncSession] = Depends(get_read_sessionmaker),
+):
+    """Every line item of the RFQ in line_number order, streamed from a server-side cursor."""
+    rfq = await _get_rfq(db, rfq_id, company_id)
+    body = rfq_service.export_line_items(read_sessionmaker, company_id, rfq_id, format)
+    return StreamingResponse(
+        body,
+        media_type=format.media_type,
+        headers={"Content-Disposition": content_disposition(f"rfq-{rfq.rfq_number or rfq.id}-lines.{format.value}")},
+    )
+
+
+@router.post("", response_model=RfqRead, status_code=status.HTTP_201_CREATED)
+async def create_rfq(
+    data: RfqCreate,
+    current_user: CurrentPrincipal = None,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create an RFQ with all its line items in one request (batched multi-row inserts).
+    rfq_number is allocated (rfq_number_format) unless given.
+    404 if the project is not the company's, 409 if a given rfq_number is taken.
+    """
+    try:
+        rfq = await rfq_service.create(
+            db,
+            company_id,
+            current_user.id,
+            data.model_dump(exclude={"line_items"}),
+            [item.model_dump() for item in data.line_items],
+        )
+    except (RfqProjectNotFound, RfqNumberTaken) as e:
+        raise _write_error(e)
+    return RfqRead.model_validate(rfq)
+
+
+@router.put("/{rfq_id}", response_model=RfqRead)
+async def replace_rfq(
+    rfq_id: uuid.UUID,
+    data: RfqCreate,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Replace an RFQ and its complete line item list: lines are upserted by line_number and lines
+    missing from the body are deleted. 404 if not found or different company, 409 if rfq_number is taken.
+    """
+    rfq = await _get_rfq(db, rfq_id, company_id)
+    try:
+        rfq = await rfq_service.replace(
+            db,
+            rfq,
+            company_id,
+            data.model_dump(exclude={"line_items"}),
+            [item.model_dump() for item in data.line_items],
+        )
+    except (RfqProjectNotFound, RfqNumberTaken) as e:
+        raise _write_error(e)
+    return RfqRead.model_validate(rfq)
+
+
+@router.patch("/{rfq_id}", response_model=RfqRead)
+async def update_rfq(
+    rfq_id: uuid.UUID,
+    data: RfqUpdate,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Update RFQ fields (line items unchanged). 404 if not found or different company, 409 if rfq_number is taken."""
+    rfq = await _get_rfq(db, rfq_id, company_id)
+    try:
+        rfq = await rfq_service.update(db, rfq, company_id, data.model_dump(exclude_unset=True))
+    except (RfqProjectNotFound, RfqNumberTaken) as e:
+        raise _write_error(e)
+    return RfqRead.model_validate(rfq)
+
+
+@router.delete("/{rfq_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_rfq(
+    rfq_id: uuid.UUID,
+    company_id: CompanyId = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete an RFQ and its line items. 404 if not found or different company."""
+    await rfq_service.delete(db, await _get_rfq(db, rfq_id, company_id))
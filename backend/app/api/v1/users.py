@@ -5,7 +5,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import CurrentUser, CurrentTenant, RequireAdmin
+from app.api.deps import CurrentPrincipal, CurrentTenant, RequireAdmin
 from app.database import get_db
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from app.services.user import user_service
@@ -44,7 +44,7 @@ async def create_user(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: uuid.UUID,
-    current_user: CurrentUser = None,
+    current_user: CurrentPrincipal = None,
     tenant: CurrentTenant = None,
     db: AsyncSession = Depends(get_db),
 ):
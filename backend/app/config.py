@@ -24,6 +24,54 @@ class Settings(BaseSettings):
         description="PostgreSQL async URL",
     )
     database_echo: bool = Field(default=False, description="Echo SQL for debugging")
+    # Connection pool, per worker process: workers x (pool_size + max_overflow) must fit max_connections
+    db_pool_size: int = Field(default=10, description="Connections kept open per worker")
+    db_max_overflow: int = Field(default=10, description="Extra connections opened under load, closed when returned")
+    db_pool_timeout_seconds: float = Field(
+        default=5.0,
+        description="Max wait for a free connection before the request fails (SQLAlchemy default is 30)",
+    )
+    db_pool_recycle_seconds: int = Field(
+        default=1800,
+        description="Replace connections older than this (stay under server/proxy idle timeouts); -1 disables",
+    )
+    db_pool_pre_ping: bool = Field(default=True, description="Check each connection on checkout; drops dead ones")
+    db_connect_timeout_seconds: float = Field(default=5.0, description="asyncpg connect timeout")
+    db_command_timeout_seconds: float | None = Field(
+        default=60.0,
+        description="asyncpg per-statement client timeout (None disables)",
+    )
+    db_statement_cache_size: int = Field(
+        default=100,
+        description="asyncpg prepared statement cache per connection; 0 behind PgBouncer in transaction mode",
+    )
+    db_pool_saturation_warn: float = Field(
+        default=0.8,
+        description="/health/db reports saturated when checked-out / (pool_size + max_overflow) reaches this",
+    )
+    db_health_timeout_seconds: float = Field(default=2.0, description="/health/db gives up on checkout + SELECT 1 after this")
+    # Optional streaming replica for read-only requests (get_db); unset = everything on the primary
+    database_replica_url: str | None = Field(default=None, description="PostgreSQL async URL of a read replica")
+    replica_max_lag_seconds: float = Field(default=5.0, description="Route reads to the primary while replay lag exceeds this")
+    replica_lag_check_interval_seconds: float = Field(default=2.0, description="How often each worker re-measures replica lag")
+    read_your_writes_seconds: float = Field(
+        default=5.0,
+        description="After a request writes, its client's reads stay on the primary this long (marker cookie/header)",
+    )
+    list_count_exact_below: int = Field(
+        default=10_000,
+        description="count=estimate falls back to an exact count when the planner expects fewer rows",
+    )
+
+    # Request instrumentation
+    server_timing_enabled: bool = Field(
+        default=True,
+        description="Emit Server-Timing (app/db time, statement count) on every response",
+    )
+    slow_request_db_ms: float = Field(
+        default=500.0,
+        description="Log request DB stats at WARNING when total DB time exceeds this",
+    )
 
     # JWT
     jwt_secret_key: str = Field(
@@ -33,6 +81,108 @@ class Settings(BaseSettings):
     jwt_algorithm: str = Field(default="HS256", description="JWT algorithm")
     jwt_access_expire_minutes: int = Field(default=60, description="Access token TTL")
     jwt_refresh_expire_days: int = Field(default=7, description="Refresh token TTL")
+    jwt_verified_cache_size: int = Field(
+        default=10_000,
+        description="Max already-verified tokens remembered per worker (0 disables)",
+    )
+    jwt_verified_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="Upper bound on how long a verified token is trusted without re-checking (never past exp)",
+    )
+
+    # Password hashing (bcrypt on a dedicated thread pool)
+    password_bcrypt_rounds: int = Field(
+        default=12,
+        description="bcrypt cost; existing hashes are re-hashed on next successful login when it changes",
+    )
+    password_hash_workers: int = Field(default=4, description="Threads dedicated to password hashing per worker")
+    password_hash_max_queue: int = Field(
+        default=32,
+        description="Hash jobs allowed to wait for a thread; beyond this requests get 503 (load shedding)",
+    )
+
+    # Authenticated principal resolution
+    auth_principal_cache_ttl_seconds: float = Field(
+        default=30.0,
+        description=(
+            "How long a resolved principal (user id, company, role, active) is reused per worker. "
+            "Commits evict entries only in the worker that wrote; other workers keep a deactivated "
+            "user or company's old slug for up to this long"
+        ),
+    )
+    auth_principal_cache_size: int = Field(default=10_000, description="Max cached principals per worker")
+    auth_claims_only_company_id: bool = Field(
+        default=False,
+        description="CompanyId trusts verified JWT claims without a DB/cache lookup (revocation lag = token TTL)",
+    )
+
+    # Billing state cache (invalidated across workers via LISTEN/NOTIFY)
+    billing_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="Upper bound on how long a worker trusts a cached subscription if a notification is lost",
+    )
+    billing_cache_size: int = Field(default=10_000, description="Max cached subscriptions per worker")
+    # Stripe webhook inbox: the endpoint only queues events, a per-worker background processor applies them
+    stripe_inbox_enabled: bool = Field(default=True, description="Run the inbox processor in this process")
+    stripe_inbox_batch_size: int = Field(default=20, description="Events claimed per pass (FOR UPDATE SKIP LOCKED)")
+    stripe_inbox_poll_seconds: float = Field(
+        default=5.0,
+        description="Max idle time between passes; NOTIFY wakes processors sooner",
+    )
+    stripe_inbox_max_attempts: int = Field(default=10, description="Failed attempts before an event is marked failed")
+    stripe_inbox_retry_base_seconds: float = Field(default=5.0, description="Backoff after the first failure, doubled per attempt")
+    stripe_inbox_retry_max_seconds: float = Field(default=3600.0, description="Upper bound on the retry backoff")
+    # Stripe API calls (app/services/billing_gateway.py): async, pooled, bounded, circuit-broken
+    stripe_api_base: str | None = Field(
+        default=None,
+        description="Override Stripe's API URL, e.g. a local fake server for tests and benchmarks",
+    )
+    stripe_timeout_seconds: float = Field(default=10.0, description="Upper bound on one Stripe call, retries included")
+    stripe_connect_timeout_seconds: float = Field(default=3.0, description="TCP/TLS connect timeout to Stripe")
+    stripe_max_connections: int = Field(default=20, description="Stripe calls in flight, and so pooled HTTP connections, per worker")
+    stripe_max_network_retries: int = Field(
+        default=1,
+        description="SDK retries on connection errors/409/429/5xx (idempotency keys make POSTs safe to retry)",
+    )
+    stripe_breaker_failures: int = Field(default=5, description="Consecutive failures that open the circuit")
+    stripe_breaker_reset_seconds: float = Field(default=30.0, description="Fail fast this long before a trial call")
+
+    # Bulk import (POST /assets/import): streamed, validated and inserted in batches
+    import_batch_rows: int = Field(default=1000, description="Rows validated and inserted per batch (one multi-row INSERT)")
+    import_max_reported_errors: int = Field(
+        default=1000,
+        description="Row errors listed in the import report; further failures are only counted",
+    )
+    import_max_line_bytes: int = Field(
+        default=1_000_000,
+        description="Reject an import with a line (or quoted CSV record) over this many UTF-8 bytes",
+    )
+    # Streaming export (GET /assets/export, /projects/export): server-side cursor, one chunk per batch
+    export_batch_rows: int = Field(default=1000, description="Rows fetched from the cursor and written per chunk")
+    # RFQ line items (POST/PUT /rfqs): written as batched multi-row upserts on (rfq_id, line_number)
+    rfq_line_item_batch_rows: int = Field(
+        default=1000,
+        description="Line items per multi-row INSERT ... ON CONFLICT DO UPDATE (sent in pages of at most 1000)",
+    )
+    # RFQ numbers (app/services/rfq_numbers.py): allocated when a create omits rfq_number
+    rfq_number_format: str = Field(
+        default="RFQ-{year}-{seq:06d}",
+        description="str.format template with {seq} and optional {year}; a yearly format restarts at 1 each year",
+    )
+    rfq_number_block_size: int = Field(
+        default=20,
+        description="Numbers each worker reserves per sequence UPDATE; larger = fewer round trips, bigger gaps",
+    )
+
+    # Row counts by status (tenant_stats): triggers append deltas, a per-worker job folds and recounts them
+    tenant_stats_worker_enabled: bool = Field(default=True, description="Run the tenant_stats worker in this process")
+    tenant_stats_compact_seconds: float = Field(default=5.0, description="Idle time between delta compactions")
+    tenant_stats_compact_batch_rows: int = Field(default=10_000, description="Delta rows folded per statement")
+    tenant_stats_reconcile_seconds: float = Field(
+        default=3600.0,
+        description="Time between recount passes over the next tenant_stats_reconcile_batch_size companies",
+    )
+    tenant_stats_reconcile_batch_size: int = Field(default=100, description="Companies recounted per pass")
 
     # CORS (Bubble, FlutterFlow, local)
     cors_origins: List[str] = Field(
@@ -0,0 +1,58 @@
+"""
+Circuit breaker for calls to an external service.
+
+After failure_threshold consecutive failures the circuit opens and callers fail fast instead of
+each waiting out a timeout against a service that is down. Once reset_seconds have passed one
+trial call is let through (half-open): success closes the circuit, failure opens it again.
+Only used from the event loop thread, so no locking.
+"""
+import time
+from typing import Callable
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_started_at: float | None = None
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self._clock() - self._opened_at >= self.reset_seconds else "open"
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; False means fail fast."""
+        state = self.state
+        if state == "closed":
+            return True
+        now = self._clock()
+        # One trial at a time; a trial that never reported back (cancelled) stops counting after reset_seconds
+        if state == "half_open" and (self._trial_started_at is None or now - self._trial_started_at >= self.reset_seconds):
+            self._trial_started_at = now
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+            self._trial_started_at = None
+
+    def status(self) -> dict[str, object]:
+        return {"state": self.state, "consecutive_failures": self._failures, "rejected": self.rejected}
@@ -14,3 +14,26 @@ async def http_exception_handler(request: Request, exc: Exception) -> JSONRespon
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error"},
     )
+
+
+async def password_hashing_busy_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Load shedding: hashing pool saturated (login/register/user create). Client should retry."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
+async def billing_unavailable_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Stripe unreachable, timing out or circuit open (BillingUnavailable). Client should retry."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Billing provider unavailable, please retry"},
+        headers={"Retry-After": "5"},
+    )
+
+
+async def entitlement_exceeded_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Plan limit reached on create (EntitlementExceeded): 403, or 402 while payment is lapsed."""
+    return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail()})
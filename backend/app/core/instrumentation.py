@@ -0,0 +1,172 @@
+"""Per-request SQL instrumentation (statement count, DB time, slowest statement), latency histograms
+and connection pool telemetry.
+
+Engine cursor events record into the QueryStats bound to the current context.
+track_queries() opens a scope (one per HTTP request in middleware, or per test block);
+scopes nest, and every statement is counted in the innermost scope and all its parents.
+"""
+import bisect
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+_SLOWEST_SQL_MAX_CHARS = 200
+
+
+@dataclass
+class QueryStats:
+    """Aggregated DB activity for one scope (usually one request)."""
+    statements: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_sql: str | None = None
+    parent: "QueryStats | None" = field(default=None, repr=False)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        stats: QueryStats | None = self
+        while stats is not None:
+            stats.statements += 1
+            stats.total_ms += elapsed_ms
+            if elapsed_ms > stats.slowest_ms:
+                stats.slowest_ms = elapsed_ms
+                stats.slowest_sql = statement[:_SLOWEST_SQL_MAX_CHARS]
+            stats = stats.parent
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    """Innermost active scope, or None outside track_queries()."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Record every statement executed in this context (and tasks spawned from it)."""
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    started = conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def _handle_error(exception_context: Any) -> None:
+    """Failed statements never reach after_cursor_execute; drop their start time."""
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """Attach cursor timing hooks to a (sync) engine; safe to call more than once."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def server_timing_header(stats: QueryStats, app_ms: float) -> str:
+    """Server-Timing value: total app time plus DB time and statement count."""
+    return f'app;dur={app_ms:.1f}, db;dur={stats.total_ms:.1f};desc="{stats.statements} queries"'
+
+
+DEFAULT_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (per worker), exported as cumulative counts like Prometheus."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS) -> None:
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._counts = [0] * (len(self.buckets_ms) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self._counts[bisect.bisect_left(self.buckets_ms, value_ms)] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        cumulative: dict[str, int] = {}
+        running = 0
+        for bound, n in zip((*self.buckets_ms, float("inf")), self._counts):
+            running += n
+            cumulative["+Inf" if bound == float("inf") else f"{bound:g}"] = running
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": cumulative,
+        }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records how long each checkout took and how many timed out.
+    Numbers are per worker process; pass as poolclass= to create_async_engine.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkout_wait = Histogram()
+        self.checkout_timeouts = 0
+
+    def connect(self) -> Any:
+        # Wait for a free slot plus, when one is opened or pre-pinged, connection setup
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            self.checkout_wait.observe((time.perf_counter() - started) * 1000)
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        # engine.dispose() swaps in a fresh pool; keep the worker's history
+        pool = super().recreate()
+        pool.checkout_wait = self.checkout_wait
+        pool.checkout_timeouts = self.checkout_timeouts
+        return pool
+
+    def stats(self, saturation_warn: float = 1.0) -> dict[str, Any]:
+        """Gauges (in use, idle, overflow, saturation) plus the checkout wait histogram."""
+        capacity = self.size() + self._max_overflow if self._max_overflow >= 0 else None
+        in_use = self.checkedout()
+        saturation = in_use / capacity if capacity else None
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "in_use": in_use,
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "saturation": round(saturation, 3) if saturation is not None else None,
+            "saturated": saturation is not None and saturation >= saturation_warn,
+            "checkout_timeouts": self.checkout_timeouts,
+            "checkout_wait_ms": self.checkout_wait.snapshot(),
+        }
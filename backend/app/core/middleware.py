@@ -0,0 +1,187 @@
+"""
+Pure ASGI middleware: security headers, auth context, read-your-writes marker and per-request DB timing.
+
+Written against the raw ASGI interface instead of @app.middleware("http") so each request
+avoids BaseHTTPMiddleware's extra task and stream wrapping, and streaming responses pass
+through unbuffered. State is written to scope["state"], which backs request.state.
+"""
+import logging
+import math
+import time
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+from app.core.instrumentation import QueryStats, server_timing_header, track_queries
+from app.core.read_routing import (
+    READ_YOUR_WRITES_COOKIE,
+    READ_YOUR_WRITES_HEADER,
+    SESSION_WROTE,
+    read_your_writes_until,
+)
+from app.core.security import decode_token
+
+settings = get_settings()
+logger = logging.getLogger("app.request")
+
+# OWASP-recommended headers; HSTS is handled by reverse proxy (Vercel, Nginx) in production
+SECURITY_HEADERS: dict[str, str] = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "camera=(), microphone=(), geolocation=()",
+    "Cache-Control": "no-store",  # API responses not cached
+}
+
+
+def _state(scope: Scope) -> dict[str, Any]:
+    return scope.setdefault("state", {})
+
+
+class SecurityHeadersMiddleware:
+    """Add SECURITY_HEADERS to every HTTP response, replacing any the app already set."""
+
+    def __init__(self, app: ASGIApp, headers: dict[str, str] | None = None) -> None:
+        self.app = app
+        raw = headers if headers is not None else SECURITY_HEADERS
+        # Encoded once at startup; per request we only filter and extend the header list
+        self._headers = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in raw.items()]
+        self._names = {k for k, _ in self._headers}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [h for h in message.get("headers", []) if h[0].lower() not in self._names]
+                headers.extend(self._headers)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class AuthContextMiddleware:
+    """Verify the Bearer JWT once and set request.state.auth_* for user/company context (logging, audit)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = None
+        payload = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value.decode("latin-1")
+                if auth_header.startswith("Bearer "):
+                    token = auth_header[7:].strip()
+                    payload = decode_token(token)
+                break
+        state = _state(scope)
+        # Dependencies (deps.get_token_claims) reuse this payload instead of verifying again
+        state["auth_token"] = token
+        state["auth_payload"] = payload
+        state["auth_user_id"] = payload.get("sub") if payload else None
+        state["auth_tenant_id"] = payload.get("tenant_id") if payload else None
+        await self.app(scope, receive, send)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Set the read-your-writes cookie and header (app/core/read_routing.py) on a successful response
+    whose get_db session wrote. Decided when the headers go out, which may be before get_db
+    commits; a commit that fails after that only sends the client's reads to the primary briefly.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._max_age = math.ceil(settings.read_your_writes_seconds)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_marker(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                session = _state(scope).get("db_session")
+                if session is not None and session.info.get(SESSION_WROTE):
+                    until = read_your_writes_until()
+                    cookie = f"{READ_YOUR_WRITES_COOKIE}={until}; Max-Age={self._max_age}; Path=/; HttpOnly; SameSite=Lax"
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"set-cookie", cookie.encode("latin-1")),
+                        (READ_YOUR_WRITES_HEADER.lower().encode("latin-1"), until.encode("latin-1")),
+                    ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_marker)
+
+
+class RequestTimingMiddleware:
+    """Count SQL statements and DB time per request; expose as request.state.db_stats and Server-Timing."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status_code = 500
+
+        with track_queries() as stats:
+            _state(scope)["db_stats"] = stats
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if settings.server_timing_enabled:
+                        # Measured when headers go out; streamed bodies are covered by the log line
+                        app_ms = (time.perf_counter() - started) * 1000
+                        message["headers"] = [
+                            *message.get("headers", []),
+                            (b"server-timing", server_timing_header(stats, app_ms).encode("latin-1")),
+                        ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, status_code, (time.perf_counter() - started) * 1000, stats)
+
+    @staticmethod
+    def _log(scope: Scope, status_code: int, app_ms: float, stats: QueryStats) -> None:
+        method = scope["method"]
+        path = scope["path"]
+        level = logging.WARNING if stats.total_ms > settings.slow_request_db_ms else logging.INFO
+        logger.log(
+            level,
+            "request method=%s path=%s status=%s app_ms=%.1f db_statements=%d db_ms=%.1f db_slowest_ms=%.1f",
+            method,
+            path,
+            status_code,
+            app_ms,
+            stats.statements,
+            stats.total_ms,
+            stats.slowest_ms,
+            extra={
+                "http_method": method,
+                "http_path": path,
+                "http_status": status_code,
+                "app_ms": round(app_ms, 1),
+                "db_statements": stats.statements,
+                "db_ms": round(stats.total_ms, 1),
+                "db_slowest_ms": round(stats.slowest_ms, 1),
+                "db_slowest_sql": stats.slowest_sql,
+            },
+        )
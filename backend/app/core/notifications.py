@@ -0,0 +1,116 @@
+"""
+Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+Writers call pg_notify(channel, key) inside their transaction; Postgres delivers it to every
+listening worker when that transaction commits and drops it on rollback. Each worker holds one
+dedicated asyncpg connection (outside the pool) for LISTEN. Notifications sent while it is down
+are lost, so every subscriber's resync callback runs whenever the connection is lost or
+re-established, and caches should only be trusted while `connected` is true.
+LISTEN needs a session-mode connection: it does not work through PgBouncer in transaction mode.
+"""
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _Subscriber:
+    on_notify: Callable[[str], None]
+    on_resync: Callable[[], None]
+
+
+class PgListener:
+    def __init__(self, database_url: str, keepalive_seconds: float = 30.0, max_backoff_seconds: float = 30.0) -> None:
+        # asyncpg wants a plain postgresql:// DSN, not the SQLAlchemy driver URL
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.keepalive_seconds = keepalive_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.connected = False
+        self._subscribers: dict[str, list[_Subscriber]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._ready = asyncio.Event()
+
+    def subscribe(self, channel: str, on_notify: Callable[[str], None], on_resync: Callable[[], None]) -> None:
+        """Register callbacks before start(); both run on the event loop and must not block."""
+        self._subscribers.setdefault(channel, []).append(_Subscriber(on_notify, on_resync))
+
+    async def start(self, wait_seconds: float | None = None) -> None:
+        """Start listening in the background; optionally wait up to wait_seconds for the first connection."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="pg-listener")
+        if wait_seconds:
+            try:
+                await asyncio.wait_for(self._ready.wait(), wait_seconds)
+            except TimeoutError:
+                logger.warning("LISTEN connection not up after %.1fs; caches stay bypassed until it is", wait_seconds)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _dispatch(self, connection: object, pid: int, channel: str, payload: str) -> None:
+        for subscriber in self._subscribers.get(channel, ()):
+            try:
+                subscriber.on_notify(payload)
+            except Exception:
+                logger.exception("notification handler failed on channel %s", channel)
+
+    def _resync(self) -> None:
+        for subscribers in self._subscribers.values():
+            for subscriber in subscribers:
+                subscriber.on_resync()
+
+    async def _listen_once(self) -> None:
+        conn = await asyncpg.connect(self.dsn, timeout=settings.db_connect_timeout_seconds)
+        closed = asyncio.Event()
+        conn.add_termination_listener(lambda _: closed.set())
+        try:
+            for channel in self._subscribers:
+                await conn.add_listener(channel, self._dispatch)
+            self.connected = True
+            self._resync()  # anything cached before this point may have missed a notification
+            self._ready.set()
+            while not closed.is_set():
+                try:
+                    await asyncio.wait_for(closed.wait(), self.keepalive_seconds)
+                except TimeoutError:
+                    # A silently dropped TCP connection never fires the termination listener
+                    await conn.execute("SELECT 1", timeout=settings.db_health_timeout_seconds)
+        finally:
+            if self.connected:
+                self.connected = False
+                self._resync()
+            self._ready.clear()
+            if not conn.is_closed():
+                conn.terminate()
+
+    async def _run(self) -> None:
+        backoff = 0.5
+        while True:
+            try:
+                await self._listen_once()
+                backoff = 0.5
+                logger.warning("LISTEN connection closed; reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # keep the worker serving; caches are bypassed while disconnected
+                logger.warning("LISTEN connection failed (%s); retrying in %.1fs", type(e).__name__, backoff)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff_seconds)
+
+
+notification_listener = PgListener(settings.database_url)
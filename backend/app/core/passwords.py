@@ -0,0 +1,118 @@
+"""
+Non-blocking password hashing: bcrypt runs on a dedicated, bounded thread pool.
+
+bcrypt at cost 12 takes 100+ ms of CPU; calling it inline in an async handler stalls the
+event loop for every other request on the worker. PasswordHasher moves the work to its
+own executor (bcrypt releases the GIL), caps outstanding jobs, and sheds load with
+PasswordHashingBusy once workers and queue are full instead of letting latency grow unbounded.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from passlib.context import CryptContext
+
+from app.config import get_settings
+from app.core.instrumentation import Histogram
+from app.core.security import pwd_context
+
+settings = get_settings()
+T = TypeVar("T")
+
+
+class PasswordHashingBusy(Exception):
+    """All hashing workers are busy and the wait queue is full; retry later (HTTP 503)."""
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        context: CryptContext,
+        max_workers: int,
+        max_queue: int,
+    ) -> None:
+        self.context = context
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._outstanding = 0
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.queue_wait = Histogram()
+        self.duration = Histogram()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pwd-hash")
+        return self._executor
+
+    def _release(self, _job: Future[Any]) -> None:
+        with self._lock:
+            self._outstanding -= 1
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self._outstanding >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordHashingBusy("Password hashing capacity exhausted")
+            self._outstanding += 1
+        submitted = time.perf_counter()
+
+        def timed() -> tuple[T, float, float]:
+            started = time.perf_counter()
+            return fn(*args), started, time.perf_counter()
+
+        # Released when the job ends (on the worker thread), not when the caller stops waiting:
+        # a cancelled request leaves its bcrypt job running, and it still takes capacity.
+        try:
+            job = self._get_executor().submit(timed)
+        except Exception:  # e.g. RuntimeError once the pool is shut down: no job will release the slot
+            with self._lock:
+                self._outstanding -= 1
+            raise
+        job.add_done_callback(self._release)
+        result, started, finished = await asyncio.wrap_future(job)
+        # Observed on the event loop thread, so histograms need no locking
+        self.queue_wait.observe((started - submitted) * 1000)
+        self.duration.observe((finished - started) * 1000)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self.context.verify, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """
+        Verify and, if the stored hash uses an outdated scheme or cost, return a fresh hash
+        to persist (None otherwise). Lets PASSWORD_BCRYPT_ROUNDS changes roll out on login.
+        """
+        return await self._run(self.context.verify_and_update, password, hashed_password)
+
+    def metrics(self) -> dict[str, Any]:
+        """This worker's hashing load, as reported by /health/db."""
+        with self._lock:
+            outstanding, rejected = self._outstanding, self.rejected
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "outstanding": outstanding,
+            "rejected": rejected,
+            "queue_wait_ms": self.queue_wait.snapshot(),
+            "duration_ms": self.duration.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    pwd_context,
+    max_workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+)
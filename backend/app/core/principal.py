@@ -0,0 +1,94 @@
+"""Authenticated principal: the slim identity most endpoints need, cached per (sub, tenant_id)."""
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.core.cache import TTLCache
+from app.models.company import Company
+
+if TYPE_CHECKING:
+    from app.models.user import User
+
+settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Who is calling: enough for tenant scoping and RBAC without an ORM User."""
+    id: uuid.UUID
+    company_id: uuid.UUID
+    role: str
+    is_active: bool
+    tenant_slug: str | None = None
+
+    @classmethod
+    def from_user(cls, user: "User") -> "Principal":
+        """Build from a User loaded with the AUTH profile (company + role)."""
+        return cls(
+            id=user.id,
+            company_id=user.company_id,
+            role=user.role.code if user.role is not None else "user",
+            is_active=user.is_active,
+            tenant_slug=user.company.slug if user.company is not None else None,
+        )
+
+
+# Key: (sub, tenant_id) exactly as they appear in the JWT.
+principal_cache: TTLCache[tuple[str, str], Principal] = TTLCache(
+    maxsize=settings.auth_principal_cache_size,
+    ttl=settings.auth_principal_cache_ttl_seconds,
+)
+
+
+# session.info keys: cache entries to drop once the session's transaction commits
+_PENDING_USERS = "principal_invalidations"
+_PENDING_COMPANIES = "principal_company_invalidations"
+
+
+def invalidate_principal(session: AsyncSession, user_id: uuid.UUID, company_id: uuid.UUID) -> None:
+    """
+    Call after a user's active flag, role or company data changes. The entry is dropped when
+    session commits: dropping it earlier would let a concurrent request cache the old row again.
+    """
+    session.info.setdefault(_PENDING_USERS, set()).add((str(user_id), str(company_id)))
+
+
+def invalidate_company_principals(session: AsyncSession, company_id: uuid.UUID) -> None:
+    """
+    Call after company-wide changes (slug, deactivation); every user of the company, on commit.
+    Flushed ORM changes to Company.slug / Company.is_active and Company deletes do this themselves.
+    """
+    session.info.setdefault(_PENDING_COMPANIES, set()).add(str(company_id))
+
+
+@event.listens_for(Session, "before_flush")
+def _queue_company_changes(session: Session, flush_context: object, instances: object) -> None:
+    # Bulk UPDATE/DELETE statements on companies bypass this and must invalidate explicitly
+    for company in session.dirty:
+        if isinstance(company, Company) and (
+            inspect(company).attrs.slug.history.has_changes()
+            or inspect(company).attrs.is_active.history.has_changes()
+        ):
+            invalidate_company_principals(session, company.id)
+    for company in session.deleted:
+        if isinstance(company, Company):
+            invalidate_company_principals(session, company.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for key in session.info.pop(_PENDING_USERS, ()):
+        principal_cache.pop(key)
+    for tid in session.info.pop(_PENDING_COMPANIES, ()):
+        principal_cache.pop_where(lambda key, _: key[1] == tid)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_USERS, None)
+    session.info.pop(_PENDING_COMPANIES, None)
@@ -0,0 +1,99 @@
+"""
+Read routing: send GET traffic to a streaming replica unless it lags or the client just wrote.
+
+ReplicaLagMonitor measures replay lag at most once per check interval (per worker) and
+reports the replica unusable while lag exceeds the limit or the check fails. A response to a
+request that wrote carries a read-your-writes marker (cookie and header, see
+ReadYourWritesMiddleware): the time until which that client's reads go to the primary so it
+sees its own changes. The client carries the marker, so whichever worker serves its next read
+honours it; clients that do not keep cookies echo the header instead.
+"""
+import asyncio
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.requests import Request
+
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Zero when the replica has replayed everything it received (an idle primary sends nothing,
+# so now() - last replay timestamp alone would grow without real lag); 0 on a non-standby.
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class ReplicaLagMonitor:
+    def __init__(self, engine: AsyncEngine, max_lag_seconds: float, check_interval_seconds: float) -> None:
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.lag_seconds: float | None = None  # None: never checked or last check failed
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    def _stale(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.check_interval_seconds
+
+    async def _check(self) -> None:
+        try:
+            async with asyncio.timeout(settings.db_health_timeout_seconds):
+                async with self.engine.connect() as conn:
+                    lag = (await conn.execute(REPLICA_LAG_SQL)).scalar()
+            self.lag_seconds = float(lag or 0)
+        except Exception as e:  # an unreachable replica just means "read from the primary"
+            if self.lag_seconds is not None:
+                logger.warning("replica lag check failed, routing reads to primary: %s", type(e).__name__)
+            self.lag_seconds = None
+        self._checked_at = time.monotonic()
+
+    async def usable(self) -> bool:
+        """True when the last check (refreshed if older than the interval) saw lag within the limit."""
+        if self._stale():
+            async with self._lock:
+                if self._stale():  # concurrent callers wait for one check instead of each running their own
+                    await self._check()
+        return self.lag_seconds is not None and self.lag_seconds <= self.max_lag_seconds
+
+    def status(self) -> dict[str, float | bool | None]:
+        return {
+            "lag_seconds": None if self.lag_seconds is None else round(self.lag_seconds, 3),
+            "max_lag_seconds": self.max_lag_seconds,
+            "usable": self.lag_seconds is not None and self.lag_seconds <= self.max_lag_seconds,
+        }
+
+
+# Read-your-writes marker: unix time until which the client reads from the primary
+READ_YOUR_WRITES_COOKIE = "read_your_writes_until"
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes-Until"
+# session.info key, set once a session flushed changes or executed an INSERT/UPDATE/DELETE
+SESSION_WROTE = "wrote"
+# session.info key on replica sessions: they may not have replayed commits other workers were notified of
+SESSION_ON_REPLICA = "on_replica"
+
+
+def read_your_writes_until(now: float | None = None) -> str:
+    return f"{(time.time() if now is None else now) + settings.read_your_writes_seconds:.3f}"
+
+
+def client_wrote_recently(request: Request) -> bool:
+    """True while the marker the client sent back (header first, then cookie) has not expired."""
+    value = request.headers.get(READ_YOUR_WRITES_HEADER) or request.cookies.get(READ_YOUR_WRITES_COOKIE)
+    try:
+        until = float(value) if value else 0.0
+    except ValueError:
+        return False
+    now = time.time()
+    # Never further ahead than one window: a forged marker cannot pin a client to the primary for long
+    return now < until <= now + settings.read_your_writes_seconds
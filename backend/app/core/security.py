@@ -1,4 +1,6 @@
 """JWT creation/validation and password hashing."""
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -6,16 +8,26 @@ import jwt
 from passlib.context import CryptContext
 
 from app.config import get_settings
+from app.core.cache import TTLCache
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.password_bcrypt_rounds)
+
+# sha256(token) -> verified payload. The digest covers the signature, so a hit means these exact
+# bytes already passed verification with our key; entries never outlive the token's exp.
+_verified_tokens: TTLCache[bytes, dict[str, Any]] = TTLCache(
+    maxsize=settings.jwt_verified_cache_size,
+    ttl=settings.jwt_verified_cache_ttl_seconds,
+)
 
 
 def get_password_hash(password: str) -> str:
+    """Blocking bcrypt hash; in request handlers use app.core.passwords.password_hasher instead."""
     return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Blocking bcrypt verify; in request handlers use app.core.passwords.password_hasher instead."""
     return pwd_context.verify(plain_password, hashed_password)
 
 
@@ -48,17 +60,24 @@ def create_access_token(
 def decode_token(token: str) -> dict[str, Any] | None:
     """
     Decode and validate JWT; return payload or None if invalid/expired.
-    Validates signature, exp, and algorithm.
+    Validates signature, exp, and algorithm. Repeat calls with the same token are served
+    from the verified-token cache; treat the returned payload as read-only.
     """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(
             token,
             settings.jwt_secret_key,
             algorithms=[settings.jwt_algorithm],
         )
-        return payload
     except jwt.PyJWTError:
         return None
+    exp = payload.get("exp")
+    _verified_tokens.set(key, payload, ttl=exp - time.time() if exp is not None else None)
+    return payload
 
 
 def validate_access_token(token: str) -> dict[str, Any]:
@@ -1,31 +1,160 @@
-"""Async SQLAlchemy engine and session factory."""
-from collections.abc import AsyncGenerator
+"""Async SQLAlchemy engines (primary, optional read replica) and session dependencies."""
+import asyncio
+import os
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from app.config import get_settings
+from app.core.instrumentation import InstrumentedAsyncQueuePool, install_query_instrumentation
+from app.core.read_routing import SESSION_ON_REPLICA, SESSION_WROTE, ReplicaLagMonitor, client_wrote_recently
 from app.models import Base  # noqa: F401 - imports all models so they register with Base.metadata
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.database_echo,
-    future=True,
-)
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+F = TypeVar("F", bound=Callable[..., Any])
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency: yield a DB session per request."""
+def _create_engine(url: str) -> AsyncEngine:
+    db_engine = create_async_engine(
+        url,
+        echo=settings.database_echo,
+        future=True,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            "timeout": settings.db_connect_timeout_seconds,
+            "command_timeout": settings.db_command_timeout_seconds,
+            # asyncpg's own cache and SQLAlchemy's adapter cache; both must be 0 behind PgBouncer
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        },
+    )
+    install_query_instrumentation(db_engine.sync_engine)
+    return db_engine
+
+
+def _sessionmaker(db_engine: AsyncEngine, info: dict[str, Any] | None = None) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        db_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+        info=info,
+    )
+
+
+engine = _create_engine(settings.database_url)
+AsyncSessionLocal = _sessionmaker(engine)
+# Same pool; transactions open as BEGIN READ ONLY, so a stray write fails instead of committing
+ReadOnlySessionLocal = _sessionmaker(engine.execution_options(postgresql_readonly=True))
+
+# Optional read replica (DATABASE_REPLICA_URL); read-only requests fall back to the primary without it
+replica_engine: AsyncEngine | None = None
+ReplicaSessionLocal: async_sessionmaker[AsyncSession] | None = None
+replica_monitor: ReplicaLagMonitor | None = None
+if settings.database_replica_url:
+    replica_engine = _create_engine(settings.database_replica_url)
+    ReplicaSessionLocal = _sessionmaker(
+        replica_engine.execution_options(postgresql_readonly=True), info={SESSION_ON_REPLICA: True}
+    )
+    replica_monitor = ReplicaLagMonitor(
+        replica_engine,
+        max_lag_seconds=settings.replica_max_lag_seconds,
+        check_interval_seconds=settings.replica_lag_check_interval_seconds,
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _flushed(session: Session, flush_context: Any) -> None:
+    """Only runs when the flush had pending changes; an empty flush returns before it."""
+    session.info[SESSION_WROTE] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _executed(state: ORMExecuteState) -> None:
+    """Bulk insert()/update()/delete() statements bypass the flush."""
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[SESSION_WROTE] = True
+
+
+@asynccontextmanager
+async def primary_reads(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    session itself, or a short READ ONLY primary session when session is on the replica. For
+    lookups that fill a per-worker cache: entries are dropped when the primary commits, and a
+    lagging replica read right after that would cache the old row again for a full TTL.
+    """
+    if not session.info.get(SESSION_ON_REPLICA):
+        yield session
+        return
+    async with ReadOnlySessionLocal() as primary:
+        yield primary
+
+
+def read_write(endpoint: F) -> F:
+    """Route flag: a GET/HEAD handler that writes gets a committed primary session from get_db."""
+    endpoint.db_read_write = True  # type: ignore[attr-defined]
+    return endpoint
+
+
+def is_read_only_request(request: Request) -> bool:
+    """GET/HEAD/OPTIONS, unless the matched route is flagged with @read_write."""
+    return request.method in READ_METHODS and not getattr(request.scope.get("endpoint"), "db_read_write", False)
+
+
+async def read_sessionmaker(wrote_recently: bool = False) -> tuple[async_sessionmaker[AsyncSession], str]:
+    """Replica factory when configured, caught up and the client has not just written; else the primary."""
+    if ReplicaSessionLocal is None or replica_monitor is None or wrote_recently:
+        return ReadOnlySessionLocal, "primary"
+    if not await replica_monitor.usable():
+        return ReadOnlySessionLocal, "primary"
+    return ReplicaSessionLocal, "replica"
+
+
+async def get_read_sessionmaker(request: Request) -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency for StreamingResponse bodies: the factory get_db uses for read-only requests
+    (replica or primary). The body opens its own session with it when it is iterated, because
+    whether get_db's session is still open while a response streams depends on the FastAPI
+    version (closed first before 0.118).
+    """
+    factory, target = await read_sessionmaker(client_wrote_recently(request))
+    request.state.db_target = target
+    return factory
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency: one DB session per request, shared by auth dependencies and the route.
+
+    Read-only requests (see is_read_only_request) get a READ ONLY transaction on the replica
+    or primary that is never committed; closing the session ends it. Everything else gets a
+    primary session committed at the end; ReadYourWritesMiddleware checks it for writes, so
+    only a request that actually wrote pins its client's reads to the primary (a @read_write
+    poll that found nothing to change does not).
+    """
+    if is_read_only_request(request):
+        factory, target = await read_sessionmaker(client_wrote_recently(request))
+        request.state.db_target = target
+        async with factory() as session:
+            yield session
+        return
     async with AsyncSessionLocal() as session:
+        request.state.db_session = session
         try:
             yield session
             await session.commit()
@@ -40,3 +169,27 @@ async def init_db() -> None:
     """Create tables (use Alembic in production)."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def check_db(db_engine: AsyncEngine = engine) -> dict[str, Any]:
+    """
+    Readiness: check out a connection and run SELECT 1 within db_health_timeout_seconds.
+    Pool gauges are reported alongside; saturation alone does not make the database unready.
+    """
+    pool = db_engine.pool
+    report: dict[str, Any] = {"worker_pid": os.getpid()}
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(settings.db_health_timeout_seconds):
+            async with db_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        report["status"] = "ok"
+        report["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    except Exception as e:  # any failure means "not ready"; the probe itself must not raise
+        report["status"] = "unavailable"
+        report["error"] = type(e).__name__
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        report["pool"] = pool.stats(settings.db_pool_saturation_warn)
+    else:
+        report["pool"] = {"class": type(pool).__name__, "status": pool.status()}
+    return report
@@ -1,15 +1,33 @@
 """FastAPI application entry: multi-tenant B2B API."""
 import os
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import api_router
 from app.config import get_settings
-from app.core.security import decode_token
-from app.database import init_db
+from app.core.exceptions import (
+    billing_unavailable_handler,
+    entitlement_exceeded_handler,
+    password_hashing_busy_handler,
+)
+from app.core.middleware import (
+    AuthContextMiddleware,
+    ReadYourWritesMiddleware,
+    RequestTimingMiddleware,
+    SecurityHeadersMiddleware,
+)
+from app.core.notifications import notification_listener
+from app.core.passwords import PasswordHashingBusy, password_hasher
+from app.core.read_routing import READ_YOUR_WRITES_HEADER
+from app.database import check_db, engine, init_db, replica_engine, replica_monitor
+from app.services.billing_gateway import BillingUnavailable, billing_gateway
+from app.services.entitlements import EntitlementExceeded
+from app.services.stripe_inbox import stripe_inbox
+from app.services.tenant_stats import tenant_stats_worker
 
 settings = get_settings()
 
@@ -36,11 +54,26 @@ if SENTRY_DSN:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Startup: optional DB init (use Alembic in production)."""
+    """
+    Startup: optional DB init (use Alembic in production); LISTEN for cross-worker cache
+    invalidation; the Stripe webhook inbox processor; the tenant_stats worker.
+    """
     # await init_db()  # Uncomment to create tables on startup; prefer Alembic
+    await notification_listener.start()
+    if settings.stripe_inbox_enabled:
+        stripe_inbox.start()
+    if settings.tenant_stats_worker_enabled:
+        tenant_stats_worker.start()
     yield
-    # Shutdown: close pools etc. if needed
-    pass
+    # Shutdown: close pools etc.
+    await tenant_stats_worker.stop()
+    await stripe_inbox.stop()
+    await notification_listener.stop()
+    await billing_gateway.close()
+    password_hasher.shutdown()
+    await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
 
 
 app = FastAPI(
@@ -59,44 +92,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[READ_YOUR_WRITES_HEADER],  # clients without cookies echo it on their next reads
 )
 
 
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next: Any):
-    """Add OWASP-recommended security headers to all responses."""
-    response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-    response.headers["Cache-Control"] = "no-store"  # API responses not cached
-    # HSTS is handled by reverse proxy (Vercel, Nginx) in production
-    return response
-
-
-@app.middleware("http")
-async def add_auth_context(request: Request, call_next: Any):
-    """Extract JWT and set request.state.auth_* for user/company context (logging, audit)."""
-    auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
-        request.state.auth_user_id = None
-        request.state.auth_tenant_id = None
-        request.state.auth_payload = None
-    else:
-        token = auth_header[7:].strip()
-        payload = decode_token(token)
-        if not payload:
-            request.state.auth_user_id = None
-            request.state.auth_tenant_id = None
-            request.state.auth_payload = None
-        else:
-            request.state.auth_user_id = payload.get("sub")
-            request.state.auth_tenant_id = payload.get("tenant_id")
-            request.state.auth_payload = payload
-    return await call_next(request)
+app.add_exception_handler(PasswordHashingBusy, password_hashing_busy_handler)
+app.add_exception_handler(BillingUnavailable, billing_unavailable_handler)
+app.add_exception_handler(EntitlementExceeded, entitlement_exceeded_handler)
 
+# Pure ASGI middleware; the last one added runs outermost
+app.add_middleware(SecurityHeadersMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(AuthContextMiddleware)
+app.add_middleware(RequestTimingMiddleware)
 
 app.include_router(api_router, prefix="/api/v1")
 
@@ -104,3 +112,17 @@ app.include_router(api_router, prefix="/api/v1")
 @app.get("/health")
 async def health():
     return {"status": "ok"}
+
+
+@app.get("/health/db")
+async def health_db():
+    """
+    Readiness: 200 when a primary connection can be checked out and queried, 503 otherwise.
+    Includes this worker's pool and password hashing stats; replica problems are reported but
+    only reroute reads.
+    """
+    report = await check_db()
+    report["password_hashing"] = password_hasher.metrics()
+    if replica_engine is not None and replica_monitor is not None:
+        report["replica"] = {**await check_db(replica_engine), **replica_monitor.status()}
+    return JSONResponse(report, status_code=200 if report["status"] == "ok" else 503)
@@ -1,4 +1,4 @@
-"""SQLAlchemy models - match PostgreSQL schema (companies, roles, users, projects, assets, audits, rfqs)."""
+"""SQLAlchemy models - match PostgreSQL schema (companies, roles, users, projects, assets, audits, rfqs, subscriptions, stripe_events, tenant_stats, tenant_stat_deltas, rfq_number_sequences)."""
 from app.models.base import Base, TimestampMixin, UUIDMixin
 from app.models.company import Company
 from app.models.role import Role
@@ -7,6 +7,10 @@ from app.models.project import Project
 from app.models.asset import Asset
 from app.models.audit import Audit
 from app.models.rfq import Rfq, RfqLineItem
+from app.models.rfq_number_sequence import RfqNumberSequence
+from app.models.subscription import Subscription
+from app.models.stripe_event import StripeEvent
+from app.models.tenant_stats import TenantStatDelta, TenantStats
 
 __all__ = [
     "Base",
@@ -20,4 +24,9 @@ __all__ = [
     "Audit",
     "Rfq",
     "RfqLineItem",
+    "RfqNumberSequence",
+    "Subscription",
+    "StripeEvent",
+    "TenantStats",
+    "TenantStatDelta",
 ]
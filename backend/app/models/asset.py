@@ -1,8 +1,8 @@
 """Asset (equipment / machines) model - maps to assets table."""
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import String, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
+from sqlalchemy import Column, Computed, ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID as PG_UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -34,10 +34,33 @@ class Asset(Base, UUIDMixin, TimestampMixin):
     location: Mapped[str | None] = mapped_column(String(255), nullable=True)
     status: Mapped[str] = mapped_column(String(32), default="active", nullable=False)
     metadata_: Mapped[dict[str, Any] | None] = mapped_column("metadata", JSONB, nullable=True)
+    company: Mapped["Company"] = relationship("Company", back_populates="assets", lazy="raise")
+    project: Mapped["Project | None"] = relationship("Project", back_populates="assets", lazy="raise")
+    audits: Mapped[list["Audit"]] = relationship(
+        "Audit",
+        back_populates="asset",
+        lazy="raise",
+        passive_deletes=True,
+    )
 
-    company: Mapped["Company"] = relationship("Company", back_populates="assets", lazy="selectin")
-    project: Mapped["Project | None"] = relationship("Project", back_populates="assets", lazy="selectin")
-    audits: Mapped[list["Audit"]] = relationship("Audit", back_populates="asset", lazy="selectin")
+    __table_args__ = (
+        # Full-text search document: table-only, queried as __table__.c.search_vector in WHERE/ORDER BY
+        Column(
+            "search_vector",
+            TSVECTOR,
+            Computed(
+                "to_tsvector('simple'::regconfig, coalesce(name, '') || ' ' || "
+                "coalesce(serial_number, '') || ' ' || coalesce(asset_type, ''))",
+                persisted=True,
+            ),
+        ),
+        # Keyset pagination: newest-first listings seek on (created_at, id) within a company.
+        # pg_trgm GIN indexes on name/serial_number/asset_type exist only in migration 003 (extension needed).
+        Index("ix_assets_company_created_id", "company_id", "created_at", "id"),
+        Index("ix_assets_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    # search_vector stays unmapped: INSERT/UPDATE ... RETURNING brings back only the timestamps
+    __mapper_args__ = {**Base.__mapper_args__, "exclude_properties": ["search_vector"]}
 
     def __repr__(self) -> str:
         return f"<Asset {self.name}>"
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import String, ForeignKey, DateTime
+from sqlalchemy import String, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -47,14 +47,21 @@ class Audit(Base, UUIDMixin, TimestampMixin):
     )
     findings: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
 
-    company: Mapped["Company"] = relationship("Company", back_populates="audits", lazy="selectin")
-    project: Mapped["Project | None"] = relationship("Project", back_populates="audits", lazy="selectin")
-    asset: Mapped["Asset | None"] = relationship("Asset", back_populates="audits", lazy="selectin")
+    company: Mapped["Company"] = relationship("Company", back_populates="audits", lazy="raise")
+    project: Mapped["Project | None"] = relationship("Project", back_populates="audits", lazy="raise")
+    asset: Mapped["Asset | None"] = relationship("Asset", back_populates="audits", lazy="raise")
     auditor: Mapped["User | None"] = relationship(
         "User",
         foreign_keys=[auditor_id],
         back_populates="audits_conducted",
-        lazy="selectin",
+        lazy="raise",
+    )
+
+    # Newest-first listings and calendar ranges seek within a company on (column, id)
+    __table_args__ = (
+        Index("ix_audits_company_created_id", "company_id", "created_at", "id"),
+        Index("ix_audits_company_scheduled_id", "company_id", "scheduled_at", "id"),
+        Index("ix_audits_company_completed_id", "company_id", "completed_at", "id"),
     )
 
     def __repr__(self) -> str:
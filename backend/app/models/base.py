@@ -8,8 +8,17 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class Base(DeclarativeBase):
-    """Declarative base for all models."""
-    pass
+    """
+    Declarative base for all models.
+    Relationships are declared lazy="raise"; repositories load what they need explicitly
+    via app.repositories.load_profiles.
+
+    eager_defaults: server-generated values (created_at, updated_at) come back in the flush itself
+    via INSERT/UPDATE ... RETURNING, so objects are complete after flush() without a refresh()
+    round trip. Every mapped server-generated column is returned; keep large ones (tsvectors)
+    unmapped. Subclasses that set __mapper_args__ must merge these in.
+    """
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class TimestampMixin:
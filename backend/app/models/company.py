@@ -22,12 +22,42 @@ class Company(Base, UUIDMixin, TimestampMixin):
     slug: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    roles: Mapped[list["Role"]] = relationship("Role", back_populates="company", lazy="selectin")
-    users: Mapped[list["User"]] = relationship("User", back_populates="company", lazy="selectin")
-    projects: Mapped[list["Project"]] = relationship("Project", back_populates="company", lazy="selectin")
-    assets: Mapped[list["Asset"]] = relationship("Asset", back_populates="company", lazy="selectin")
-    audits: Mapped[list["Audit"]] = relationship("Audit", back_populates="company", lazy="selectin")
-    rfqs: Mapped[list["Rfq"]] = relationship("Rfq", back_populates="company", lazy="selectin")
+    roles: Mapped[list["Role"]] = relationship(
+        "Role",
+        back_populates="company",
+        lazy="raise",
+        passive_deletes=True,
+    )
+    users: Mapped[list["User"]] = relationship(
+        "User",
+        back_populates="company",
+        lazy="raise",
+        passive_deletes=True,
+    )
+    projects: Mapped[list["Project"]] = relationship(
+        "Project",
+        back_populates="company",
+        lazy="raise",
+        passive_deletes=True,
+    )
+    assets: Mapped[list["Asset"]] = relationship(
+        "Asset",
+        back_populates="company",
+        lazy="raise",
+        passive_deletes=True,
+    )
+    audits: Mapped[list["Audit"]] = relationship(
+        "Audit",
+        back_populates="company",
+        lazy="raise",
+        passive_deletes=True,
+    )
+    rfqs: Mapped[list["Rfq"]] = relationship(
+        "Rfq",
+        back_populates="company",
+        lazy="raise",
+        passive_deletes=True,
+    )
 
     def __repr__(self) -> str:
         return f"<Company {self.slug}>"
@@ -2,8 +2,8 @@
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Text, Date, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import Column, Computed, Date, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -36,17 +36,50 @@ class Project(Base, UUIDMixin, TimestampMixin):
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
     )
-
-    company: Mapped["Company"] = relationship("Company", back_populates="projects", lazy="selectin")
+    company: Mapped["Company"] = relationship("Company", back_populates="projects", lazy="raise")
     created_by_user: Mapped["User | None"] = relationship(
         "User",
         foreign_keys=[created_by],
         back_populates="projects_created",
-        lazy="selectin",
+        lazy="raise",
+    )
+    assets: Mapped[list["Asset"]] = relationship(
+        "Asset",
+        back_populates="project",
+        lazy="raise",
+        passive_deletes=True,
+    )
+    audits: Mapped[list["Audit"]] = relationship(
+        "Audit",
+        back_populates="project",
+        lazy="raise",
+        passive_deletes=True,
+    )
+    rfqs: Mapped[list["Rfq"]] = relationship(
+        "Rfq",
+        back_populates="project",
+        lazy="raise",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # Full-text search document: table-only, queried as __table__.c.search_vector in WHERE/ORDER BY
+        Column(
+            "search_vector",
+            TSVECTOR,
+            Computed(
+                "to_tsvector('simple'::regconfig, coalesce(name, '') || ' ' || "
+                "coalesce(code, '') || ' ' || coalesce(description, ''))",
+                persisted=True,
+            ),
+        ),
+        # Keyset pagination: newest-first listings seek on (created_at, id) within a company.
+        # pg_trgm GIN indexes on name/code exist only in migration 003 (extension needed).
+        Index("ix_projects_company_created_id", "company_id", "created_at", "id"),
+        Index("ix_projects_search_vector", "search_vector", postgresql_using="gin"),
     )
-    assets: Mapped[list["Asset"]] = relationship("Asset", back_populates="project", lazy="selectin")
-    audits: Mapped[list["Audit"]] = relationship("Audit", back_populates="project", lazy="selectin")
-    rfqs: Mapped[list["Rfq"]] = relationship("Rfq", back_populates="project", lazy="selectin")
+    # search_vector stays unmapped: INSERT/UPDATE ... RETURNING brings back only the timestamps
+    __mapper_args__ = {**Base.__mapper_args__, "exclude_properties": ["search_vector"]}
 
     def __repr__(self) -> str:
         return f"<Project {self.name}>"
@@ -42,18 +42,19 @@ class Rfq(Base, UUIDMixin, TimestampMixin):
         nullable=True,
     )
 
-    company: Mapped["Company"] = relationship("Company", back_populates="rfqs", lazy="selectin")
-    project: Mapped["Project | None"] = relationship("Project", back_populates="rfqs", lazy="selectin")
+    company: Mapped["Company"] = relationship("Company", back_populates="rfqs", lazy="raise")
+    project: Mapped["Project | None"] = relationship("Project", back_populates="rfqs", lazy="raise")
     created_by_user: Mapped["User | None"] = relationship(
         "User",
         foreign_keys=[created_by],
         back_populates="rfqs_created",
-        lazy="selectin",
+        lazy="raise",
     )
     line_items: Mapped[list["RfqLineItem"]] = relationship(
         "RfqLineItem",
         back_populates="rfq",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
         cascade="all, delete-orphan",
     )
 
@@ -83,7 +84,7 @@ class RfqLineItem(Base, UUIDMixin, TimestampMixin):
     quantity: Mapped[Decimal | None] = mapped_column(Numeric(18, 4), nullable=True)
     unit: Mapped[str | None] = mapped_column(String(32), nullable=True)
 
-    rfq: Mapped["Rfq"] = relationship("Rfq", back_populates="line_items", lazy="selectin")
+    rfq: Mapped["Rfq"] = relationship("Rfq", back_populates="line_items", lazy="raise")
 
     __table_args__ = (UniqueConstraint("rfq_id", "line_number", name="uq_rfq_line_items_rfq_line"),)
 
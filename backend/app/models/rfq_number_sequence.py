@@ -0,0 +1,32 @@
+"""RfqNumberSequence model - maps to rfq_number_sequences table (per-company RFQ number counters)."""
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class RfqNumberSequence(Base):
+    """
+    next_value is the first number not yet handed to any worker. Workers reserve blocks of numbers
+    in short transactions of their own (app/services/rfq_numbers.py), so the row is locked for one
+    UPDATE per block, never for the length of a request. period is the year for yearly formats, else 0.
+    """
+
+    __tablename__ = "rfq_number_sequences"
+
+    company_id: Mapped[PG_UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    period: Mapped[int] = mapped_column(Integer, primary_key=True)
+    next_value: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<RfqNumberSequence {self.company_id} {self.period} next={self.next_value}>"
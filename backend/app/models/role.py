@@ -25,8 +25,13 @@ class Role(Base, UUIDMixin, TimestampMixin):
     code: Mapped[str] = mapped_column(String(32), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    company: Mapped["Company"] = relationship("Company", back_populates="roles", lazy="selectin")
-    users: Mapped[list["User"]] = relationship("User", back_populates="role", lazy="selectin")
+    company: Mapped["Company"] = relationship("Company", back_populates="roles", lazy="raise")
+    users: Mapped[list["User"]] = relationship(
+        "User",
+        back_populates="role",
+        lazy="raise",
+        passive_deletes=True,
+    )
 
     __table_args__ = (UniqueConstraint("company_id", "code", name="uq_roles_company_code"),)
 
@@ -0,0 +1,47 @@
+"""StripeEvent model - maps to stripe_events table (webhook inbox and log, keyed by Stripe's event id)."""
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class StripeEvent(Base):
+    __tablename__ = "stripe_events"
+    __table_args__ = (
+        # Per-tenant event history in Stripe's order
+        Index("ix_stripe_events_company_created", "company_id", "stripe_created_at"),
+        # Inbox: only unprocessed rows, in the order the processor claims them
+        Index(
+            "ix_stripe_events_pending",
+            "next_attempt_at",
+            postgresql_where=text("processed_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(String(255), primary_key=True)  # evt_..., unique per event
+    type: Mapped[str] = mapped_column(String(128), nullable=False)
+    company_id: Mapped[PG_UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("companies.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    stripe_created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    received_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    # Inbox state: processed_at stays NULL until the processor applies (or gives up on) the event
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # applied | stale (older than the tenant's last applied event) | ignored (unhandled type or unknown tenant)
+    # | failed (gave up after stripe_inbox_max_attempts)
+    outcome: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<StripeEvent {self.id} {self.type}>"
@@ -0,0 +1,33 @@
+"""Subscription model - maps to subscriptions table (one billing state row per company)."""
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin, UUIDMixin
+
+
+class Subscription(Base, UUIDMixin, TimestampMixin):
+    __tablename__ = "subscriptions"
+
+    company_id: Mapped[PG_UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+    )
+    plan_id: Mapped[str] = mapped_column(String(32), default="start", nullable=False)
+    status: Mapped[str] = mapped_column(String(32), default="active", nullable=False)
+    current_period_end: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    cancel_at_period_end: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    trial_ends_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    stripe_customer_id: Mapped[str | None] = mapped_column(String(255), unique=True, nullable=True)
+    stripe_subscription_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Stripe `created` of the newest webhook event applied to each column group (see
+    # EVENT_COLUMN_GROUPS in app/repositories/subscription.py); older deliveries do not overwrite it
+    plan_event_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    status_event_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<Subscription {self.company_id} {self.plan_id} {self.status}>"
@@ -1,6 +1,6 @@
 """Tenant (company) model."""
 from sqlalchemy import String
-from sqlalchemy.orm import Mapped, relationship, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
 
@@ -11,5 +11,3 @@ class Tenant(Base, UUIDMixin, TimestampMixin):
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     slug: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
-
-    users: Mapped[list["User"]] = relationship("User", back_populates="tenant", lazy="selectin")
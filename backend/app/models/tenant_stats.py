@@ -0,0 +1,111 @@
+"""TenantStats / TenantStatDelta models - per-company row counts by status (dashboards, plan limits)."""
+from typing import Any
+
+from sqlalchemy import DDL, BigInteger, ForeignKey, Identity, Index, String, event
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+# Counted tables -> the SQL expression that is their status (users have an active flag instead)
+TRACKED_TABLES = {
+    "projects": "status",
+    "users": "CASE WHEN is_active THEN 'active' ELSE 'inactive' END",
+    "assets": "status",
+    "audits": "status",
+    "rfqs": "status",
+}
+
+# Statement-level trigger: one delta row per company and status per statement, however many rows
+# the statement touched. It only INSERTs, so concurrent writes of a tenant never wait on each
+# other; UPDATEs that keep every status net to zero write nothing.
+TRACK_FUNCTION = """
+CREATE OR REPLACE FUNCTION tenant_stats_track_{table}() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO tenant_stat_deltas (company_id, entity, status, n)
+        SELECT company_id, '{table}', {status}, count(*) FROM new_rows GROUP BY 1, 3;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO tenant_stat_deltas (company_id, entity, status, n)
+        SELECT company_id, '{table}', {status}, -count(*) FROM old_rows GROUP BY 1, 3;
+    ELSE
+        INSERT INTO tenant_stat_deltas (company_id, entity, status, n)
+        SELECT company_id, '{table}', status, sum(n)
+        FROM (
+            SELECT company_id, {status} AS status, 1 AS n FROM new_rows
+            UNION ALL
+            SELECT company_id, {status}, -1 FROM old_rows
+        ) changed
+        GROUP BY 1, 3
+        HAVING sum(n) <> 0;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def _tracking(table: str, status: str) -> list[str]:
+    function = f"tenant_stats_track_{table}()"
+    return [
+        TRACK_FUNCTION.format(table=table, status=status),
+        f"CREATE OR REPLACE TRIGGER {table}_tenant_stats_insert AFTER INSERT ON {table} "
+        f"REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION {function}",
+        f"CREATE OR REPLACE TRIGGER {table}_tenant_stats_update AFTER UPDATE ON {table} "
+        f"REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION {function}",
+        f"CREATE OR REPLACE TRIGGER {table}_tenant_stats_delete AFTER DELETE ON {table} "
+        f"REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION {function}",
+    ]
+
+
+# Same DDL as alembic/versions/010_tenant_stats.py, for databases built with create_all
+TRACKING_DDL = [statement for table, status in TRACKED_TABLES.items() for statement in _tracking(table, status)]
+
+
+class TenantStats(Base):
+    """
+    Compacted counts: n rows of entity (a tracked table) with status, as of the last compaction.
+    Only the tenant_stats worker (app/services/tenant_stats.py) writes here; the current count is
+    n plus the pending tenant_stat_deltas rows of the same key.
+    """
+
+    __tablename__ = "tenant_stats"
+
+    company_id: Mapped[PG_UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    entity: Mapped[str] = mapped_column(String(32), primary_key=True)
+    status: Mapped[str] = mapped_column(String(32), primary_key=True)
+    n: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<TenantStats {self.company_id} {self.entity}.{self.status}={self.n}>"
+
+
+class TenantStatDelta(Base):
+    """
+    Append-only changes written by the tracking triggers in the transaction of the write, so a
+    rollback discards them. No foreign key: rows of a deleted company are dropped on compaction.
+    """
+
+    __tablename__ = "tenant_stat_deltas"
+    __table_args__ = (Index("ix_tenant_stat_deltas_company", "company_id"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    company_id: Mapped[PG_UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    entity: Mapped[str] = mapped_column(String(32), nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    n: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<TenantStatDelta {self.company_id} {self.entity}.{self.status}{self.n:+d}>"
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_tracking(target: Any, connection: Any, **kw: Any) -> None:
+    """After create_all: the trigger functions need tenant_stat_deltas and the tracked tables to exist."""
+    for statement in TRACKING_DDL:
+        connection.execute(DDL(statement))
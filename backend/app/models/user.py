@@ -44,25 +44,28 @@ class User(Base, UUIDMixin, TimestampMixin):
     full_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    company: Mapped["Company"] = relationship("Company", back_populates="users", lazy="selectin")
-    role: Mapped["Role | None"] = relationship("Role", back_populates="users", lazy="selectin")
+    company: Mapped["Company"] = relationship("Company", back_populates="users", lazy="raise")
+    role: Mapped["Role | None"] = relationship("Role", back_populates="users", lazy="raise")
     projects_created: Mapped[list["Project"]] = relationship(
         "Project",
         foreign_keys="Project.created_by",
         back_populates="created_by_user",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
     )
     audits_conducted: Mapped[list["Audit"]] = relationship(
         "Audit",
         foreign_keys="Audit.auditor_id",
         back_populates="auditor",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
     )
     rfqs_created: Mapped[list["Rfq"]] = relationship(
         "Rfq",
         foreign_keys="Rfq.created_by",
         back_populates="created_by_user",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     __table_args__ = (UniqueConstraint("company_id", "email", name="uq_users_company_email"),)
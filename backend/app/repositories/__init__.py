@@ -1,5 +1,15 @@
 from app.repositories.company import company_repository
+from app.repositories.stripe_event import stripe_event_repository
+from app.repositories.subscription import subscription_repository
 from app.repositories.tenant import tenant_repository
+from app.repositories.tenant_stats import tenant_stats_repository
 from app.repositories.user import user_repository
 
-__all__ = ["company_repository", "tenant_repository", "user_repository"]
+__all__ = [
+    "company_repository",
+    "stripe_event_repository",
+    "subscription_repository",
+    "tenant_repository",
+    "tenant_stats_repository",
+    "user_repository",
+]
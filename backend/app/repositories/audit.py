@@ -0,0 +1,148 @@
+"""Audit repository: all queries scoped by company_id for multi-tenant isolation."""
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Any, Sequence
+
+from sqlalchemy import ColumnElement, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.audit import Audit
+from app.repositories.load_profiles import LoadProfile, load_options
+from app.repositories.pagination import CountMode, Cursor, Page, fetch_page, oldest_first, split_page
+
+
+class AuditDateField(str, Enum):
+    """Timestamp a calendar range applies to (each has a (company_id, field, id) index)."""
+    SCHEDULED = "scheduled_at"
+    COMPLETED = "completed_at"
+
+
+class AuditRepository:
+    """Every method requires company_id; never query without it."""
+
+    def _filters(
+        self,
+        company_id: uuid.UUID,
+        asset_id: uuid.UUID | None = None,
+        project_id: uuid.UUID | None = None,
+        auditor_id: uuid.UUID | None = None,
+        status: str | None = None,
+        audit_type: str | None = None,
+    ) -> list[ColumnElement[bool]]:
+        """The single definition of list filters; pages and calendar ranges both use it."""
+        where = [Audit.company_id == company_id]
+        if asset_id is not None:
+            where.append(Audit.asset_id == asset_id)
+        if project_id is not None:
+            where.append(Audit.project_id == project_id)
+        if auditor_id is not None:
+            where.append(Audit.auditor_id == auditor_id)
+        if status:
+            where.append(Audit.status == status)
+        if audit_type:
+            where.append(Audit.audit_type == audit_type)
+        return where
+
+    async def page_by_company(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        keyset: bool = False,
+        after: Cursor | None = None,
+        count: CountMode = CountMode.EXACT,
+        profile: LoadProfile = LoadProfile.LIST,
+        **filters: Any,
+    ) -> Page[Audit]:
+        """Newest first; list page and its total in one round trip (see pagination.fetch_page)."""
+        return await fetch_page(
+            session,
+            Audit,
+            self._filters(company_id, **filters),
+            load_options(Audit, profile),
+            skip=skip,
+            limit=limit,
+            keyset=keyset,
+            after=after,
+            count=count,
+        )
+
+    async def in_range(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        field: AuditDateField,
+        start: datetime,
+        end: datetime,
+        limit: int = 100,
+        after: Cursor | None = None,
+        profile: LoadProfile = LoadProfile.LIST,
+        **filters: Any,
+    ) -> Page[Audit]:
+        """
+        Audits with start <= field < end in calendar order, keyset-paged on (field, id).
+        One index range scan on (company_id, field, id); the other filters apply within it.
+        """
+        column = getattr(Audit, field.value)
+        stmt = (
+            select(Audit)
+            .where(*self._filters(company_id, **filters), column >= start, column < end)
+            .options(*load_options(Audit, profile))
+        )
+        stmt = oldest_first(stmt, column, Audit, after).limit(limit + 1)
+        items = (await session.execute(stmt)).scalars().all()
+        page: Page[Audit] = Page(items=[])
+        page.items, page.next_cursor = split_page(items, limit, key=field.value)
+        return page
+
+    async def get_by_id(
+        self,
+        session: AsyncSession,
+        audit_id: uuid.UUID,
+        company_id: uuid.UUID,
+        profile: LoadProfile = LoadProfile.DETAIL,
+    ) -> Audit | None:
+        result = await session.execute(
+            select(Audit)
+            .options(*load_options(Audit, profile))
+            .where(
+                Audit.id == audit_id,
+                Audit.company_id == company_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def create(self, session: AsyncSession, company_id: uuid.UUID, **values: Any) -> Audit:
+        audit = Audit(company_id=company_id, **values)
+        session.add(audit)
+        await session.flush()
+        return audit
+
+    async def create_many(
+        self, session: AsyncSession, company_id: uuid.UUID, rows: list[dict[str, Any]]
+    ) -> Sequence[Audit]:
+        """One multi-row INSERT ... RETURNING for the whole batch, in input order."""
+        if not rows:
+            return []
+        result = await session.execute(
+            insert(Audit).returning(Audit, sort_by_parameter_order=True),
+            [{**row, "company_id": company_id, "id": uuid.uuid4()} for row in rows],
+        )
+        return result.scalars().all()
+
+    async def update(self, session: AsyncSession, audit: Audit, **kwargs: Any) -> Audit:
+        kwargs.pop("company_id", None)
+        for key, value in kwargs.items():
+            if hasattr(audit, key):
+                setattr(audit, key, value)
+        await session.flush()
+        return audit
+
+    async def delete(self, session: AsyncSession, audit: Audit) -> None:
+        await session.delete(audit)
+        await session.flush()
+
+
+audit_repository = AuditRepository()
@@ -1,4 +1,4 @@
-"""Company repository: lookup by slug or id."""
+"""Company repository: lookup by slug or id, creation on signup."""
 import uuid
 from typing import Sequence
 
@@ -17,6 +17,12 @@ class CompanyRepository:
         result = await session.execute(select(Company).where(Company.slug == slug))
         return result.scalar_one_or_none()
 
+    async def create(self, session: AsyncSession, name: str, slug: str) -> Company:
+        company = Company(name=name, slug=slug)
+        session.add(company)
+        await session.flush()
+        return company
+
     async def list_all(
         self,
         session: AsyncSession,
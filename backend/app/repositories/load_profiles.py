@@ -0,0 +1,63 @@
+"""Named eager-load profiles: which relationships a repository query loads for each endpoint shape.
+
+All model relationships are declared lazy="raise", so nothing is loaded implicitly.
+Repositories pass a LoadProfile and apply load_options(Model, profile) to their select();
+touching a relationship the profile does not load raises instead of issuing hidden queries.
+"""
+from enum import Enum
+from typing import Any
+
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.models.asset import Asset
+from app.models.audit import Audit
+from app.models.project import Project
+from app.models.rfq import Rfq
+from app.models.user import User
+
+
+class LoadProfile(str, Enum):
+    """What the caller is going to read from the loaded objects."""
+    AUTH = "auth"  # current-user resolution: user + company + role, one query
+    LIST = "list"  # paginated list responses: columns only
+    DETAIL = "detail"  # single-object responses
+    EXPORT = "export"  # bulk/streaming reads: columns only, never relationships
+
+
+_PROFILES: dict[type, dict[LoadProfile, tuple[LoaderOption, ...]]] = {
+    User: {
+        LoadProfile.AUTH: (joinedload(User.company), joinedload(User.role)),
+        LoadProfile.LIST: (),
+        LoadProfile.DETAIL: (joinedload(User.role),),
+        LoadProfile.EXPORT: (),
+    },
+    Project: {
+        LoadProfile.LIST: (),
+        LoadProfile.DETAIL: (),
+        LoadProfile.EXPORT: (),
+    },
+    Asset: {
+        LoadProfile.LIST: (),
+        LoadProfile.DETAIL: (),
+        LoadProfile.EXPORT: (),
+    },
+    Audit: {
+        LoadProfile.LIST: (),
+        LoadProfile.DETAIL: (),
+        LoadProfile.EXPORT: (),
+    },
+    Rfq: {
+        LoadProfile.LIST: (),
+        LoadProfile.DETAIL: (),
+        LoadProfile.EXPORT: (),
+    },
+}
+
+
+def load_options(model: type[Any], profile: LoadProfile) -> tuple[LoaderOption, ...]:
+    """Loader options for model under profile. Raises KeyError for an undefined combination."""
+    try:
+        return _PROFILES[model][profile]
+    except KeyError:
+        raise KeyError(f"No load profile {profile.value!r} for {model.__name__}") from None
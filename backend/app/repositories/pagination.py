@@ -0,0 +1,168 @@
+"""
+List pages for company-scoped tables: keyset cursors and page + total in one round trip.
+
+Deep OFFSET pages make Postgres walk and discard every skipped row; a seek predicate on
+(created_at, id) starts right after the previous page using the (company_id, created_at, id)
+indexes, so page 5000 costs the same as page 1. Cursors are opaque to clients.
+
+Totals come from count(*) OVER () on the page query itself, or, for tenants too large to count
+on every request, from the planner's row estimate (CountMode.ESTIMATE).
+"""
+import base64
+import json
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import ColumnElement, Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.config import get_settings
+
+settings = get_settings()
+T = TypeVar("T")
+
+Cursor = tuple[datetime, uuid.UUID]
+
+
+class CountMode(str, Enum):
+    """How list endpoints fill `count` (query param ?count=)."""
+    EXACT = "true"
+    NONE = "false"
+    ESTIMATE = "estimate"
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: list[T]
+    total: int | None = None
+    estimated: bool = False
+    next_cursor: str | None = None
+    # Parallel to items when the page was ranked by relevance (search)
+    ranks: list[float] | None = None
+    highlights: list[str | None] | None = None
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Inverse of encode_cursor; raises ValueError for anything malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def newest_first(stmt: Select[Any], model: Any, after: Cursor | None = None) -> Select[Any]:
+    """Order by (created_at, id) DESC and, given a cursor, continue strictly after it."""
+    if after is not None:
+        stmt = stmt.where(tuple_(model.created_at, model.id) < tuple_(*after))
+    return stmt.order_by(model.created_at.desc(), model.id.desc())
+
+
+def oldest_first(stmt: Select[Any], column: Any, model: Any, after: Cursor | None = None) -> Select[Any]:
+    """Order by (column, id) ASC and, given a cursor, continue strictly after it (calendar views)."""
+    if after is not None:
+        stmt = stmt.where(tuple_(column, model.id) > tuple_(*after))
+    return stmt.order_by(column.asc(), model.id.asc())
+
+
+def split_page(items: Sequence[T], per_page: int, key: str = "created_at") -> tuple[list[T], str | None]:
+    """Given per_page + 1 rows, return the page and the next_cursor (None on the last page)."""
+    page = list(items[:per_page])
+    if len(items) <= per_page:
+        return page, None
+    last: Any = page[-1]
+    return page, encode_cursor(getattr(last, key), last.id)
+
+
+async def count_rows(session: AsyncSession, model: Any, where: Sequence[ColumnElement[bool]]) -> int:
+    result = await session.execute(select(func.count()).select_from(model).where(*where))
+    return result.scalar() or 0
+
+
+async def estimate_rows(session: AsyncSession, model: Any, where: Sequence[ColumnElement[bool]]) -> int:
+    """Planner row estimate for the filter (EXPLAIN, nothing is scanned). Accuracy follows ANALYZE stats."""
+    compiled = select(model.id).where(*where).compile(dialect=session.get_bind().dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup or ())
+    conn = await session.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def fetch_page(
+    session: AsyncSession,
+    model: Any,
+    where: Sequence[ColumnElement[bool]],
+    options: Sequence[ORMOption] = (),
+    *,
+    skip: int = 0,
+    limit: int = 100,
+    keyset: bool = False,
+    after: Cursor | None = None,
+    count: CountMode = CountMode.EXACT,
+    rank: ColumnElement[float] | None = None,
+) -> Page[Any]:
+    """
+    One page of model rows matching where, plus its total per count.
+
+    Newest first, or by rank descending when given (OFFSET only; cursors encode (created_at, id)).
+    keyset=True ignores skip, seeks past after (if given) and sets next_cursor. Exact totals
+    ride along the page query as count(*) OVER () whenever the window covers the whole filter
+    (no seek predicate); options must therefore not join-load collections, which multiply rows.
+    """
+    if keyset and rank is not None:
+        raise ValueError("Keyset pagination cannot be combined with relevance ranking")
+    page: Page[Any] = Page(items=[])
+    if count is CountMode.ESTIMATE:
+        page.total = await estimate_rows(session, model, where)
+        if page.total < settings.list_count_exact_below:
+            count = CountMode.EXACT
+        else:
+            page.estimated = True
+    windowed = count is CountMode.EXACT and after is None
+
+    columns: list[Any] = [model]
+    if rank is not None:
+        rank = rank.label("rank")
+        columns.append(rank)
+    if windowed:
+        columns.append(func.count().over().label("total"))
+    stmt = select(*columns).where(*where).options(*options)
+    if rank is not None:
+        stmt = stmt.order_by(rank.desc(), model.created_at.desc(), model.id.desc())
+    else:
+        stmt = newest_first(stmt, model, after)
+    stmt = stmt.limit(limit + 1) if keyset else stmt.offset(skip).limit(limit)
+    rows = (await session.execute(stmt)).all()
+    items = [row[0] for row in rows]
+    if keyset:
+        page.items, page.next_cursor = split_page(items, limit)
+    else:
+        page.items = items
+    if rank is not None:
+        page.ranks = [float(row.rank or 0) for row in rows]
+
+    if windowed:
+        if rows:
+            page.total = rows[0].total
+        elif skip and not keyset:
+            # Past the end of an OFFSET listing there is no row to carry the window value
+            page.total = await count_rows(session, model, where)
+        else:
+            page.total = 0
+    elif count is CountMode.EXACT:
+        page.total = await count_rows(session, model, where)
+    return page
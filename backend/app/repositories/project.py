@@ -1,74 +1,136 @@
 """Project repository: all queries scoped by company_id to enforce multi-tenant isolation."""
 import uuid
 from datetime import date
-from typing import Sequence
+from collections.abc import AsyncIterator
+from typing import Iterable, Sequence
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import ColumnElement, RowMapping, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.project import Project
+from app.repositories.load_profiles import LoadProfile, load_options
+from app.repositories.pagination import CountMode, Cursor, Page, fetch_page, newest_first
+from app.repositories.search import SearchMode, SearchSpec, highlight
+
+PROJECT_SEARCH = SearchSpec(
+    fields=(Project.name, Project.code),
+    vector=Project.__table__.c.search_vector,
+)
+# Exported columns, in CSV header order
+EXPORT_COLUMNS = (
+    Project.id,
+    Project.company_id,
+    Project.name,
+    Project.code,
+    Project.description,
+    Project.status,
+    Project.start_date,
+    Project.end_date,
+    Project.created_by,
+    Project.created_at,
+    Project.updated_at,
+)
 
 
 class ProjectRepository:
     """Every method requires company_id; never query without it."""
 
-    def _list_filters(self, company_id: uuid.UUID, status: str | None, search: str | None):
-        stmt = select(Project).where(Project.company_id == company_id)
+    def _filters(
+        self,
+        company_id: uuid.UUID,
+        status: str | None,
+        search: str | None,
+        search_mode: SearchMode = SearchMode.CONTAINS,
+    ) -> list[ColumnElement[bool]]:
+        """The single definition of list filters; pages, counts and estimates all use it."""
+        where = [Project.company_id == company_id]
         if status:
-            stmt = stmt.where(Project.status == status)
+            where.append(Project.status == status)
         if search and search.strip():
-            q = f"%{search.strip()}%"
-            stmt = stmt.where(or_(Project.name.ilike(q), Project.code.ilike(q)))
-        return stmt
+            where.append(PROJECT_SEARCH.filter(search_mode, search.strip()))
+        return where
 
-    async def count_by_company(
+    async def page_by_company(
         self,
         session: AsyncSession,
         company_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
         status: str | None = None,
         search: str | None = None,
-    ) -> int:
-        stmt = select(func.count(Project.id)).where(Project.company_id == company_id)
-        if status:
-            stmt = stmt.where(Project.status == status)
-        if search and search.strip():
-            q = f"%{search.strip()}%"
-            stmt = stmt.where(or_(Project.name.ilike(q), Project.code.ilike(q)))
-        result = await session.execute(stmt)
-        return result.scalar() or 0
+        search_mode: SearchMode = SearchMode.CONTAINS,
+        keyset: bool = False,
+        after: Cursor | None = None,
+        count: CountMode = CountMode.EXACT,
+        profile: LoadProfile = LoadProfile.LIST,
+    ) -> Page[Project]:
+        """
+        List page and its total in one round trip (see pagination.fetch_page).
+        With search, ranked modes order by relevance and every mode fills page.highlights.
+        """
+        q = search.strip() if search else ""
+        page = await fetch_page(
+            session,
+            Project,
+            self._filters(company_id, status, q, search_mode),
+            load_options(Project, profile),
+            skip=skip,
+            limit=limit,
+            keyset=keyset,
+            after=after,
+            count=count,
+            rank=PROJECT_SEARCH.rank(search_mode, q) if q else None,
+        )
+        if q:
+            page.highlights = [highlight((p.name, p.code, p.description), q) for p in page.items]
+        return page
 
-    async def list_by_company(
+    async def stream_by_company(
         self,
         session: AsyncSession,
         company_id: uuid.UUID,
-        skip: int = 0,
-        limit: int = 100,
         status: str | None = None,
         search: str | None = None,
-    ) -> Sequence[Project]:
-        stmt = (
-            self._list_filters(company_id, status, search)
-            .order_by(Project.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        search_mode: SearchMode = SearchMode.CONTAINS,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Every matching row, newest first, in batches from a server-side cursor (plain rows, not ORM objects)."""
+        stmt = newest_first(
+            select(*EXPORT_COLUMNS).where(*self._filters(company_id, status, search, search_mode)), Project
         )
-        result = await session.execute(stmt)
-        return result.scalars().all()
+        result = await session.stream(stmt, execution_options={"yield_per": batch_size})
+        async for batch in result.mappings().partitions():
+            yield batch
 
     async def get_by_id(
         self,
         session: AsyncSession,
         project_id: uuid.UUID,
         company_id: uuid.UUID,
+        profile: LoadProfile = LoadProfile.DETAIL,
     ) -> Project | None:
         result = await session.execute(
-            select(Project).where(
+            select(Project)
+            .options(*load_options(Project, profile))
+            .where(
                 Project.id == project_id,
                 Project.company_id == company_id,
             )
         )
         return result.scalar_one_or_none()
 
+    async def existing_ids(
+        self, session: AsyncSession, company_id: uuid.UUID, project_ids: Iterable[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        """Which of project_ids are projects of this company (one query for a whole batch)."""
+        ids = list(project_ids)
+        if not ids:
+            return set()
+        result = await session.execute(
+            select(Project.id).where(Project.company_id == company_id, Project.id.in_(ids))
+        )
+        return set(result.scalars().all())
+
     async def create(
         self,
         session: AsyncSession,
@@ -93,7 +155,6 @@ class ProjectRepository:
         )
         session.add(project)
         await session.flush()
-        await session.refresh(project)
         return project
 
     async def update(
@@ -106,7 +167,6 @@ class ProjectRepository:
             if hasattr(project, key):
                 setattr(project, key, value)
         await session.flush()
-        await session.refresh(project)
         return project
 
     async def delete(self, session: AsyncSession, project: Project) -> None:
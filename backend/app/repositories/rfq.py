@@ -0,0 +1,233 @@
+"""RFQ and RFQ line item repositories: all queries scoped by company_id for multi-tenant isolation."""
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any, Sequence
+
+from sqlalchemy import ColumnElement, Integer, RowMapping, all_, delete, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rfq import Rfq, RfqLineItem
+from app.repositories.load_profiles import LoadProfile, load_options
+from app.repositories.pagination import CountMode, Cursor, Page, fetch_page
+
+# Columns a client writes per line; the upsert replaces exactly these on a (rfq_id, line_number) conflict
+LINE_ITEM_VALUES = ("description", "quantity", "unit")
+# Exported line item columns, in CSV header order (as in RfqLineItemRead)
+LINE_ITEM_EXPORT_COLUMNS = (
+    RfqLineItem.id,
+    RfqLineItem.rfq_id,
+    RfqLineItem.company_id,
+    RfqLineItem.line_number,
+    RfqLineItem.description,
+    RfqLineItem.quantity,
+    RfqLineItem.unit,
+)
+
+
+# Unique constraint on (company_id, rfq_number), see app.models.rfq
+RFQ_NUMBER_CONSTRAINT = "uq_rfqs_company_rfq_number"
+
+
+def _violates(error: IntegrityError, constraint: str) -> bool:
+    """True when error is a violation of the named constraint (asyncpg reports it on the DBAPI error's cause)."""
+    return getattr(error.orig.__cause__, "constraint_name", None) == constraint
+
+
+class RfqNumberTaken(Exception):
+    """Another RFQ of the company already has this rfq_number (uq_rfqs_company_rfq_number); HTTP 409."""
+
+    def __init__(self, rfq_number: str) -> None:
+        self.rfq_number = rfq_number
+        super().__init__(f"RFQ number already in use: {rfq_number}")
+
+
+class RfqRepository:
+    """Every method requires company_id; never query without it."""
+
+    def _filters(
+        self,
+        company_id: uuid.UUID,
+        project_id: uuid.UUID | None = None,
+        status: str | None = None,
+    ) -> list[ColumnElement[bool]]:
+        where = [Rfq.company_id == company_id]
+        if project_id is not None:
+            where.append(Rfq.project_id == project_id)
+        if status:
+            where.append(Rfq.status == status)
+        return where
+
+    async def page_by_company(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        project_id: uuid.UUID | None = None,
+        status: str | None = None,
+        keyset: bool = False,
+        after: Cursor | None = None,
+        count: CountMode = CountMode.EXACT,
+        profile: LoadProfile = LoadProfile.LIST,
+    ) -> Page[Rfq]:
+        """Newest first; list page and its total in one round trip (see pagination.fetch_page)."""
+        return await fetch_page(
+            session,
+            Rfq,
+            self._filters(company_id, project_id, status),
+            load_options(Rfq, profile),
+            skip=skip,
+            limit=limit,
+            keyset=keyset,
+            after=after,
+            count=count,
+        )
+
+    async def get_by_id(
+        self,
+        session: AsyncSession,
+        rfq_id: uuid.UUID,
+        company_id: uuid.UUID,
+        profile: LoadProfile = LoadProfile.DETAIL,
+    ) -> Rfq | None:
+        result = await session.execute(
+            select(Rfq)
+            .options(*load_options(Rfq, profile))
+            .where(
+                Rfq.id == rfq_id,
+                Rfq.company_id == company_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def create(self, session: AsyncSession, company_id: uuid.UUID, **values: Any) -> Rfq:
+        """
+        INSERT ... ON CONFLICT DO NOTHING on (company_id, rfq_number): a taken number raises
+        RfqNumberTaken without aborting the request's transaction.
+        """
+        stmt = (
+            insert(Rfq)
+            .values(id=uuid.uuid4(), company_id=company_id, **values)
+            .on_conflict_do_nothing(index_elements=[Rfq.company_id, Rfq.rfq_number])
+            .returning(Rfq)
+        )
+        rfq = (await session.execute(stmt)).scalar_one_or_none()
+        if rfq is None:
+            raise RfqNumberTaken(values["rfq_number"])
+        return rfq
+
+    async def update(self, session: AsyncSession, rfq: Rfq, **kwargs: Any) -> Rfq:
+        kwargs.pop("company_id", None)
+        if "rfq_number" not in kwargs:
+            self._apply(rfq, kwargs)
+            await session.flush()
+            return rfq
+        # Changes made inside a savepoint: a duplicate number rolls back (and expires) only them
+        try:
+            async with session.begin_nested():
+                self._apply(rfq, kwargs)
+                await session.flush()
+        except IntegrityError as e:
+            if not _violates(e, RFQ_NUMBER_CONSTRAINT):
+                raise
+            raise RfqNumberTaken(kwargs["rfq_number"]) from None
+        return rfq
+
+    @staticmethod
+    def _apply(rfq: Rfq, values: dict[str, Any]) -> None:
+        for key, value in values.items():
+            if hasattr(rfq, key):
+                setattr(rfq, key, value)
+
+    async def delete(self, session: AsyncSession, rfq: Rfq) -> None:
+        """Line items go with it (ON DELETE CASCADE; passive_deletes, so they are never loaded)."""
+        await session.delete(rfq)
+        await session.flush()
+
+
+class RfqLineItemRepository:
+    """Line items are always addressed through their RFQ (rfq_id) and company_id."""
+
+    async def page_by_rfq(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        rfq_id: uuid.UUID,
+        limit: int = 100,
+        after_line: int | None = None,
+    ) -> Page[RfqLineItem]:
+        """
+        Line items in line_number order, keyset-paged on line_number (uq_rfq_line_items_rfq_line
+        serves the seek); next_cursor is the last line_number of the page.
+        """
+        stmt = select(RfqLineItem).where(RfqLineItem.rfq_id == rfq_id, RfqLineItem.company_id == company_id)
+        if after_line is not None:
+            stmt = stmt.where(RfqLineItem.line_number > after_line)
+        items = (await session.execute(stmt.order_by(RfqLineItem.line_number).limit(limit + 1))).scalars().all()
+        page: Page[RfqLineItem] = Page(items=list(items[:limit]))
+        if len(items) > limit:
+            page.next_cursor = str(page.items[-1].line_number)
+        return page
+
+    async def stream_by_rfq(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        rfq_id: uuid.UUID,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Every line item in line_number order, in batches from a server-side cursor (plain rows)."""
+        stmt = (
+            select(*LINE_ITEM_EXPORT_COLUMNS)
+            .where(RfqLineItem.rfq_id == rfq_id, RfqLineItem.company_id == company_id)
+            .order_by(RfqLineItem.line_number)
+        )
+        result = await session.stream(stmt, execution_options={"yield_per": batch_size})
+        async for batch in result.mappings().partitions():
+            yield batch
+
+    async def upsert_many(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        rfq_id: uuid.UUID,
+        items: Sequence[dict[str, Any]],
+        batch_rows: int = 1000,
+    ) -> int:
+        """
+        Insert or update lines by (rfq_id, line_number), nothing added to the session: one compiled
+        statement, sent as a multi-row INSERT ... ON CONFLICT DO UPDATE per batch_rows lines
+        (insertmanyvalues; it splits batches above its page size of 1000). Lines whose values are
+        unchanged are skipped by the conflict WHERE, so re-sending an RFQ does not rewrite (and
+        bloat) every row.
+        """
+        stmt = insert(RfqLineItem)
+        current = tuple_(*(getattr(RfqLineItem, c) for c in LINE_ITEM_VALUES))
+        incoming = tuple_(*(stmt.excluded[c] for c in LINE_ITEM_VALUES))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RfqLineItem.rfq_id, RfqLineItem.line_number],
+            set_={**{c: stmt.excluded[c] for c in LINE_ITEM_VALUES}, "updated_at": func.now()},
+            where=current.is_distinct_from(incoming),
+        )
+        for start in range(0, len(items), batch_rows):
+            chunk = items[start : start + batch_rows]
+            await session.execute(
+                stmt, [{**item, "id": uuid.uuid4(), "rfq_id": rfq_id, "company_id": company_id} for item in chunk]
+            )
+        return len(items)
+
+    async def delete_except(
+        self, session: AsyncSession, company_id: uuid.UUID, rfq_id: uuid.UUID, line_numbers: Sequence[int]
+    ) -> int:
+        """Delete the RFQ's lines whose line_number is not in line_numbers (one array parameter); returns the count."""
+        stmt = delete(RfqLineItem).where(RfqLineItem.rfq_id == rfq_id, RfqLineItem.company_id == company_id)
+        if line_numbers:
+            stmt = stmt.where(RfqLineItem.line_number != all_(literal(list(line_numbers), ARRAY(Integer))))
+        result = await session.execute(stmt, execution_options={"synchronize_session": False})
+        return result.rowcount or 0
+
+
+rfq_repository = RfqRepository()
+rfq_line_item_repository = RfqLineItemRepository()
@@ -0,0 +1,25 @@
+"""RFQ number sequence repository: per-(company, period) counters handed out in blocks."""
+import uuid
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rfq_number_sequence import RfqNumberSequence
+
+
+class RfqNumberSequenceRepository:
+    async def reserve(self, session: AsyncSession, company_id: uuid.UUID, period: int, n: int) -> int:
+        """
+        Reserve n consecutive numbers and return the first; a new (company, period) starts at 1.
+        One upsert; the row lock lasts until the caller commits, so commit right away.
+        """
+        stmt = insert(RfqNumberSequence).values(company_id=company_id, period=period, next_value=1 + n)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RfqNumberSequence.company_id, RfqNumberSequence.period],
+            set_={"next_value": RfqNumberSequence.next_value + n, "updated_at": func.now()},
+        ).returning(RfqNumberSequence.next_value - n)
+        return (await session.execute(stmt)).scalar_one()
+
+
+rfq_number_sequence_repository = RfqNumberSequenceRepository()
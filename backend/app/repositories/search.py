@@ -0,0 +1,90 @@
+"""
+Search modes for list endpoints (?q= with ?search_mode=).
+
+contains  ILIKE '%q%' across the model's text fields (pg_trgm GIN indexes serve it for q of 3+ chars)
+fuzzy     pg_trgm word similarity: typo tolerant, ranked by the best field's similarity
+fulltext  websearch_to_tsquery against the generated search_vector column, ranked by ts_rank_cd
+
+Highlights are built in Python from the page rows only: HTML-escaped field text with matched
+terms wrapped in <mark></mark>, so clients can render them as-is.
+"""
+import html
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, literal, or_
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+HIGHLIGHT_MAX_CHARS = 160
+
+
+class SearchMode(str, Enum):
+    CONTAINS = "contains"
+    FUZZY = "fuzzy"
+    FULLTEXT = "fulltext"
+
+    @property
+    def ranked(self) -> bool:
+        return self is not SearchMode.CONTAINS
+
+
+@dataclass(frozen=True, slots=True)
+class SearchSpec:
+    """Columns matched by contains/fuzzy; vector is the generated tsvector (may cover more text)."""
+    fields: tuple[Any, ...]
+    vector: Any
+    config: str = "simple"
+
+    def _tsquery(self, q: str) -> ColumnElement[Any]:
+        return func.websearch_to_tsquery(self.config, q)
+
+    def filter(self, mode: SearchMode, q: str) -> ColumnElement[bool]:
+        if mode is SearchMode.FULLTEXT:
+            return self.vector.op("@@")(self._tsquery(q))
+        if mode is SearchMode.FUZZY:
+            # q <% field: word_similarity(q, field) >= pg_trgm.word_similarity_threshold, GIN-indexable
+            return or_(*(literal(q).op("<%")(f) for f in self.fields))
+        pattern = f"%{q}%"
+        return or_(*(f.ilike(pattern) for f in self.fields))
+
+    def rank(self, mode: SearchMode, q: str) -> ColumnElement[float] | None:
+        """Relevance, higher is better; None for contains (which keeps newest-first order)."""
+        if mode is SearchMode.FULLTEXT:
+            return func.ts_rank_cd(self.vector, self._tsquery(q))
+        if mode is SearchMode.FUZZY:
+            return func.greatest(*(func.word_similarity(q, f) for f in self.fields))
+        return None
+
+
+def _terms(q: str) -> list[str]:
+    """Plain terms of q, minus websearch syntax (quotes, OR, -excluded)."""
+    words = re.findall(r'[^\s"]+', q)
+    return [w for w in words if not w.startswith("-") and w.lower() != "or"]
+
+
+def highlight(values: Sequence[str | None], q: str) -> str | None:
+    """First value containing a term of q, escaped and with terms marked; None without a literal match."""
+    terms = _terms(q)
+    if not terms:
+        return None
+    pattern = re.compile("|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    for value in values:
+        match = pattern.search(value) if value else None
+        if match is None:
+            continue
+        if len(value) > HIGHLIGHT_MAX_CHARS:
+            start = max(0, match.start() - HIGHLIGHT_MAX_CHARS // 4)
+            end = start + HIGHLIGHT_MAX_CHARS
+            value = ("…" if start else "") + value[start:end] + ("…" if end < len(value) else "")
+        parts, last = [], 0
+        for m in pattern.finditer(value):
+            parts.append(html.escape(value[last:m.start()]))
+            parts.append(f"{HIGHLIGHT_START}{html.escape(m.group(0))}{HIGHLIGHT_STOP}")
+            last = m.end()
+        parts.append(html.escape(value[last:]))
+        return "".join(parts)
+    return None
@@ -0,0 +1,92 @@
+"""
+Stripe event repository: the webhook inbox. Rows are inserted once by Stripe event id, claimed
+with FOR UPDATE SKIP LOCKED by whichever worker gets there first, and completed or rescheduled.
+"""
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Sequence
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.stripe_event import StripeEvent
+
+# NOTIFY channel that wakes inbox processors in every worker; no payload
+INBOX_CHANNEL = "stripe_inbox"
+
+_LAST_ERROR_MAX_CHARS = 2000
+
+
+class StripeEventRepository:
+    async def record(
+        self,
+        session: AsyncSession,
+        event_id: str,
+        event_type: str,
+        stripe_created_at: datetime,
+        payload: dict[str, Any],
+    ) -> bool:
+        """
+        Queue the event; False when it was already recorded (a duplicate delivery). A concurrent
+        delivery of the same id waits on the primary key until the first transaction ends.
+        """
+        stmt = (
+            insert(StripeEvent)
+            .values(id=event_id, type=event_type, stripe_created_at=stripe_created_at, payload=payload)
+            .on_conflict_do_nothing(index_elements=[StripeEvent.id])
+            .returning(StripeEvent.id)
+        )
+        inserted = (await session.execute(stmt)).scalar_one_or_none() is not None
+        if inserted:
+            await session.execute(select(func.pg_notify(INBOX_CHANNEL, "")))
+        return inserted
+
+    async def claim_due(self, session: AsyncSession, limit: int) -> Sequence[StripeEvent]:
+        """Lock up to limit due, unprocessed events; rows other workers hold are skipped, not waited on."""
+        result = await session.execute(
+            select(StripeEvent)
+            .where(StripeEvent.processed_at.is_(None), StripeEvent.next_attempt_at <= func.now())
+            .order_by(StripeEvent.next_attempt_at, StripeEvent.stripe_created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return result.scalars().all()
+
+    async def complete(
+        self, session: AsyncSession, event_id: str, outcome: str, company_id: uuid.UUID | None
+    ) -> None:
+        await session.execute(
+            update(StripeEvent)
+            .where(StripeEvent.id == event_id)
+            .values(outcome=outcome, company_id=company_id, processed_at=func.now(), last_error=None)
+        )
+
+    async def reschedule(self, session: AsyncSession, event_id: str, error: str, retry_in: timedelta | None) -> None:
+        """Count a failed attempt: retry after retry_in, or give up (outcome "failed") when it is None."""
+        values: dict[str, Any] = {"attempts": StripeEvent.attempts + 1, "last_error": error[:_LAST_ERROR_MAX_CHARS]}
+        if retry_in is None:
+            values.update(outcome="failed", processed_at=func.now())
+        else:
+            values["next_attempt_at"] = func.now() + retry_in
+        await session.execute(update(StripeEvent).where(StripeEvent.id == event_id).values(**values))
+
+    async def count_pending(self, session: AsyncSession) -> int:
+        result = await session.execute(
+            select(func.count()).select_from(StripeEvent).where(StripeEvent.processed_at.is_(None))
+        )
+        return result.scalar_one()
+
+    async def list_by_company(
+        self, session: AsyncSession, company_id: uuid.UUID, limit: int = 100
+    ) -> Sequence[StripeEvent]:
+        result = await session.execute(
+            select(StripeEvent)
+            .where(StripeEvent.company_id == company_id)
+            .order_by(StripeEvent.stripe_created_at.desc(), StripeEvent.id.desc())
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+
+stripe_event_repository = StripeEventRepository()
@@ -0,0 +1,110 @@
+"""Subscription repository: one row per company, upserted; every write notifies other workers."""
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.subscription import Subscription
+
+# NOTIFY channel; payload is the company id. Delivered to listeners when the writing transaction commits.
+SUBSCRIPTION_CHANNEL = "billing_subscription"
+
+# Columns webhook events set, grouped by the watermark column that orders them. Plan and status
+# arrive in different event types and in no particular order, so an event is only stale for the
+# groups a newer event already wrote (a late checkout.session.completed still sets the plan).
+EVENT_COLUMN_GROUPS = {
+    "plan_event_at": ("plan_id", "stripe_subscription_id", "trial_ends_at"),
+    "status_event_at": ("status", "cancel_at_period_end", "current_period_end"),
+}
+
+
+class SubscriptionRepository:
+    async def get_by_company(self, session: AsyncSession, company_id: uuid.UUID) -> Subscription | None:
+        result = await session.execute(select(Subscription).where(Subscription.company_id == company_id))
+        return result.scalar_one_or_none()
+
+    async def get_by_customer(self, session: AsyncSession, stripe_customer_id: str) -> Subscription | None:
+        result = await session.execute(
+            select(Subscription).where(Subscription.stripe_customer_id == stripe_customer_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def upsert(self, session: AsyncSession, company_id: uuid.UUID, **values: Any) -> Subscription:
+        """Insert the company's row or update the given columns; other columns keep their value or default."""
+        stmt = (
+            insert(Subscription)
+            .values(company_id=company_id, **values)
+            .on_conflict_do_update(
+                index_elements=[Subscription.company_id],
+                set_={**values, "updated_at": func.now()},
+            )
+            .returning(Subscription)
+        )
+        result = await session.execute(stmt, execution_options={"populate_existing": True})
+        subscription = result.scalar_one()
+        await self.notify(session, company_id)
+        return subscription
+
+    async def upsert_if_newer(
+        self, session: AsyncSession, company_id: uuid.UUID, event_at: datetime, **values: Any
+    ) -> Subscription | None:
+        """
+        Upsert on behalf of a webhook event created at event_at. Each column group of values is
+        written only if no newer event wrote that group; returns None without writing when every
+        group is stale (Stripe does not guarantee delivery order).
+        """
+        grouped = {column for columns in EVENT_COLUMN_GROUPS.values() for column in columns}
+        if not values.keys() <= grouped:
+            raise ValueError(f"Not set by webhook events: {sorted(values.keys() - grouped)}")
+        table = Subscription.__table__
+        watermarks = {
+            watermark: [column for column in columns if column in values]
+            for watermark, columns in EVENT_COLUMN_GROUPS.items()
+            if any(column in values for column in columns)
+        }
+        stmt = insert(Subscription).values(
+            company_id=company_id, **values, **{watermark: event_at for watermark in watermarks}
+        )
+        set_: dict[str, Any] = {"updated_at": func.now()}
+        newer_groups = []
+        for watermark, columns in watermarks.items():
+            newer = or_(table.c[watermark].is_(None), table.c[watermark] <= event_at)
+            newer_groups.append(newer)
+            for column in columns:
+                set_[column] = case((newer, stmt.excluded[column]), else_=table.c[column])
+            set_[watermark] = func.greatest(table.c[watermark], stmt.excluded[watermark])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Subscription.company_id], set_=set_, where=or_(*newer_groups)
+        ).returning(Subscription)
+        result = await session.execute(stmt, execution_options={"populate_existing": True})
+        subscription = result.scalar_one_or_none()
+        if subscription is not None:
+            await self.notify(session, company_id)
+        return subscription
+
+    async def set_customer(self, session: AsyncSession, company_id: uuid.UUID, stripe_customer_id: str) -> str:
+        """Record the Stripe customer unless one is already stored; returns the id that is stored."""
+        stmt = (
+            insert(Subscription)
+            .values(company_id=company_id, stripe_customer_id=stripe_customer_id)
+            .on_conflict_do_update(
+                index_elements=[Subscription.company_id],
+                set_={
+                    "stripe_customer_id": func.coalesce(Subscription.stripe_customer_id, stripe_customer_id),
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(Subscription.stripe_customer_id)
+        )
+        stored = (await session.execute(stmt)).scalar_one()
+        await self.notify(session, company_id)
+        return stored
+
+    async def notify(self, session: AsyncSession, company_id: uuid.UUID) -> None:
+        await session.execute(select(func.pg_notify(SUBSCRIPTION_CHANNEL, str(company_id))))
+
+
+subscription_repository = SubscriptionRepository()
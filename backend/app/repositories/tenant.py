@@ -38,7 +38,6 @@ class TenantRepository:
         tenant = Tenant(name=name, slug=slug, is_active=is_active)
         session.add(tenant)
         await session.flush()
-        await session.refresh(tenant)
         return tenant
 
     async def update(
@@ -51,7 +50,6 @@ class TenantRepository:
             if hasattr(tenant, key) and value is not None:
                 setattr(tenant, key, value)
         await session.flush()
-        await session.refresh(tenant)
         return tenant
 
 
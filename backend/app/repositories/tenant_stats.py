@@ -0,0 +1,185 @@
+"""
+Tenant stats repository: per-company counts by status of the tracked tables.
+
+The triggers installed with the tables (app/models/tenant_stats.py) append tenant_stat_deltas
+rows; compact() folds them into tenant_stats. A count is therefore tenant_stats.n plus the
+pending deltas of the same key, read in one statement over two primary-key/index ranges.
+"""
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    case,
+    delete,
+    exists,
+    func,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.asset import Asset
+from app.models.audit import Audit
+from app.models.company import Company
+from app.models.project import Project
+from app.models.rfq import Rfq
+from app.models.tenant_stats import TenantStatDelta, TenantStats
+from app.models.user import User
+
+# Tracked table -> (model, status expression); mirrors TRACKED_TABLES, which the triggers use
+COUNTED: dict[str, tuple[Any, ColumnElement]] = {
+    "projects": (Project, Project.status),
+    "users": (User, case((User.is_active, literal_column("'active'")), else_=literal_column("'inactive'"))),
+    "assets": (Asset, Asset.status),
+    "audits": (Audit, Audit.status),
+    "rfqs": (Rfq, Rfq.status),
+}
+# One job (compaction or recount) at a time across workers; transaction-scoped advisory lock key
+JOBS_LOCK_KEY = 0x7E5A_57A7
+
+
+class TenantStatsRepository:
+    def _actual(self, company_id: uuid.UUID) -> Any:
+        """(entity, status, n) from GROUP BY status over each tracked table (one scan per table)."""
+        return union_all(
+            *(
+                select(literal_column(f"'{entity}'").label("entity"), status.label("status"), func.count().label("n"))
+                .where(model.company_id == company_id)
+                .group_by(status)
+                for entity, (model, status) in COUNTED.items()
+            )
+        )
+
+    async def counts(
+        self, session: AsyncSession, company_id: uuid.UUID, entities: Sequence[str] | None = None
+    ) -> dict[str, dict[str, int]]:
+        """{entity: {status: n}} for every tracked table (or the given ones): compacted counts plus pending deltas."""
+        base = select(TenantStats.entity, TenantStats.status, TenantStats.n).where(TenantStats.company_id == company_id)
+        pending = select(TenantStatDelta.entity, TenantStatDelta.status, TenantStatDelta.n).where(
+            TenantStatDelta.company_id == company_id
+        )
+        if entities is not None:
+            base = base.where(TenantStats.entity.in_(entities))
+            pending = pending.where(TenantStatDelta.entity.in_(entities))
+        rows = union_all(base, pending).subquery()
+        total = func.sum(rows.c.n)
+        result = await session.execute(
+            select(rows.c.entity, rows.c.status, total).group_by(rows.c.entity, rows.c.status).having(total != 0)
+        )
+        counts: dict[str, dict[str, int]] = {entity: {} for entity in (entities or COUNTED)}
+        for entity, status, n in result:
+            counts[entity][status] = int(n)
+        return counts
+
+    async def lock_counter(self, session: AsyncSession, company_id: uuid.UUID, entity: str) -> None:
+        """
+        Serialize limit checks of one tenant and table until commit: the next check waits, then
+        sees this transaction's rows. Writes that check no limit never take it.
+        """
+        key = func.hashtextextended(f"tenant_stats:{company_id}:{entity}", 0)
+        await session.execute(select(func.pg_advisory_xact_lock(key)))
+
+    async def try_lock_jobs(self, session: AsyncSession) -> bool:
+        """True if this transaction may compact or recount (no other worker is doing so)."""
+        return (await session.execute(select(func.pg_try_advisory_xact_lock(JOBS_LOCK_KEY)))).scalar_one()
+
+    async def compact(self, session: AsyncSession, limit: int) -> int:
+        """
+        Fold the oldest limit delta rows into tenant_stats in one statement (deletes and upserts
+        share a snapshot, so no change is lost or counted twice); returns how many were folded.
+        Deltas of deleted companies are dropped.
+        """
+        moved = (
+            delete(TenantStatDelta)
+            .where(TenantStatDelta.id.in_(select(TenantStatDelta.id).order_by(TenantStatDelta.id).limit(limit)))
+            .returning(TenantStatDelta.company_id, TenantStatDelta.entity, TenantStatDelta.status, TenantStatDelta.n)
+            .cte("moved")
+        )
+        summed = (
+            select(moved.c.company_id, moved.c.entity, moved.c.status, func.sum(moved.c.n))
+            .where(exists().where(Company.id == moved.c.company_id))
+            .group_by(moved.c.company_id, moved.c.entity, moved.c.status)
+        )
+        upsert = (
+            insert(TenantStats)
+            .from_select(["company_id", "entity", "status", "n"], summed)
+            .on_conflict_do_update(
+                index_elements=[TenantStats.company_id, TenantStats.entity, TenantStats.status],
+                set_={"n": TenantStats.n + insert(TenantStats).excluded.n},
+            )
+            .returning(TenantStats.company_id)
+            .cte("upserted")
+        )
+        folded = select(func.count()).select_from(moved).add_cte(upsert)
+        return (await session.execute(folded)).scalar_one()
+
+    async def recount(
+        self, session: AsyncSession, company_id: uuid.UUID
+    ) -> tuple[dict[str, dict[str, int]], dict[str, dict[str, int]]]:
+        """
+        Reset the tenant's counts from the tracked tables and drop its pending deltas, in one
+        statement: deltas of writes committed later are not in the count and are kept. Returns
+        (counts before, counts after) as {entity: {status: n}} without zeros.
+        """
+        actual = self._actual(company_id).cte("actual")
+        before = union_all(
+            select(TenantStats.entity, TenantStats.status, TenantStats.n).where(TenantStats.company_id == company_id),
+            select(TenantStatDelta.entity, TenantStatDelta.status, TenantStatDelta.n).where(
+                TenantStatDelta.company_id == company_id
+            ),
+        ).cte("before")
+        dropped = (
+            delete(TenantStatDelta).where(TenantStatDelta.company_id == company_id).returning(TenantStatDelta.id).cte("dropped")
+        )
+        zeroed = (
+            update(TenantStats)
+            .where(
+                TenantStats.company_id == company_id,
+                TenantStats.n != 0,
+                tuple_(TenantStats.entity, TenantStats.status).not_in(select(actual.c.entity, actual.c.status)),
+            )
+            .values(n=0)
+            .returning(TenantStats.entity)
+            .cte("zeroed")
+        )
+        written = (
+            insert(TenantStats)
+            .from_select(
+                ["company_id", "entity", "status", "n"],
+                select(literal(company_id, PG_UUID(as_uuid=True)), actual.c.entity, actual.c.status, actual.c.n),
+            )
+            .on_conflict_do_update(
+                index_elements=[TenantStats.company_id, TenantStats.entity, TenantStats.status],
+                set_={"n": insert(TenantStats).excluded.n},
+            )
+            .returning(TenantStats.entity)
+            .cte("written")
+        )
+        total = func.sum(before.c.n)
+        stmt = union_all(
+            select(literal_column("'before'"), before.c.entity, before.c.status, total)
+            .group_by(before.c.entity, before.c.status)
+            .having(total != 0),
+            select(literal_column("'after'"), actual.c.entity, actual.c.status, actual.c.n),
+        ).add_cte(dropped, zeroed, written)
+        counts: dict[str, dict[str, dict[str, int]]] = {"before": {}, "after": {}}
+        for side, entity, status, n in await session.execute(stmt):
+            counts[side].setdefault(entity, {})[status] = int(n)
+        return counts["before"], counts["after"]
+
+    async def company_ids_after(self, session: AsyncSession, after: uuid.UUID | None, limit: int) -> list[uuid.UUID]:
+        """Next limit company ids in id order (reconciliation walks all tenants)."""
+        stmt = select(Company.id).order_by(Company.id).limit(limit)
+        if after is not None:
+            stmt = stmt.where(Company.id > after)
+        return list((await session.execute(stmt)).scalars())
+
+
+tenant_stats_repository = TenantStatsRepository()
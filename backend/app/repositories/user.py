@@ -1,12 +1,11 @@
 """User repository: company-scoped queries."""
 import uuid
-from typing import Sequence
+from typing import Iterable, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
 from app.models.user import User
+from app.repositories.load_profiles import LoadProfile, load_options
 
 
 class UserRepository:
@@ -15,10 +14,11 @@ class UserRepository:
         session: AsyncSession,
         user_id: uuid.UUID,
         company_id: uuid.UUID,
+        profile: LoadProfile = LoadProfile.DETAIL,
     ) -> User | None:
         result = await session.execute(
             select(User)
-            .options(selectinload(User.company), selectinload(User.role))
+            .options(*load_options(User, profile))
             .where(
                 User.id == user_id,
                 User.company_id == company_id,
@@ -26,15 +26,26 @@ class UserRepository:
         )
         return result.scalar_one_or_none()
 
+    async def existing_ids(
+        self, session: AsyncSession, company_id: uuid.UUID, user_ids: Iterable[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        """Which of user_ids are users of this company (one query for a whole batch)."""
+        ids = list(user_ids)
+        if not ids:
+            return set()
+        result = await session.execute(select(User.id).where(User.company_id == company_id, User.id.in_(ids)))
+        return set(result.scalars().all())
+
     async def get_by_email(
         self,
         session: AsyncSession,
         email: str,
         company_id: uuid.UUID,
+        profile: LoadProfile = LoadProfile.AUTH,
     ) -> User | None:
         result = await session.execute(
             select(User)
-            .options(selectinload(User.company), selectinload(User.role))
+            .options(*load_options(User, profile))
             .where(
                 User.email == email,
                 User.company_id == company_id,
@@ -46,11 +57,12 @@ class UserRepository:
         self,
         session: AsyncSession,
         email: str,
+        profile: LoadProfile = LoadProfile.AUTH,
     ) -> User | None:
         """First user with this email (any company). Used when no company_slug on login."""
         result = await session.execute(
             select(User)
-            .options(selectinload(User.company), selectinload(User.role))
+            .options(*load_options(User, profile))
             .where(User.email == email)
             .limit(1)
         )
@@ -62,9 +74,11 @@ class UserRepository:
         company_id: uuid.UUID,
         skip: int = 0,
         limit: int = 100,
+        profile: LoadProfile = LoadProfile.LIST,
     ) -> Sequence[User]:
         result = await session.execute(
             select(User)
+            .options(*load_options(User, profile))
             .where(User.company_id == company_id)
             .offset(skip)
             .limit(limit)
@@ -90,7 +104,6 @@ class UserRepository:
         )
         session.add(user)
         await session.flush()
-        await session.refresh(user)
         return user
 
     async def update(
@@ -103,7 +116,6 @@ class UserRepository:
             if hasattr(user, key) and value is not None:
                 setattr(user, key, value)
         await session.flush()
-        await session.refresh(user)
         return user
 
 
@@ -4,8 +4,8 @@ from app.schemas.tenant import TenantBase, TenantCreate, TenantUpdate, TenantRes
 from app.schemas.common import UuidStr
 from app.schemas.company import CompanyBase, CompanyCreate, CompanyUpdate, CompanyRead
 from app.schemas.role import RoleBase, RoleCreate, RoleUpdate, RoleRead
-from app.schemas.project import ProjectBase, ProjectCreate, ProjectUpdate, ProjectRead
-from app.schemas.asset import AssetBase, AssetCreate, AssetUpdate, AssetRead
+from app.schemas.project import ProjectBase, ProjectCreate, ProjectUpdate, ProjectRead, ProjectListItem
+from app.schemas.asset import AssetBase, AssetCreate, AssetUpdate, AssetRead, AssetListItem
 from app.schemas.audit import AuditBase, AuditCreate, AuditUpdate, AuditRead
 from app.schemas.rfq import (
     RfqBase,
@@ -46,10 +46,12 @@ __all__ = [
     "ProjectCreate",
     "ProjectUpdate",
     "ProjectRead",
+    "ProjectListItem",
     "AssetBase",
     "AssetCreate",
     "AssetUpdate",
     "AssetRead",
+    "AssetListItem",
     "AuditBase",
     "AuditCreate",
     "AuditUpdate",
@@ -1,10 +1,11 @@
 """Asset (equipment / machines) request/response schemas."""
+import uuid
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
-from app.schemas.common import UuidStr
+from app.schemas.common import SearchHit, UuidStr, reject_explicit_nulls
 
 
 class AssetBase(BaseModel):
@@ -41,3 +42,84 @@ class AssetRead(AssetBase):
     model_config = {"from_attributes": True}
     # ORM uses metadata_ column; map to "metadata" in JSON
     metadata: dict[str, Any] | None = Field(None, validation_alias="metadata_")
+
+
+class AssetListItem(AssetRead, SearchHit):
+    """Row of GET /assets."""
+
+
+class ImportFieldError(BaseModel):
+    field: str | None = None  # None: the row as a whole (bad JSON, wrong column count)
+    message: str
+
+
+class ImportRowError(BaseModel):
+    row: int  # 1-based data row (CSV: after the header; NDJSON: non-empty line)
+    errors: list[ImportFieldError]
+
+
+class AssetImportReport(BaseModel):
+    """Response of POST /assets/import: valid rows are inserted, failed rows listed (capped)."""
+    inserted: int
+    failed: int
+    errors: list[ImportRowError]
+    errors_truncated: bool = False
+
+
+# Most rows one bulk request touches (one statement, one transaction); larger filters continue by cursor
+BULK_MAX_ROWS = 5000
+
+
+class AssetFilter(BaseModel):
+    """Same filters as GET /assets; {} selects every asset of the company."""
+    project_id: uuid.UUID | None = None
+    status: str | None = None
+    asset_type: str | None = None
+    q: str | None = Field(None, description="Substring of name, serial_number or type")
+
+
+class AssetBulkSelection(BaseModel):
+    """Either ids (up to BULK_MAX_ROWS) or a filter; filter matches are taken limit at a time, by id."""
+    ids: list[uuid.UUID] | None = Field(None, min_length=1, max_length=BULK_MAX_ROWS)
+    filter: AssetFilter | None = None
+    cursor: uuid.UUID | None = Field(None, description="next_cursor of the previous call (filter only)")
+    limit: int = Field(BULK_MAX_ROWS, ge=1, le=BULK_MAX_ROWS, description="Max rows this call (filter only)")
+
+    @model_validator(mode="after")
+    def _one_selector(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Send either ids or filter")
+        if self.ids is not None and self.cursor is not None:
+            raise ValueError("cursor only applies to filter")
+        return self
+
+
+class AssetBulkValues(AssetUpdate):
+    """Changes applied to every selected asset; a malformed project_id is a 422, not a lookup."""
+    project_id: uuid.UUID | None = None
+
+    @model_validator(mode="after")
+    def _not_null_columns(self):
+        # One set-based UPDATE: a null here would fail the whole selection with a NOT NULL violation
+        reject_explicit_nulls(self, "name", "asset_type", "status")
+        return self
+
+
+class AssetBulkUpdate(AssetBulkSelection):
+    values: AssetBulkValues
+
+    @model_validator(mode="after")
+    def _has_values(self):
+        if not self.values.model_fields_set:
+            raise ValueError("values must set at least one field")
+        return self
+
+
+class AssetBulkResult(BaseModel):
+    """
+    affected: rows updated/deleted. not_found: requested ids that are not this company's assets.
+    next_cursor: the filter may match more rows; send it back as cursor (null when done).
+    """
+    affected: int
+    not_found: list[UuidStr] = []
+    next_cursor: UuidStr | None = None
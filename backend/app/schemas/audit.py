@@ -2,9 +2,12 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
-from app.schemas.common import UuidStr
+from app.schemas.common import UuidStr, reject_explicit_nulls
+
+# Most audits one POST /audits/bulk may schedule (one multi-row INSERT)
+AUDIT_BULK_MAX = 1000
 
 
 class AuditBase(BaseModel):
@@ -16,7 +19,7 @@ class AuditBase(BaseModel):
 
 
 class AuditCreate(AuditBase):
-    company_id: UuidStr
+    """company_id is set from JWT; project, asset and auditor must belong to the same company."""
     project_id: UuidStr | None = None
     asset_id: UuidStr | None = None
     auditor_id: UuidStr | None = None
@@ -32,6 +35,11 @@ class AuditUpdate(BaseModel):
     auditor_id: UuidStr | None = None
     findings: dict[str, Any] | None = None
 
+    @model_validator(mode="after")
+    def _not_null_columns(self) -> "AuditUpdate":
+        reject_explicit_nulls(self, "audit_type", "status")
+        return self
+
 
 class AuditRead(AuditBase):
     id: UuidStr
@@ -39,6 +47,13 @@ class AuditRead(AuditBase):
     project_id: UuidStr | None = None
     asset_id: UuidStr | None = None
     auditor_id: UuidStr | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
 
     class Config:
         from_attributes = True
+
+
+class AuditBulkCreate(BaseModel):
+    """Schedule many audits in one request (one INSERT); all or nothing."""
+    audits: list[AuditCreate] = Field(..., min_length=1, max_length=AUDIT_BULK_MAX)
@@ -1,8 +1,11 @@
-"""Shared schema helpers: UUID coercion and Bubble-friendly pagination."""
-from typing import Annotated, Any, Generic, TypeVar
+"""Shared schema helpers: UUID coercion, NOT NULL checks for partial updates, Bubble-friendly pagination."""
+from typing import TYPE_CHECKING, Annotated, Any, Generic, TypeVar
 
 from pydantic import BaseModel, BeforeValidator
 
+if TYPE_CHECKING:
+    from app.repositories.pagination import Page
+
 T = TypeVar("T")
 
 
@@ -15,10 +18,51 @@ def _coerce_uuid_str(v: Any) -> str:
 UuidStr = Annotated[str, BeforeValidator(_coerce_uuid_str)]
 
 
+def reject_explicit_nulls(model: BaseModel, *fields: str) -> None:
+    """
+    Partial updates: an omitted field is left alone, but an explicit null for a NOT NULL column
+    would reach the database. Call from a model_validator so it is a 422 rather than a 500.
+    """
+    nulls = [f for f in fields if f in model.model_fields_set and getattr(model, f) is None]
+    if nulls:
+        raise ValueError(f"May not be null: {', '.join(nulls)}")
+
+
+class SearchHit(BaseModel):
+    """List-row search metadata: rank for ?search_mode=fuzzy|fulltext, highlight whenever ?q= matches literally."""
+
+    rank: float | None = None
+    highlight: str | None = None
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Bubble API Connector–friendly list response: results, count, page, per_page."""
+    """
+    Bubble API Connector–friendly list response: results, count, page, per_page.
+    In cursor mode next_cursor is the value to send as ?cursor= for the next page (null on the last).
+    count is null with ?count=false, and a planner estimate when count_estimated is true.
+    """
 
     results: list[T]
-    count: int
+    count: int | None
+    count_estimated: bool = False
     page: int = 1
     per_page: int = 20
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_page(cls, result: "Page[Any]", item: type[BaseModel], page: int, per_page: int) -> "PaginatedResponse[Any]":
+        """Build from a repository Page, copying search ranks/highlights onto SearchHit items."""
+        results = [item.model_validate(row) for row in result.items]
+        for i, row in enumerate(results):
+            if result.ranks is not None:
+                row.rank = result.ranks[i]
+            if result.highlights is not None:
+                row.highlight = result.highlights[i]
+        return cls(
+            results=results,
+            count=result.total,
+            count_estimated=result.estimated,
+            page=page,
+            per_page=per_page,
+            next_cursor=result.next_cursor,
+        )
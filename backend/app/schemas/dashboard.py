@@ -0,0 +1,16 @@
+"""Dashboard response schemas."""
+from pydantic import BaseModel
+
+
+class StatusCounts(BaseModel):
+    total: int
+    by_status: dict[str, int]
+
+
+class DashboardSummary(BaseModel):
+    """Row counts by status for the current company (users: active / inactive)."""
+    projects: StatusCounts
+    users: StatusCounts
+    assets: StatusCounts
+    audits: StatusCounts
+    rfqs: StatusCounts
@@ -3,7 +3,7 @@ from datetime import date, datetime
 
 from pydantic import BaseModel, Field
 
-from app.schemas.common import UuidStr
+from app.schemas.common import SearchHit, UuidStr
 
 
 class ProjectBase(BaseModel):
@@ -39,3 +39,7 @@ class ProjectRead(ProjectBase):
 
     class Config:
         from_attributes = True
+
+
+class ProjectListItem(ProjectRead, SearchHit):
+    """Row of GET /projects."""
@@ -1,11 +1,15 @@
 """RFQ and RFQ line item request/response schemas."""
+from collections import Counter
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
-from app.schemas.common import UuidStr
+from app.schemas.common import UuidStr, reject_explicit_nulls
+
+# Most line items one RFQ create/replace may carry (written as batched multi-row upserts)
+RFQ_MAX_LINE_ITEMS = 10_000
 
 
 # ----- RFQ -----
@@ -19,9 +23,21 @@ class RfqBase(BaseModel):
 
 
 class RfqCreate(RfqBase):
-    company_id: UuidStr
+    """
+    POST /rfqs and PUT /rfqs/{id}: the RFQ with its complete list of line items.
+    company_id and created_by are set from JWT; project must belong to the same company.
+    Without rfq_number, POST allocates the next number and PUT keeps the current one.
+    """
     project_id: UuidStr | None = None
-    created_by: UuidStr | None = None
+    line_items: list["RfqLineItemCreate"] = Field(default_factory=list, max_length=RFQ_MAX_LINE_ITEMS)
+
+    @model_validator(mode="after")
+    def _unique_line_numbers(self) -> "RfqCreate":
+        counts = Counter(item.line_number for item in self.line_items)
+        duplicates = sorted(number for number, n in counts.items() if n > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate line_number: {', '.join(map(str, duplicates))}")
+        return self
 
 
 class RfqUpdate(BaseModel):
@@ -32,7 +48,11 @@ class RfqUpdate(BaseModel):
     due_date: date | None = None
     issued_at: datetime | None = None
     project_id: UuidStr | None = None
-    created_by: UuidStr | None = None
+
+    @model_validator(mode="after")
+    def _not_null_columns(self) -> "RfqUpdate":
+        reject_explicit_nulls(self, "title", "status")
+        return self
 
 
 class RfqRead(RfqBase):
@@ -40,6 +60,8 @@ class RfqRead(RfqBase):
     company_id: UuidStr
     project_id: UuidStr | None = None
     created_by: UuidStr | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
 
     class Config:
         from_attributes = True
@@ -47,19 +69,18 @@ class RfqRead(RfqBase):
 
 # ----- RFQ Line Item -----
 class RfqLineItemBase(BaseModel):
-    line_number: int
+    line_number: int = Field(..., ge=1)
     description: str | None = None
     quantity: Decimal | None = None
     unit: str | None = Field(None, max_length=32)
 
 
 class RfqLineItemCreate(RfqLineItemBase):
-    rfq_id: UuidStr
-    company_id: UuidStr
+    """rfq_id comes from the RFQ being written, company_id from JWT."""
 
 
 class RfqLineItemUpdate(BaseModel):
-    line_number: int | None = None
+    line_number: int | None = Field(None, ge=1)
     description: str | None = None
     quantity: Decimal | None = None
     unit: str | None = Field(None, max_length=32)
@@ -1,4 +1,7 @@
 from app.services.auth import auth_service
+from app.services.entitlements import entitlement_service
+from app.services.stripe_events import stripe_event_service
+from app.services.subscription import subscription_service
 from app.services.user import user_service
 
-__all__ = ["auth_service", "user_service"]
+__all__ = ["auth_service", "entitlement_service", "stripe_event_service", "subscription_service", "user_service"]
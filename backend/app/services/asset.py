@@ -1,17 +1,40 @@
 """Asset service: CRUD scoped by company_id (multi-tenant isolation)."""
 import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from typing import Any, Sequence
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.config import get_settings
 from app.models.asset import Asset
-from app.repositories.asset import asset_repository
+from app.repositories.asset import EXPORT_COLUMNS, asset_repository
+from app.repositories.pagination import CountMode, Cursor, Page
+from app.repositories.search import SearchMode
+from app.services.entitlements import Resource, entitlement_service
+from app.services.export import Batches, ExportFormat, stream
+
+settings = get_settings()
+
+
+@dataclass
+class BulkResult:
+    affected: int
+    not_found: list[uuid.UUID] = field(default_factory=list)
+    next_cursor: uuid.UUID | None = None  # set when a filter slice came back full: there may be more
+
+    @classmethod
+    def of(cls, changed: list[uuid.UUID], ids: Sequence[uuid.UUID] | None, limit: int) -> "BulkResult":
+        if ids is not None:
+            found = set(changed)
+            return cls(len(changed), not_found=[i for i in dict.fromkeys(ids) if i not in found])
+        return cls(len(changed), next_cursor=max(changed) if len(changed) >= limit else None)
 
 
 class AssetService:
     """All operations use company_id from tenant context; never from request body."""
 
-    async def list(
+    async def page(
         self,
         session: AsyncSession,
         company_id: uuid.UUID,
@@ -21,8 +44,12 @@ class AssetService:
         status: str | None = None,
         asset_type: str | None = None,
         search: str | None = None,
-    ) -> Sequence[Asset]:
-        return await asset_repository.list_by_company(
+        search_mode: SearchMode = SearchMode.CONTAINS,
+        keyset: bool = False,
+        after: Cursor | None = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> Page[Asset]:
+        return await asset_repository.page_by_company(
             session,
             company_id,
             skip=skip,
@@ -31,25 +58,38 @@ class AssetService:
             status=status,
             asset_type=asset_type,
             search=search,
+            search_mode=search_mode,
+            keyset=keyset,
+            after=after,
+            count=count,
         )
 
-    async def count(
+    def export(
         self,
-        session: AsyncSession,
+        sessionmaker: async_sessionmaker[AsyncSession],
         company_id: uuid.UUID,
+        fmt: ExportFormat,
         project_id: uuid.UUID | None = None,
         status: str | None = None,
         asset_type: str | None = None,
         search: str | None = None,
-    ) -> int:
-        return await asset_repository.count_by_company(
-            session,
-            company_id,
-            project_id=project_id,
-            status=status,
-            asset_type=asset_type,
-            search=search,
-        )
+        search_mode: SearchMode = SearchMode.CONTAINS,
+    ) -> AsyncIterator[bytes]:
+        """Body chunks of an export of every matching asset; nothing runs until it is iterated."""
+
+        def batches(session: AsyncSession) -> Batches:
+            return asset_repository.stream_by_company(
+                session,
+                company_id,
+                project_id=project_id,
+                status=status,
+                asset_type=asset_type,
+                search=search,
+                search_mode=search_mode,
+                batch_size=settings.export_batch_rows,
+            )
+
+        return stream(sessionmaker, batches, fmt, [c.key for c in EXPORT_COLUMNS])
 
     async def get_by_id(
         self,
@@ -71,6 +111,7 @@ class AssetService:
         project_id: uuid.UUID | None = None,
         metadata_: dict[str, Any] | None = None,
     ) -> Asset:
+        await entitlement_service.consume(session, company_id, Resource.ASSETS)
         return await asset_repository.create(
             session,
             company_id=company_id,
@@ -91,6 +132,43 @@ class AssetService:
     ) -> Asset:
         return await asset_repository.update(session, asset, **kwargs)
 
+    async def bulk_update(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        values: dict[str, Any],
+        ids: Sequence[uuid.UUID] | None = None,
+        filters: dict[str, Any] | None = None,
+        after: uuid.UUID | None = None,
+        limit: int = 1000,
+    ) -> BulkResult:
+        """Set values on the listed ids or on the next limit filter matches, as one company-scoped UPDATE."""
+        changed = await asset_repository.update_many(
+            session, company_id, values, ids=ids, after=after, limit=limit, **self._bulk_filters(filters)
+        )
+        return BulkResult.of(changed, ids, limit)
+
+    async def bulk_delete(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        ids: Sequence[uuid.UUID] | None = None,
+        filters: dict[str, Any] | None = None,
+        after: uuid.UUID | None = None,
+        limit: int = 1000,
+    ) -> BulkResult:
+        """Delete the listed ids or the next limit filter matches, as one company-scoped DELETE."""
+        deleted = await asset_repository.delete_many(
+            session, company_id, ids=ids, after=after, limit=limit, **self._bulk_filters(filters)
+        )
+        return BulkResult.of(deleted, ids, limit)
+
+    def _bulk_filters(self, filters: dict[str, Any] | None) -> dict[str, Any]:
+        filters = dict(filters or {})
+        if "q" in filters:
+            filters["search"] = filters.pop("q")
+        return filters
+
     async def delete(self, session: AsyncSession, asset: Asset) -> None:
         await asset_repository.delete(session, asset)
 
@@ -0,0 +1,230 @@
+"""
+Bulk asset import: CSV or NDJSON streamed from the request body into batched multi-row INSERTs.
+
+The body is decoded and split into rows as it arrives; rows are validated against AssetCreate
+and collected into batches of import_batch_rows. Each batch costs one query for its project ids,
+one usage-counter UPDATE and one multi-row INSERT, then is dropped. Memory therefore depends on
+the batch size and the (capped) error report, not on the file size. Rows that fail validation
+are reported by row number and skipped; the valid rows are inserted in the request's transaction.
+"""
+import codecs
+import csv
+import json
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.repositories.asset import asset_repository
+from app.repositories.project import project_repository
+from app.schemas.asset import AssetCreate
+from app.services.entitlements import Resource, entitlement_service
+
+settings = get_settings()
+
+REQUIRED_CSV_COLUMNS = ("name", "asset_type")
+
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @classmethod
+    def from_content_type(cls, content_type: str | None) -> "ImportFormat | None":
+        media_type = (content_type or "").split(";")[0].strip().lower()
+        if media_type in ("text/csv", "application/csv"):
+            return cls.CSV
+        if media_type in ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/json-lines"):
+            return cls.NDJSON
+        return None
+
+
+class ImportFileError(ValueError):
+    """The stream as a whole cannot be imported (bad header, encoding, oversized line); HTTP 400."""
+
+
+@dataclass
+class ImportReport:
+    max_errors: int
+    inserted: int = 0
+    failed: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    def fail(self, row: int, errors: list[dict[str, Any]]) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"row": row, "errors": errors})
+
+    @property
+    def errors_truncated(self) -> bool:
+        return self.failed > len(self.errors)
+
+
+def _row_error(message: str, field_name: str | None = None) -> list[dict[str, Any]]:
+    return [{"field": field_name, "message": message}]
+
+
+def _validation_errors(exc: ValidationError) -> list[dict[str, Any]]:
+    return [{"field": ".".join(str(part) for part in e["loc"]) or None, "message": e["msg"]} for e in exc.errors()]
+
+
+def _utf8_len(text: str) -> int:
+    """Encoded size of text; ASCII (the common case) is not encoded again."""
+    return len(text) if text.isascii() else len(text.encode())
+
+
+async def _lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[str]:
+    """
+    Decode UTF-8 (BOM tolerated) incrementally and yield lines without their terminator.
+    Every line, and the unterminated tail while it grows, is held to max_line_bytes (UTF-8).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                if _utf8_len(line) > max_line_bytes:
+                    raise ImportFileError(f"Line longer than {max_line_bytes} bytes")
+                yield line.removesuffix("\r")
+            if _utf8_len(pending) > max_line_bytes:
+                raise ImportFileError(f"Line longer than {max_line_bytes} bytes")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as e:
+        raise ImportFileError(f"File is not valid UTF-8: {e.reason}") from e
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+async def _csv_rows(
+    lines: AsyncIterator[str], max_record_bytes: int
+) -> AsyncIterator[tuple[int, dict[str, Any] | str]]:
+    """(row number, values or error message) per data row; the first record is the header."""
+    header: list[str] | None = None
+    record: list[str] = []
+    record_len = quotes = row = 0
+    async for line in lines:
+        record.append(line)
+        record_len += _utf8_len(line)
+        quotes += line.count('"')
+        if quotes % 2:  # inside a quoted field that continues on the next line
+            if record_len > max_record_bytes:
+                raise ImportFileError(f"Quoted field runs past {max_record_bytes} bytes (unbalanced quote?)")
+            continue
+        text = "\n".join(record)
+        record, record_len, quotes = [], 0, 0
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            missing = [name for name in REQUIRED_CSV_COLUMNS if name not in header]
+            if missing:
+                raise ImportFileError(f"CSV header is missing column(s): {', '.join(missing)}")
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        # Empty cells are absent values, so schema defaults (e.g. status) apply
+        data: dict[str, Any] = {name: value for name, value in zip(header, values) if value != ""}
+        if "metadata" in data:
+            try:
+                data["metadata"] = json.loads(data["metadata"])
+            except json.JSONDecodeError:
+                yield row, "metadata: not valid JSON"
+                continue
+        yield row, data
+    if record:
+        raise ImportFileError("Unterminated quoted field at end of file")
+
+
+async def _ndjson_rows(lines: AsyncIterator[str], max_record_bytes: int) -> AsyncIterator[tuple[int, dict[str, Any] | str]]:
+    row = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row, f"Invalid JSON: {e.msg}"
+            continue
+        yield row, data if isinstance(data, dict) else "Expected a JSON object"
+
+
+class AssetImportService:
+    async def import_stream(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        chunks: AsyncIterator[bytes],
+        fmt: ImportFormat,
+        batch_rows: int | None = None,
+        max_errors: int | None = None,
+    ) -> ImportReport:
+        report = ImportReport(max_errors=settings.import_max_reported_errors if max_errors is None else max_errors)
+        batch_rows = batch_rows or settings.import_batch_rows
+        parse = _csv_rows if fmt is ImportFormat.CSV else _ndjson_rows
+        batch: list[tuple[int, AssetCreate, uuid.UUID | None]] = []
+        max_line = settings.import_max_line_bytes
+        async for row, data in parse(_lines(chunks, max_line), max_line):
+            if isinstance(data, str):
+                report.fail(row, _row_error(data))
+                continue
+            try:
+                asset = AssetCreate.model_validate(data)
+            except ValidationError as e:
+                report.fail(row, _validation_errors(e))
+                continue
+            try:
+                project_id = uuid.UUID(asset.project_id) if asset.project_id else None
+            except ValueError:
+                report.fail(row, _row_error("Not a valid UUID", "project_id"))
+                continue
+            batch.append((row, asset, project_id))
+            if len(batch) >= batch_rows:
+                await self._insert_batch(session, company_id, batch, report)
+                batch = []
+        await self._insert_batch(session, company_id, batch, report)
+        return report
+
+    async def _insert_batch(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        batch: list[tuple[int, AssetCreate, uuid.UUID | None]],
+        report: ImportReport,
+    ) -> None:
+        project_ids = {project_id for _, _, project_id in batch if project_id is not None}
+        known = await project_repository.existing_ids(session, company_id, project_ids)
+        rows: list[dict[str, Any]] = []
+        for row, asset, project_id in batch:
+            if project_id is not None and project_id not in known:
+                report.fail(row, _row_error("Project not found", "project_id"))
+                continue
+            rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "company_id": company_id,
+                    "project_id": project_id,
+                    "name": asset.name,
+                    "asset_type": asset.asset_type,
+                    "serial_number": asset.serial_number,
+                    "location": asset.location,
+                    "status": asset.status,
+                    "metadata_": asset.metadata,
+                }
+            )
+        if rows:
+            await entitlement_service.consume(session, company_id, Resource.ASSETS, n=len(rows))
+            report.inserted += await asset_repository.insert_many(session, rows)
+
+
+asset_import_service = AssetImportService()
@@ -0,0 +1,116 @@
+"""Audit service: scheduling and CRUD scoped by company_id (multi-tenant isolation)."""
+import uuid
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.audit import Audit
+from app.repositories.asset import asset_repository
+from app.repositories.audit import AuditDateField, audit_repository
+from app.repositories.pagination import CountMode, Cursor, Page
+from app.repositories.project import project_repository
+from app.repositories.user import user_repository
+
+# Reference column -> (label, repository whose existing_ids checks it belongs to the company)
+REFERENCES = {
+    "project_id": ("Project", project_repository),
+    "asset_id": ("Asset", asset_repository),
+    "auditor_id": ("Auditor", user_repository),
+}
+
+
+class AuditReferenceNotFound(LookupError):
+    """A project, asset or auditor id that is not this company's (HTTP 404)."""
+
+    def __init__(self, label: str, ids: Sequence[str]) -> None:
+        self.label = label
+        self.ids = list(ids)
+        super().__init__(f"{label} not found: {', '.join(self.ids)}")
+
+
+def _as_uuid(value: Any) -> uuid.UUID | str:
+    """UUID for a well-formed id; otherwise the raw string, which then fails the lookup."""
+    try:
+        return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+    except ValueError:
+        return str(value)
+
+
+class AuditService:
+    """All operations use company_id from tenant context; never from request body."""
+
+    async def _resolve_references(
+        self, session: AsyncSession, company_id: uuid.UUID, rows: list[dict[str, Any]]
+    ) -> None:
+        """Convert reference ids to UUIDs in place and check them: one query per column for the whole batch."""
+        for column, (label, repository) in REFERENCES.items():
+            wanted = {row[column] for row in rows if row.get(column) is not None}
+            if not wanted:
+                continue
+            parsed = {value: _as_uuid(value) for value in wanted}
+            found = await repository.existing_ids(
+                session, company_id, [v for v in parsed.values() if isinstance(v, uuid.UUID)]
+            )
+            missing = sorted(str(raw) for raw, value in parsed.items() if value not in found)
+            if missing:
+                raise AuditReferenceNotFound(label, missing)
+            for row in rows:
+                if row.get(column) is not None:
+                    row[column] = parsed[row[column]]
+
+    async def page(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        keyset: bool = False,
+        after: Cursor | None = None,
+        count: CountMode = CountMode.EXACT,
+        **filters: Any,
+    ) -> Page[Audit]:
+        return await audit_repository.page_by_company(
+            session, company_id, skip=skip, limit=limit, keyset=keyset, after=after, count=count, **filters
+        )
+
+    async def calendar(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        field: AuditDateField,
+        start: datetime,
+        end: datetime,
+        limit: int = 100,
+        after: Cursor | None = None,
+        **filters: Any,
+    ) -> Page[Audit]:
+        return await audit_repository.in_range(
+            session, company_id, field, start, end, limit=limit, after=after, **filters
+        )
+
+    async def get_by_id(self, session: AsyncSession, audit_id: uuid.UUID, company_id: uuid.UUID) -> Audit | None:
+        return await audit_repository.get_by_id(session, audit_id, company_id)
+
+    async def create(self, session: AsyncSession, company_id: uuid.UUID, values: dict[str, Any]) -> Audit:
+        await self._resolve_references(session, company_id, [values])
+        return await audit_repository.create(session, company_id, **values)
+
+    async def schedule_many(
+        self, session: AsyncSession, company_id: uuid.UUID, rows: list[dict[str, Any]]
+    ) -> Sequence[Audit]:
+        """Create every audit or none: references checked per column for the batch, then one INSERT."""
+        await self._resolve_references(session, company_id, rows)
+        return await audit_repository.create_many(session, company_id, rows)
+
+    async def update(
+        self, session: AsyncSession, audit: Audit, company_id: uuid.UUID, values: dict[str, Any]
+    ) -> Audit:
+        await self._resolve_references(session, company_id, [values])
+        return await audit_repository.update(session, audit, **values)
+
+    async def delete(self, session: AsyncSession, audit: Audit) -> None:
+        await audit_repository.delete(session, audit)
+
+
+audit_service = AuditService()
@@ -4,10 +4,15 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import verify_password, create_access_token, decode_token
+from app.core.passwords import password_hasher
+from app.core.principal import Principal, principal_cache
+from app.core.read_routing import SESSION_ON_REPLICA
+from app.core.security import create_access_token, decode_token
 from app.core.tenant import TenantContext, get_tenant_context
+from app.database import primary_reads
 from app.models.user import User
 from app.repositories.company import company_repository
+from app.repositories.load_profiles import LoadProfile
 from app.repositories.user import user_repository
 from app.schemas.auth import UserInResponse, TenantInResponse
 
@@ -57,8 +62,12 @@ class AuthService:
             return None, "Invalid credentials"
         if not user.is_active:
             return None, "User is disabled"
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = await password_hasher.verify_and_update(password, user.hashed_password)
+        if not valid:
             return None, "Invalid credentials"
+        if new_hash:
+            # Configured bcrypt cost changed: upgrade transparently, persisted with the request
+            user.hashed_password = new_hash
         return user, None
 
     def build_token_payload(self, user: User, company_slug: str | None = None) -> dict[str, Any]:
@@ -82,22 +91,71 @@ class AuthService:
         payload = decode_token(token)
         return get_tenant_context(payload)
 
+    @staticmethod
+    def _token_identity(payload: dict[str, Any] | None) -> tuple[uuid.UUID, uuid.UUID] | None:
+        """(user_id, company_id) from a decoded JWT, or None if malformed."""
+        if not payload or "sub" not in payload or "tenant_id" not in payload:
+            return None
+        try:
+            return uuid.UUID(payload["sub"]), uuid.UUID(payload["tenant_id"])
+        except (TypeError, ValueError):
+            return None
+
     async def get_user_from_token(
         self,
         session: AsyncSession,
         token: str,
     ) -> User | None:
         """Load current user from JWT; ensure user exists and belongs to token company."""
-        payload = decode_token(token)
-        if not payload or "sub" not in payload or "tenant_id" not in payload:
+        return await self.get_user_from_claims(session, decode_token(token))
+
+    async def get_user_from_claims(
+        self,
+        session: AsyncSession,
+        payload: dict[str, Any] | None,
+    ) -> User | None:
+        """Load current user from already-verified JWT claims (see deps.get_token_claims)."""
+        identity = self._token_identity(payload)
+        if identity is None:
             return None
-        try:
-            user_id = uuid.UUID(payload["sub"])
-            company_id = uuid.UUID(payload["tenant_id"])
-        except (TypeError, ValueError):
+        user_id, company_id = identity
+        user = await user_repository.get_by_id(
+            session, user_id, company_id, profile=LoadProfile.AUTH
+        )
+        if not user or not user.is_active:
             return None
-        user = await user_repository.get_by_id(session, user_id, company_id)
-        return user if user and user.is_active else None
+        if not session.info.get(SESSION_ON_REPLICA):
+            principal_cache.set((str(user_id), str(company_id)), Principal.from_user(user))
+        return user
+
+    async def get_principal_from_claims(
+        self,
+        session: AsyncSession,
+        payload: dict[str, Any] | None,
+    ) -> Principal | None:
+        """Resolve the caller's principal; served from the per-worker cache when warm."""
+        identity = self._token_identity(payload)
+        if identity is None:
+            return None
+        user_id, company_id = identity
+        key = (str(user_id), str(company_id))
+        principal = principal_cache.get(key)
+        if principal is None:
+            # Cached from the primary only: a lagging replica could undo a deactivation for a full TTL
+            async with primary_reads(session) as source:
+                user = await user_repository.get_by_id(
+                    source, user_id, company_id, profile=LoadProfile.AUTH
+                )
+            if not user:
+                return None
+            principal = Principal.from_user(user)
+            principal_cache.set(key, principal)
+        return principal if principal.is_active else None
+
+    def company_id_from_claims(self, payload: dict[str, Any] | None) -> uuid.UUID | None:
+        """Claims-only: company id from verified JWT claims, no DB or cache lookup."""
+        identity = self._token_identity(payload)
+        return identity[1] if identity else None
 
     @staticmethod
     def user_to_response(user: User) -> UserInResponse:
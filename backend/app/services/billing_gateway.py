@@ -0,0 +1,151 @@
+"""
+Async gateway to the Stripe API: the only place the app calls Stripe.
+
+The stripe SDK's module-level calls (stripe.Customer.create, ...) are synchronous and block
+the event loop for the whole round trip. BillingGateway uses the SDK's StripeClient with its
+async httpx transport instead: one pooled keep-alive client per worker with at most
+STRIPE_MAX_CONNECTIONS calls in flight (so at most that many connections), an upper bound on
+every call including the wait for a slot and SDK retries (STRIPE_TIMEOUT_SECONDS, overridable
+per call) and a circuit breaker, so an outage turns into fast BillingUnavailable (HTTP 503) instead
+of requests piling up behind timeouts. Errors Stripe answers with (card declined, invalid
+request) are raised unchanged and do not count against the breaker. STRIPE_API_BASE points the
+gateway at a local fake server (tests/fake_stripe.py) for tests and benchmarks.
+"""
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable
+
+from app.config import get_settings
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.instrumentation import Histogram
+
+try:
+    import httpx
+    import stripe
+except ImportError:  # Stripe is optional
+    httpx = stripe = None
+
+settings = get_settings()
+
+
+class BillingUnavailable(Exception):
+    """Stripe is unreachable, timing out or failing, or the circuit is open; retry later (HTTP 503)."""
+
+
+class BillingGateway:
+    def __init__(
+        self,
+        api_key: str,
+        api_base: str | None,
+        timeout: float,
+        connect_timeout: float,
+        max_connections: int,
+        max_network_retries: int,
+        breaker: CircuitBreaker,
+    ) -> None:
+        self.api_key = api_key
+        self.api_base = api_base
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_connections = max_connections
+        self.max_network_retries = max_network_retries
+        self.breaker = breaker
+        self.duration = Histogram()
+        self.failures = 0
+        self._http_client: Any = None
+        self._client: Any = None
+        # HTTPXClient takes no httpx limits; capping calls in flight bounds its pool the same way
+        self._slots = asyncio.Semaphore(max_connections)
+
+    @property
+    def configured(self) -> bool:
+        return stripe is not None and bool(self.api_key)
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            http_client = stripe.HTTPXClient(timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout))
+            self._http_client = http_client
+            self._client = stripe.StripeClient(
+                self.api_key,
+                http_client=http_client,
+                max_network_retries=self.max_network_retries,
+                base_addresses={"api": self.api_base} if self.api_base else None,
+            )
+        return self._client
+
+    async def _call(self, operation: str, call: Callable[..., Awaitable[Any]], timeout: float | None, **params: Any) -> Any:
+        if not self.configured:
+            raise BillingUnavailable("Stripe is not configured")
+        if not self.breaker.allow():
+            raise BillingUnavailable(f"Stripe circuit open; not calling {operation}")
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout or self.timeout), self._slots:
+                result = await call(params=params)
+        except (TimeoutError, stripe.APIConnectionError, stripe.RateLimitError, stripe.APIError) as e:
+            self.failures += 1
+            self.breaker.record_failure()
+            raise BillingUnavailable(f"Stripe {operation} failed: {type(e).__name__}") from e
+        except stripe.StripeError:
+            self.breaker.record_success()  # Stripe answered; the request itself was refused
+            raise
+        finally:
+            self.duration.observe((time.perf_counter() - started) * 1000)
+        self.breaker.record_success()
+        return result
+
+    async def create_customer(self, timeout: float | None = None, **params: Any) -> Any:
+        return await self._call("customers.create", self._get_client().v1.customers.create_async, timeout, **params)
+
+    async def update_customer(self, customer_id: str, timeout: float | None = None, **params: Any) -> Any:
+        client = self._get_client()
+        return await self._call(
+            "customers.update", lambda params: client.v1.customers.update_async(customer_id, params=params), timeout, **params
+        )
+
+    async def attach_payment_method(self, payment_method_id: str, timeout: float | None = None, **params: Any) -> Any:
+        client = self._get_client()
+        return await self._call(
+            "payment_methods.attach",
+            lambda params: client.v1.payment_methods.attach_async(payment_method_id, params=params),
+            timeout,
+            **params,
+        )
+
+    async def create_subscription(self, timeout: float | None = None, **params: Any) -> Any:
+        return await self._call("subscriptions.create", self._get_client().v1.subscriptions.create_async, timeout, **params)
+
+    async def create_checkout_session(self, timeout: float | None = None, **params: Any) -> Any:
+        return await self._call(
+            "checkout.sessions.create", self._get_client().v1.checkout.sessions.create_async, timeout, **params
+        )
+
+    async def create_portal_session(self, timeout: float | None = None, **params: Any) -> Any:
+        return await self._call(
+            "billing_portal.sessions.create", self._get_client().v1.billing_portal.sessions.create_async, timeout, **params
+        )
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "configured": self.configured,
+            "breaker": self.breaker.status(),
+            "failures": self.failures,
+            "duration_ms": self.duration.snapshot(),
+        }
+
+    async def close(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.close_async()
+            self._http_client = self._client = None
+
+
+billing_gateway = BillingGateway(
+    api_key=os.getenv("STRIPE_SECRET_KEY", ""),
+    api_base=settings.stripe_api_base,
+    timeout=settings.stripe_timeout_seconds,
+    connect_timeout=settings.stripe_connect_timeout_seconds,
+    max_connections=settings.stripe_max_connections,
+    max_network_retries=settings.stripe_max_network_retries,
+    breaker=CircuitBreaker(settings.stripe_breaker_failures, settings.stripe_breaker_reset_seconds),
+)
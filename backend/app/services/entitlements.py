@@ -0,0 +1,154 @@
+"""
+Plan entitlements: per-plan limits on projects, users and assets, enforced on create.
+
+Usage comes from the trigger-maintained tenant_stats counts (app/repositories/tenant_stats.py),
+so a check reads the tenant's counter rows instead of a COUNT(*), and creates and deletes need
+no bookkeeping of their own. A check under a limit holds a per-tenant, per-resource advisory
+lock until commit, so concurrent creates cannot both take the last slot; unlimited resources
+take no lock at all. The plan comes from the cached subscription state. While a paid
+subscription is lapsed (past_due, unpaid, ...) new usage is held to the free plan: exceeding it
+is 402 when paying would lift the limit, otherwise a plan limit is 403 with the smallest plan
+that fits.
+"""
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.tenant_stats import tenant_stats_repository
+from app.services.subscription import SubscriptionState, subscription_service
+
+
+class Resource(str, Enum):
+    PROJECTS = "projects"
+    USERS = "users"
+    ASSETS = "assets"
+
+
+FREE_PLAN = "start"
+# Cheapest first; a resource missing from a plan is unlimited. Keep in sync with PLANS in api/v1/billing.py
+PLAN_LIMITS: dict[str, dict[Resource, int]] = {
+    "start": {Resource.PROJECTS: 3, Resource.USERS: 1},
+    "basic": {Resource.PROJECTS: 10, Resource.USERS: 5},
+    "standard": {Resource.PROJECTS: 50, Resource.USERS: 25},
+    "premium": {},
+}
+# Subscription statuses in which the paid plan is not honoured for new usage
+LAPSED_STATUSES = frozenset({"past_due", "unpaid", "canceled", "incomplete", "incomplete_expired"})
+
+
+class EntitlementExceeded(Exception):
+    """A create would exceed the tenant's plan limit (HTTP 403), or its lapsed payment's (HTTP 402)."""
+
+    def __init__(
+        self,
+        resource: Resource,
+        limit: int,
+        usage: int,
+        plan_id: str,
+        payment_required: bool = False,
+        subscription_status: str | None = None,
+        upgrade_to: str | None = None,
+    ) -> None:
+        self.resource = resource
+        self.limit = limit
+        self.usage = usage
+        self.plan_id = plan_id
+        self.payment_required = payment_required
+        self.subscription_status = subscription_status
+        self.upgrade_to = upgrade_to
+        super().__init__(self.message)
+
+    @property
+    def status_code(self) -> int:
+        return 402 if self.payment_required else 403
+
+    @property
+    def message(self) -> str:
+        if self.payment_required:
+            return f"Subscription is {self.subscription_status}: limited to {self.limit} {self.resource.value} until payment succeeds"
+        return f"The {self.plan_id} plan allows {self.limit} {self.resource.value}"
+
+    def detail(self) -> dict[str, Any]:
+        return {
+            "code": "payment_required" if self.payment_required else "plan_limit_reached",
+            "message": self.message,
+            "resource": self.resource.value,
+            "limit": self.limit,
+            "usage": self.usage,
+            "plan_id": self.plan_id,
+            "subscription_status": self.subscription_status,
+            "upgrade_to": self.upgrade_to,
+        }
+
+
+def _plan_limits(plan_id: str) -> dict[Resource, int]:
+    return PLAN_LIMITS.get(plan_id, PLAN_LIMITS[FREE_PLAN])  # unknown or legacy ("free") plans get the free limits
+
+
+class EntitlementService:
+    def effective_plan(self, state: SubscriptionState, now: datetime | None = None) -> str:
+        """Plan whose limits apply to new usage right now."""
+        if state.status in LAPSED_STATUSES or state.trial_expired(now or datetime.now(timezone.utc)):
+            return FREE_PLAN
+        return state.plan_id
+
+    async def _usage(self, session: AsyncSession, company_id: uuid.UUID, resources: list[Resource]) -> dict[str, int]:
+        counts = await tenant_stats_repository.counts(session, company_id, [r.value for r in resources])
+        return {entity: sum(by_status.values()) for entity, by_status in counts.items()}
+
+    async def consume(
+        self, session: AsyncSession, company_id: uuid.UUID, resource: Resource, n: int = 1
+    ) -> None:
+        """
+        Check that n more resource rows fit the plan, before inserting them in this transaction;
+        raises EntitlementExceeded instead. The triggers count the rows once they are inserted.
+        """
+        state = await subscription_service.get(session, company_id)
+        effective = self.effective_plan(state)
+        limit = _plan_limits(effective).get(resource)
+        if limit is None:
+            return
+        await tenant_stats_repository.lock_counter(session, company_id, resource.value)
+        current = (await self._usage(session, company_id, [resource]))[resource.value]
+        if current + n <= limit:
+            return
+
+        nominal = _plan_limits(state.plan_id).get(resource)
+        payment_required = effective != state.plan_id and state.status in LAPSED_STATUSES and (
+            nominal is None or current + n <= nominal
+        )
+        raise EntitlementExceeded(
+            resource,
+            limit=limit,
+            usage=current,
+            plan_id=state.plan_id if payment_required else effective,
+            payment_required=payment_required,
+            subscription_status=state.status,
+            upgrade_to=None if payment_required else self._upgrade_for(resource, current + n),
+        )
+
+    async def usage(self, session: AsyncSession, company_id: uuid.UUID) -> dict[str, Any]:
+        """Plan, usage and limits for display."""
+        state = await subscription_service.get(session, company_id)
+        effective = self.effective_plan(state)
+        counts = await self._usage(session, company_id, list(Resource))
+        limits = _plan_limits(effective)
+        return {
+            "plan_id": state.plan_id,
+            "effective_plan_id": effective,
+            "usage": counts,
+            "limits": {r.value: limits.get(r) for r in Resource},
+        }
+
+    def _upgrade_for(self, resource: Resource, needed: int) -> str | None:
+        for plan_id, limits in PLAN_LIMITS.items():
+            limit = limits.get(resource)
+            if limit is None or limit >= needed:
+                return plan_id
+        return None
+
+
+entitlement_service = EntitlementService()
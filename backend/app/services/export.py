@@ -0,0 +1,91 @@
+"""
+Streaming exports: rows from a server-side cursor encoded as NDJSON or CSV, batch by batch.
+
+Repositories yield batches of plain rows (selected columns, no ORM objects, nothing kept in the
+session); each batch becomes one bytes chunk for StreamingResponse. Memory therefore depends on
+the batch size (export_batch_rows), not on the number of rows exported. stream() reads them in a
+session of its own, open only while the body is iterated, so the body does not depend on the
+request's session outliving the endpoint. The CSV layout matches
+POST /assets/import (header row, metadata as JSON), so an asset export can be imported again.
+"""
+import csv
+import io
+import json
+import re
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+from urllib.parse import quote
+
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+def content_disposition(filename: str) -> str:
+    """
+    attachment header for a filename that may hold client-supplied text: the filename parameter
+    gets an ASCII-safe copy (headers are latin-1, quotes would end the value) and, when that
+    differs, filename* carries the original UTF-8 name (RFC 6266).
+    """
+    fallback = re.sub(r"[^A-Za-z0-9._-]", "_", filename)
+    if fallback == filename:
+        return f'attachment; filename="{filename}"'
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        return "application/x-ndjson" if self is ExportFormat.NDJSON else "text/csv; charset=utf-8"
+
+
+Batches = AsyncIterator[Sequence[Mapping[str, Any]]]
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+async def _ndjson(batches: Batches) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield b"".join(to_json(dict(row)) + b"\n" for row in batch)
+
+
+async def _csv(batches: Batches, columns: Sequence[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    async for batch in batches:
+        writer.writerows([_csv_value(row[c]) for c in columns] for row in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():  # header only: nothing matched
+        yield buffer.getvalue().encode()
+
+
+def encode(batches: Batches, fmt: ExportFormat, columns: Sequence[str]) -> AsyncIterator[bytes]:
+    """Body chunks for StreamingResponse; columns fixes the CSV header (NDJSON keeps row keys)."""
+    return _csv(batches, columns) if fmt is ExportFormat.CSV else _ndjson(batches)
+
+
+async def stream(
+    sessionmaker: async_sessionmaker[AsyncSession],
+    batches: Callable[[AsyncSession], Batches],
+    fmt: ExportFormat,
+    columns: Sequence[str],
+) -> AsyncIterator[bytes]:
+    """encode() over batches(session); the session opens on the first chunk and closes after the last."""
+    async with sessionmaker() as session:
+        async for chunk in encode(batches(session), fmt, columns):
+            yield chunk
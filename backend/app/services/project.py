@@ -1,18 +1,25 @@
 """Project service: CRUD scoped by company_id (multi-tenant isolation)."""
 import uuid
+from collections.abc import AsyncIterator
 from datetime import date
-from typing import Sequence
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.config import get_settings
 from app.models.project import Project
-from app.repositories.project import project_repository
+from app.repositories.pagination import CountMode, Cursor, Page
+from app.repositories.search import SearchMode
+from app.repositories.project import EXPORT_COLUMNS, project_repository
+from app.services.entitlements import Resource, entitlement_service
+from app.services.export import Batches, ExportFormat, stream
+
+settings = get_settings()
 
 
 class ProjectService:
     """All operations use company_id from tenant context; never from request body."""
 
-    async def list(
+    async def page(
         self,
         session: AsyncSession,
         company_id: uuid.UUID,
@@ -20,21 +27,46 @@ class ProjectService:
         limit: int = 100,
         status: str | None = None,
         search: str | None = None,
-    ) -> Sequence[Project]:
-        return await project_repository.list_by_company(
-            session, company_id, skip=skip, limit=limit, status=status, search=search
+        search_mode: SearchMode = SearchMode.CONTAINS,
+        keyset: bool = False,
+        after: Cursor | None = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> Page[Project]:
+        return await project_repository.page_by_company(
+            session,
+            company_id,
+            skip=skip,
+            limit=limit,
+            status=status,
+            search=search,
+            search_mode=search_mode,
+            keyset=keyset,
+            after=after,
+            count=count,
         )
 
-    async def count(
+    def export(
         self,
-        session: AsyncSession,
+        sessionmaker: async_sessionmaker[AsyncSession],
         company_id: uuid.UUID,
+        fmt: ExportFormat,
         status: str | None = None,
         search: str | None = None,
-    ) -> int:
-        return await project_repository.count_by_company(
-            session, company_id, status=status, search=search
-        )
+        search_mode: SearchMode = SearchMode.CONTAINS,
+    ) -> AsyncIterator[bytes]:
+        """Body chunks of an export of every matching project; nothing runs until it is iterated."""
+
+        def batches(session: AsyncSession) -> Batches:
+            return project_repository.stream_by_company(
+                session,
+                company_id,
+                status=status,
+                search=search,
+                search_mode=search_mode,
+                batch_size=settings.export_batch_rows,
+            )
+
+        return stream(sessionmaker, batches, fmt, [c.key for c in EXPORT_COLUMNS])
 
     async def get_by_id(
         self,
@@ -58,6 +90,7 @@ class ProjectService:
         start_date: date | None = None,
         end_date: date | None = None,
     ) -> Project:
+        await entitlement_service.consume(session, company_id, Resource.PROJECTS)
         return await project_repository.create(
             session,
             company_id=company_id,
@@ -0,0 +1,165 @@
+"""RFQ service: RFQs with their line items, scoped by company_id (multi-tenant isolation)."""
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.models.rfq import Rfq, RfqLineItem
+from app.repositories.pagination import CountMode, Cursor, Page
+from app.repositories.project import project_repository
+from app.repositories.rfq import LINE_ITEM_EXPORT_COLUMNS, RfqNumberTaken, rfq_line_item_repository, rfq_repository
+from app.services.export import Batches, ExportFormat, stream
+from app.services.rfq_numbers import rfq_number_allocator
+
+settings = get_settings()
+# Allocated numbers to try when earlier ones are taken by RFQs numbered by hand
+ALLOCATION_ATTEMPTS = 10
+
+
+class RfqProjectNotFound(LookupError):
+    """project_id is not a project of this company (HTTP 404)."""
+
+
+class RfqService:
+    """All operations use company_id from tenant context; never from request body."""
+
+    async def _project_id(
+        self, session: AsyncSession, company_id: uuid.UUID, project_id: str | None
+    ) -> uuid.UUID | None:
+        if project_id is None:
+            return None
+        try:
+            parsed = uuid.UUID(str(project_id))
+        except ValueError:
+            raise RfqProjectNotFound("Project not found") from None
+        if not await project_repository.existing_ids(session, company_id, [parsed]):
+            raise RfqProjectNotFound("Project not found")
+        return parsed
+
+    async def page(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        project_id: uuid.UUID | None = None,
+        status: str | None = None,
+        keyset: bool = False,
+        after: Cursor | None = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> Page[Rfq]:
+        return await rfq_repository.page_by_company(
+            session,
+            company_id,
+            skip=skip,
+            limit=limit,
+            project_id=project_id,
+            status=status,
+            keyset=keyset,
+            after=after,
+            count=count,
+        )
+
+    async def get_by_id(self, session: AsyncSession, rfq_id: uuid.UUID, company_id: uuid.UUID) -> Rfq | None:
+        return await rfq_repository.get_by_id(session, rfq_id, company_id)
+
+    async def create(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        created_by: uuid.UUID | None,
+        values: dict[str, Any],
+        line_items: Sequence[dict[str, Any]],
+    ) -> Rfq:
+        """
+        The RFQ (one INSERT) and its line items (one multi-row upsert per rfq_line_item_batch_rows).
+        Without an rfq_number the next one is allocated (see rfq_numbers.py).
+        """
+        values["project_id"] = await self._project_id(session, company_id, values.get("project_id"))
+        if values.get("rfq_number") is not None:
+            rfq = await rfq_repository.create(session, company_id, created_by=created_by, **values)
+        else:
+            rfq = await self._create_numbered(session, company_id, created_by, values)
+        await rfq_line_item_repository.upsert_many(
+            session, company_id, rfq.id, line_items, batch_rows=settings.rfq_line_item_batch_rows
+        )
+        return rfq
+
+    async def _create_numbered(
+        self, session: AsyncSession, company_id: uuid.UUID, created_by: uuid.UUID | None, values: dict[str, Any]
+    ) -> Rfq:
+        for _ in range(ALLOCATION_ATTEMPTS):
+            values["rfq_number"] = await rfq_number_allocator.next_number(company_id)
+            try:
+                return await rfq_repository.create(session, company_id, created_by=created_by, **values)
+            except RfqNumberTaken:
+                continue  # taken by hand; allocated numbers never collide with each other
+        raise RfqNumberTaken(values["rfq_number"])
+
+    async def replace(
+        self,
+        session: AsyncSession,
+        rfq: Rfq,
+        company_id: uuid.UUID,
+        values: dict[str, Any],
+        line_items: Sequence[dict[str, Any]],
+    ) -> Rfq:
+        """
+        Overwrite the RFQ's fields and make its lines exactly line_items: lines not sent are deleted
+        in one statement, the rest upserted by line_number (unchanged lines are not rewritten).
+        """
+        values["project_id"] = await self._project_id(session, company_id, values.get("project_id"))
+        if values.get("rfq_number") is None:
+            values.pop("rfq_number", None)  # keep the allocated number
+        rfq = await rfq_repository.update(session, rfq, **values)
+        await rfq_line_item_repository.delete_except(
+            session, company_id, rfq.id, [item["line_number"] for item in line_items]
+        )
+        await rfq_line_item_repository.upsert_many(
+            session, company_id, rfq.id, line_items, batch_rows=settings.rfq_line_item_batch_rows
+        )
+        return rfq
+
+    async def update(self, session: AsyncSession, rfq: Rfq, company_id: uuid.UUID, values: dict[str, Any]) -> Rfq:
+        """Change the given RFQ fields only; line items are untouched."""
+        if "rfq_number" in values and values["rfq_number"] is None:
+            del values["rfq_number"]  # numbers can be changed, not removed
+        if values.get("project_id") is not None:
+            values["project_id"] = await self._project_id(session, company_id, values["project_id"])
+        return await rfq_repository.update(session, rfq, **values)
+
+    async def delete(self, session: AsyncSession, rfq: Rfq) -> None:
+        await rfq_repository.delete(session, rfq)
+
+    async def line_items(
+        self,
+        session: AsyncSession,
+        company_id: uuid.UUID,
+        rfq_id: uuid.UUID,
+        limit: int = 100,
+        after_line: int | None = None,
+    ) -> Page[RfqLineItem]:
+        return await rfq_line_item_repository.page_by_rfq(
+            session, company_id, rfq_id, limit=limit, after_line=after_line
+        )
+
+    def export_line_items(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        company_id: uuid.UUID,
+        rfq_id: uuid.UUID,
+        fmt: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """Body chunks of every line item of the RFQ; nothing runs until it is iterated."""
+
+        def batches(session: AsyncSession) -> Batches:
+            return rfq_line_item_repository.stream_by_rfq(
+                session, company_id, rfq_id, batch_size=settings.export_batch_rows
+            )
+
+        return stream(sessionmaker, batches, fmt, [c.key for c in LINE_ITEM_EXPORT_COLUMNS])
+
+
+rfq_service = RfqService()
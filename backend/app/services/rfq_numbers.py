@@ -0,0 +1,80 @@
+"""
+Server-side rfq_number allocation: per-company sequences, reserved in blocks per worker.
+
+Each worker keeps a block of reserved numbers per company and hands them out from memory; only
+when a block runs out does it reserve the next rfq_number_block_size numbers, in a short
+transaction of its own that commits at once. Concurrent creates therefore never wait on a
+row lock held by another request and never collide on uq_rfqs_company_rfq_number with each
+other (the rfqs tenant_stats trigger only appends a delta row, so it adds no lock). The price
+is gaps (numbers left in a block when a worker stops, or used by a create that rolled back)
+and, across workers, numbers that are unique but not in creation order.
+rfq_number_block_size=1 keeps numbers nearly gapless at one reservation per create.
+
+rfq_number_format is a str.format template with {seq} and optionally {year} (UTC). With
+{year} every year has its own sequence starting at 1, e.g. RFQ-{year}-{seq:06d} -> RFQ-2026-000123.
+"""
+import asyncio
+import string
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.repositories.rfq_number_sequence import rfq_number_sequence_repository
+
+settings = get_settings()
+
+
+def _fields(number_format: str) -> set[str]:
+    try:
+        fields = {name for _, name, _, _ in string.Formatter().parse(number_format) if name is not None}
+        number_format.format(year=2026, seq=1)
+    except (ValueError, KeyError, IndexError) as e:
+        raise ValueError(f"Invalid rfq_number_format {number_format!r}: {e}") from None
+    if "seq" not in fields:
+        raise ValueError(f"rfq_number_format {number_format!r} has no {{seq}} field")
+    return fields
+
+
+class RfqNumberAllocator:
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession], number_format: str, block_size: int) -> None:
+        self.sessionmaker = sessionmaker
+        self.number_format = number_format
+        self.yearly = "year" in _fields(number_format)
+        self.block_size = max(block_size, 1)
+        # (company_id, period) -> [next number, end of block (exclusive)]
+        self._blocks: dict[tuple[uuid.UUID, int], list[int]] = {}
+        self._locks: dict[tuple[uuid.UUID, int], asyncio.Lock] = {}
+
+    def period(self) -> int:
+        return datetime.now(timezone.utc).year if self.yearly else 0
+
+    def render(self, period: int, seq: int) -> str:
+        return self.number_format.format(year=period, seq=seq)
+
+    async def next_number(self, company_id: uuid.UUID) -> str:
+        key = (company_id, self.period())
+        block = self._blocks.get(key)
+        if block is None or block[0] >= block[1]:
+            async with self._locks.setdefault(key, asyncio.Lock()):
+                block = self._blocks.get(key)
+                if block is None or block[0] >= block[1]:  # not refilled while we waited
+                    block = await self._reserve(*key)
+        seq = block[0]
+        block[0] += 1
+        return self.render(key[1], seq)
+
+    async def _reserve(self, company_id: uuid.UUID, period: int) -> list[int]:
+        async with self.sessionmaker() as session:
+            first = await rfq_number_sequence_repository.reserve(session, company_id, period, self.block_size)
+            await session.commit()
+        block = [first, first + self.block_size]
+        self._blocks[(company_id, period)] = block
+        return block
+
+
+rfq_number_allocator = RfqNumberAllocator(
+    AsyncSessionLocal, settings.rfq_number_format, settings.rfq_number_block_size
+)
@@ -0,0 +1,106 @@
+"""
+Stripe webhook events: queue once, then apply to the tenant's subscription in Stripe's order.
+
+Stripe delivers at least once and in no particular order. The webhook only records each event
+in stripe_events by its id (a redelivery is reported as a duplicate and not queued again); the
+inbox processor (app/services/stripe_inbox.py) applies it later. Plan and status columns each
+apply only when the event is not older than the last one that wrote them for that tenant.
+"""
+import logging
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.stripe_event import StripeEvent
+from app.repositories.company import company_repository
+from app.repositories.stripe_event import stripe_event_repository
+from app.services.subscription import subscription_service
+
+logger = logging.getLogger(__name__)
+
+
+class EventOutcome(str, Enum):
+    APPLIED = "applied"
+    STALE = "stale"  # older than the tenant's last applied event for every column it sets
+    IGNORED = "ignored"  # unhandled type, or no tenant to apply it to
+    DUPLICATE = "duplicate"  # already recorded
+    FAILED = "failed"  # processing kept raising; gave up after stripe_inbox_max_attempts
+
+
+def _metadata_company_id(data: dict[str, Any]) -> uuid.UUID | None:
+    """tenant_id we put into Stripe metadata; None when absent or not a UUID."""
+    try:
+        return uuid.UUID((data.get("metadata") or {}).get("tenant_id"))
+    except (TypeError, ValueError):
+        return None
+
+
+class StripeEventService:
+    async def receive(self, session: AsyncSession, event: dict[str, Any]) -> bool:
+        """Queue one verified event (a plain dict parsed from the webhook body); False for a duplicate."""
+        created_at = datetime.fromtimestamp(event["created"], tz=timezone.utc)
+        return await stripe_event_repository.record(session, event["id"], event["type"], created_at, event)
+
+    async def apply(self, session: AsyncSession, event: StripeEvent) -> EventOutcome:
+        """Apply a queued event to its tenant's subscription and mark it processed."""
+        data = event.payload["data"]["object"]
+        company_id, changes = await self._changes(session, event.type, data)
+        if company_id is not None and await company_repository.get_by_id(session, company_id) is None:
+            company_id = None  # metadata naming a deleted company; FKs would fail on every retry
+        if company_id is None or changes is None:
+            outcome = EventOutcome.IGNORED
+        else:
+            state = await subscription_service.apply_event(session, company_id, event.stripe_created_at, **changes)
+            outcome = EventOutcome.APPLIED if state is not None else EventOutcome.STALE
+            if event.type == "checkout.session.completed" and data.get("customer"):
+                await subscription_service.set_customer(session, company_id, data["customer"])
+        await stripe_event_repository.complete(session, event.id, outcome.value, company_id)
+        if outcome is EventOutcome.APPLIED and event.type == "invoice.payment_failed":
+            logger.warning(f"[Billing] Tenant {company_id} payment failed — marked past_due")
+        return outcome
+
+    async def _changes(
+        self, session: AsyncSession, event_type: str, data: dict[str, Any]
+    ) -> tuple[uuid.UUID | None, dict[str, Any] | None]:
+        """Which tenant the event is about and the subscription columns it sets (None: nothing to apply)."""
+        if event_type == "checkout.session.completed":
+            plan_id = (data.get("metadata") or {}).get("plan_id")
+            if not plan_id:
+                return _metadata_company_id(data), None
+            return _metadata_company_id(data), {
+                "plan_id": plan_id,
+                "status": "active",
+                "trial_ends_at": None,
+                "stripe_subscription_id": data.get("subscription"),
+            }
+
+        if event_type == "customer.subscription.updated":
+            period_end = data.get("current_period_end")
+            return _metadata_company_id(data), {
+                "status": data.get("status", "active"),
+                "cancel_at_period_end": data.get("cancel_at_period_end", False),
+                "current_period_end": datetime.fromtimestamp(period_end, tz=timezone.utc) if period_end else None,
+            }
+
+        if event_type == "customer.subscription.deleted":
+            return _metadata_company_id(data), {
+                "plan_id": "start",
+                "status": "active",
+                "cancel_at_period_end": False,
+                "current_period_end": None,
+                "trial_ends_at": None,
+                "stripe_subscription_id": None,
+            }
+
+        if event_type == "invoice.payment_failed":
+            customer_id = data.get("customer")
+            company_id = await subscription_service.company_for_customer(session, customer_id) if customer_id else None
+            return company_id, {"status": "past_due"}
+
+        return None, None
+
+
+stripe_event_service = StripeEventService()
@@ -0,0 +1,94 @@
+"""
+Background processor for the Stripe webhook inbox (stripe_events rows with processed_at NULL).
+
+Every worker runs one (started in the app lifespan). Each pass claims a batch with FOR UPDATE
+SKIP LOCKED, so workers share the backlog without waiting on each other, and applies each event
+in its own savepoint: a failing event is rescheduled with exponential backoff (and given up as
+"failed" after stripe_inbox_max_attempts) without undoing the rest of the batch. A NOTIFY from
+the webhook wakes the processors immediately; stripe_inbox_poll_seconds covers lost
+notifications and due retries.
+"""
+import asyncio
+import logging
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.core.notifications import PgListener, notification_listener
+from app.database import AsyncSessionLocal
+from app.repositories.stripe_event import INBOX_CHANNEL, stripe_event_repository
+from app.services.stripe_events import stripe_event_service
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class StripeInboxProcessor:
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession], listener: PgListener) -> None:
+        self.sessionmaker = sessionmaker
+        self.batch_size = settings.stripe_inbox_batch_size
+        self.poll_seconds = settings.stripe_inbox_poll_seconds
+        self.max_attempts = settings.stripe_inbox_max_attempts
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        listener.subscribe(INBOX_CHANNEL, lambda _: self._wakeup.set(), self._wakeup.set)
+
+    def retry_delay(self, attempts: int) -> timedelta:
+        """Backoff after the n-th failed attempt: base, 2x base, 4x base ... capped."""
+        seconds = settings.stripe_inbox_retry_base_seconds * 2 ** (attempts - 1)
+        return timedelta(seconds=min(seconds, settings.stripe_inbox_retry_max_seconds))
+
+    async def drain_once(self) -> int:
+        """Claim and process one batch; returns how many events were claimed."""
+        async with self.sessionmaker() as session:
+            events = await stripe_event_repository.claim_due(session, self.batch_size)
+            for event in events:
+                # Read before the savepoint: a rollback expires the instance
+                event_id, attempts = event.id, event.attempts + 1
+                try:
+                    async with session.begin_nested():
+                        await stripe_event_service.apply(session, event)
+                except Exception as e:
+                    give_up = attempts >= self.max_attempts
+                    retry_in = None if give_up else self.retry_delay(attempts)
+                    await stripe_event_repository.reschedule(session, event_id, f"{type(e).__name__}: {e}", retry_in)
+                    logger.log(
+                        logging.ERROR if give_up else logging.WARNING,
+                        "[Billing] Stripe event %s failed (attempt %d/%d)%s: %s",
+                        event_id, attempts, self.max_attempts, "; giving up" if give_up else f"; retry in {retry_in}", e,
+                    )
+            await session.commit()
+        return len(events)
+
+    async def run(self) -> None:
+        while True:
+            self._wakeup.clear()  # a NOTIFY arriving while we drain makes the wait below return at once
+            try:
+                claimed = await self.drain_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # database down etc.: keep the loop alive, try again after the poll interval
+                logger.exception("[Billing] Stripe inbox pass failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+                except TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name="stripe-inbox")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+stripe_inbox = StripeInboxProcessor(AsyncSessionLocal, notification_listener)
@@ -0,0 +1,115 @@
+"""
+Subscription service: billing state per company, read through a per-worker cache.
+
+The cache is only used while this worker's LISTEN connection is up: every write notifies
+SUBSCRIPTION_CHANNEL on commit and each worker drops that company's entry, so webhook updates
+reach all workers within milliseconds. billing_cache_ttl_seconds bounds staleness if that
+ever fails silently. Entries are only filled from the primary, never from a lagging replica.
+Without the listener (scripts, tests) every lookup reads the database.
+"""
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.core.cache import TTLCache
+from app.core.notifications import PgListener, notification_listener
+from app.database import primary_reads
+from app.models.subscription import Subscription
+from app.repositories.subscription import SUBSCRIPTION_CHANNEL, subscription_repository
+
+settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriptionState:
+    """Immutable snapshot of a company's billing state; the default is the free plan."""
+    plan_id: str = "start"
+    status: str = "active"
+    current_period_end: datetime | None = None
+    cancel_at_period_end: bool = False
+    trial_ends_at: datetime | None = None
+    stripe_customer_id: str | None = None
+
+    @classmethod
+    def from_model(cls, subscription: Subscription | None) -> "SubscriptionState":
+        if subscription is None:
+            return cls()
+        return cls(
+            plan_id=subscription.plan_id,
+            status=subscription.status,
+            current_period_end=subscription.current_period_end,
+            cancel_at_period_end=subscription.cancel_at_period_end,
+            trial_ends_at=subscription.trial_ends_at,
+            stripe_customer_id=subscription.stripe_customer_id,
+        )
+
+    def trial_expired(self, now: datetime) -> bool:
+        return self.status == "trialing" and self.trial_ends_at is not None and self.trial_ends_at < now
+
+
+class SubscriptionService:
+    def __init__(self, listener: PgListener) -> None:
+        self.listener = listener
+        # Key: company id as sent in the NOTIFY payload
+        self.cache: TTLCache[str, SubscriptionState] = TTLCache(
+            maxsize=settings.billing_cache_size,
+            ttl=settings.billing_cache_ttl_seconds,
+        )
+        # Bumped on every invalidation; a lookup only caches what it read if nothing changed meanwhile
+        self._generation = 0
+        listener.subscribe(SUBSCRIPTION_CHANNEL, self.invalidate, self.invalidate_all)
+
+    def invalidate(self, company_id: str) -> None:
+        self._generation += 1
+        self.cache.pop(company_id)
+
+    def invalidate_all(self) -> None:
+        self._generation += 1
+        self.cache.clear()
+
+    async def get(self, session: AsyncSession, company_id: uuid.UUID) -> SubscriptionState:
+        key = str(company_id)
+        if self.listener.connected:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            # Filled from the primary only: a lagging replica could bring back pre-webhook state
+            generation = self._generation
+            async with primary_reads(session) as source:
+                state = SubscriptionState.from_model(await subscription_repository.get_by_company(source, company_id))
+            if self.listener.connected and generation == self._generation:
+                self.cache.set(key, state)
+            return state
+        return SubscriptionState.from_model(await subscription_repository.get_by_company(session, company_id))
+
+    async def update(self, session: AsyncSession, company_id: uuid.UUID, **values: Any) -> SubscriptionState:
+        """Upsert; this worker forgets its entry now, the others on commit (the write notifies)."""
+        subscription = await subscription_repository.upsert(session, company_id, **values)
+        self.invalidate(str(company_id))
+        return SubscriptionState.from_model(subscription)
+
+    async def apply_event(
+        self, session: AsyncSession, company_id: uuid.UUID, event_at: datetime, **values: Any
+    ) -> SubscriptionState | None:
+        """Upsert for a webhook event; None (nothing written) when a newer event was already applied."""
+        subscription = await subscription_repository.upsert_if_newer(session, company_id, event_at, **values)
+        if subscription is None:
+            return None
+        self.invalidate(str(company_id))
+        return SubscriptionState.from_model(subscription)
+
+    async def set_customer(self, session: AsyncSession, company_id: uuid.UUID, stripe_customer_id: str) -> str:
+        stored = await subscription_repository.set_customer(session, company_id, stripe_customer_id)
+        self.invalidate(str(company_id))
+        return stored
+
+    async def company_for_customer(self, session: AsyncSession, stripe_customer_id: str) -> uuid.UUID | None:
+        subscription = await subscription_repository.get_by_customer(session, stripe_customer_id)
+        return subscription.company_id if subscription is not None else None
+
+
+subscription_service = SubscriptionService(notification_listener)
@@ -0,0 +1,108 @@
+"""
+Dashboard counts from tenant_stats, and the worker that compacts and reconciles them.
+
+Writes never touch tenant_stats: the tracking triggers append tenant_stat_deltas rows, so a
+tenant's concurrent writes (a 10k-row import included) never wait on a shared counter row.
+Every worker runs a TenantStatsWorker (started in the app lifespan); one at a time, under a
+transaction-scoped advisory lock, it folds deltas into tenant_stats every
+tenant_stats_compact_seconds, which keeps the reads short. Every tenant_stats_reconcile_seconds
+it also recounts the next tenant_stats_reconcile_batch_size companies from the tracked tables as a
+safety net for writes that skipped the triggers (session_replication_role = replica, restores,
+manual fixes), logging any drift it repairs.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.repositories.tenant_stats import tenant_stats_repository
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class TenantStatsService:
+    async def summary(self, session: AsyncSession, company_id: uuid.UUID) -> dict[str, Any]:
+        """{table: {"total", "by_status"}} for each tracked table, from one statement."""
+        counts = await tenant_stats_repository.counts(session, company_id)
+        return {
+            entity: {"total": sum(by_status.values()), "by_status": by_status} for entity, by_status in counts.items()
+        }
+
+
+class TenantStatsWorker:
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+        self.sessionmaker = sessionmaker
+        self.compact_seconds = settings.tenant_stats_compact_seconds
+        self.compact_batch_rows = settings.tenant_stats_compact_batch_rows
+        self.reconcile_seconds = settings.tenant_stats_reconcile_seconds
+        self.reconcile_batch_size = settings.tenant_stats_reconcile_batch_size
+        self._reconcile_after: uuid.UUID | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def compact_once(self) -> int:
+        """Fold up to compact_batch_rows deltas; 0 also when another worker is compacting."""
+        async with self.sessionmaker() as session:
+            if not await tenant_stats_repository.try_lock_jobs(session):
+                return 0
+            folded = await tenant_stats_repository.compact(session, self.compact_batch_rows)
+            await session.commit()
+        return folded
+
+    async def reconcile_once(self) -> int:
+        """Recount the next reconcile_batch_size companies (wrapping around); returns how many."""
+        async with self.sessionmaker() as session:
+            company_ids = await tenant_stats_repository.company_ids_after(
+                session, self._reconcile_after, self.reconcile_batch_size
+            )
+        recounted = 0
+        for company_id in company_ids:
+            async with self.sessionmaker() as session:
+                if not await tenant_stats_repository.try_lock_jobs(session):
+                    return recounted  # another worker is busy; resume from here next pass
+                before, after = await tenant_stats_repository.recount(session, company_id)
+                await session.commit()
+            self._reconcile_after = company_id
+            recounted += 1
+            if before != after:
+                logger.warning("[Dashboard] tenant_stats drift repaired for company %s: %s -> %s", company_id, before, after)
+        if len(company_ids) < self.reconcile_batch_size:
+            self._reconcile_after = None  # reached the last company: start over
+        return recounted
+
+    async def run(self) -> None:
+        next_reconcile = time.monotonic() + self.reconcile_seconds
+        while True:
+            try:
+                while await self.compact_once() >= self.compact_batch_rows:
+                    pass
+                if time.monotonic() >= next_reconcile:
+                    next_reconcile = time.monotonic() + self.reconcile_seconds
+                    await self.reconcile_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # database down etc.: keep the loop alive, try again after the interval
+                logger.exception("[Dashboard] tenant_stats maintenance pass failed")
+            await asyncio.sleep(self.compact_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name="tenant-stats-worker")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+tenant_stats_service = TenantStatsService()
+tenant_stats_worker = TenantStatsWorker(AsyncSessionLocal)
@@ -4,10 +4,13 @@ from typing import Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash
+from app.core.principal import invalidate_principal
+from app.core.passwords import password_hasher
 from app.models.user import User
+from app.repositories.load_profiles import LoadProfile
 from app.repositories.user import user_repository
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.entitlements import Resource, entitlement_service
 
 
 class UserService:
@@ -34,14 +37,19 @@ class UserService:
         company_id: uuid.UUID,
         data: UserCreate,
     ) -> User:
-        existing = await user_repository.get_by_email(session, data.email, company_id)
+        existing = await user_repository.get_by_email(
+            session, data.email, company_id, profile=LoadProfile.LIST
+        )
         if existing:
             raise ValueError("User with this email already exists in this company")
+        hashed_password = await password_hasher.hash(data.password)
+        # After hashing: a limited plan's user-count lock is held from here until commit
+        await entitlement_service.consume(session, company_id, Resource.USERS)
         return await user_repository.create(
             session,
             company_id=company_id,
             email=data.email,
-            hashed_password=get_password_hash(data.password),
+            hashed_password=hashed_password,
             full_name=data.full_name,
             role_id=data.role_id,
         )
@@ -54,14 +62,18 @@ class UserService:
     ) -> User:
         updates = data.model_dump(exclude_unset=True)
         if "password" in updates and updates["password"]:
-            updates["hashed_password"] = get_password_hash(updates.pop("password"))
+            updates["hashed_password"] = await password_hasher.hash(updates.pop("password"))
         if "password" in updates:
             del updates["password"]
-        return await user_repository.update(session, user, **updates)
+        user = await user_repository.update(session, user, **updates)
+        # Role / active flag may have changed: the first request after commit re-resolves the principal
+        invalidate_principal(session, user.id, user.company_id)
+        return user
 
     async def delete(self, session: AsyncSession, user: User) -> None:
         await session.delete(user)
         await session.flush()
+        invalidate_principal(session, user.id, user.company_id)
 
 
 user_service = UserService()
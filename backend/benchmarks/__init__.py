@@ -0,0 +1 @@
+# Microbenchmarks: run from backend/ as `python -m benchmarks.<name>`
@@ -0,0 +1,72 @@
+"""
+Per-request JWT cost: before (middleware + dependency each verify) vs after (verify once, cache repeats).
+
+    cd backend && python -m benchmarks.jwt_verification [--requests 20000]
+
+No database needed; measures only token verification and claim parsing.
+"""
+import argparse
+import time
+
+import jwt
+
+from app.core import security
+from app.core.security import create_access_token, decode_token
+
+
+def _uncached_decode(token: str) -> dict | None:
+    try:
+        return jwt.decode(token, security.settings.jwt_secret_key, algorithms=[security.settings.jwt_algorithm])
+    except jwt.PyJWTError:
+        return None
+
+
+def _per_request_us(fn, token: str, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        fn(token)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def before(token: str) -> None:
+    """Old path: middleware decodes, then get_current_user decodes the same token again."""
+    _uncached_decode(token)
+    _uncached_decode(token)
+
+
+def after_cold(token: str) -> None:
+    """New path, first request for a token: one verification, the dependency reuses request.state."""
+    security._verified_tokens.clear()
+    decode_token(token)
+
+
+def after_warm(token: str) -> None:
+    """New path, repeat request from the same client: digest lookup only."""
+    decode_token(token)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    token = create_access_token(
+        subject="6f1c2a8e-0000-4000-8000-000000000001",
+        tenant_id="6f1c2a8e-0000-4000-8000-000000000002",
+        role="admin",
+        extra={"tenant_slug": "acme"},
+    )
+    decode_token(token)  # warm imports / cache
+
+    results = {
+        "before (2x verify)": _per_request_us(before, token, args.requests),
+        "after, cold token (1x verify)": _per_request_us(after_cold, token, args.requests),
+        "after, warm token (cache hit)": _per_request_us(after_warm, token, args.requests),
+    }
+    baseline = results["before (2x verify)"]
+    for name, us in results.items():
+        print(f"{name:32s} {us:8.2f} us/request   {baseline / us:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
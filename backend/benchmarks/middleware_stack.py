@@ -0,0 +1,113 @@
+"""
+Middleware overhead under concurrent load: @app.middleware("http") (BaseHTTPMiddleware) vs pure ASGI.
+
+    cd backend && python -m benchmarks.middleware_stack [--concurrency 64] [--requests 200]
+
+Both apps serve the same trivial endpoint behind the same three concerns (security headers,
+auth context, DB timing), driven in-process through httpx.ASGITransport so only the
+middleware stack differs. Reports throughput and latency percentiles per stack.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+import httpx
+from fastapi import FastAPI, Request
+
+from app.core.instrumentation import server_timing_header, track_queries
+from app.core.middleware import (
+    SECURITY_HEADERS,
+    AuthContextMiddleware,
+    RequestTimingMiddleware,
+    SecurityHeadersMiddleware,
+)
+from app.core.security import create_access_token, decode_token
+
+
+def _endpoint(app: FastAPI) -> FastAPI:
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+def build_base_http_app() -> FastAPI:
+    """The previous stack: three BaseHTTPMiddleware layers."""
+    app = _endpoint(FastAPI())
+
+    @app.middleware("http")
+    async def add_security_headers(request: Request, call_next: Any):
+        response = await call_next(request)
+        for name, value in SECURITY_HEADERS.items():
+            response.headers[name] = value
+        return response
+
+    @app.middleware("http")
+    async def add_auth_context(request: Request, call_next: Any):
+        auth_header = request.headers.get("Authorization")
+        payload = decode_token(auth_header[7:].strip()) if auth_header else None
+        request.state.auth_payload = payload
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def add_db_timing(request: Request, call_next: Any):
+        started = time.perf_counter()
+        with track_queries() as stats:
+            response = await call_next(request)
+        response.headers["Server-Timing"] = server_timing_header(stats, (time.perf_counter() - started) * 1000)
+        return response
+
+    return app
+
+
+def build_pure_asgi_app() -> FastAPI:
+    app = _endpoint(FastAPI())
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(AuthContextMiddleware)
+    app.add_middleware(RequestTimingMiddleware)
+    return app
+
+
+async def run_load(app: FastAPI, concurrency: int, requests: int, headers: dict[str, str]) -> dict[str, float]:
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = await client.get("/ping", headers=headers)
+                latencies.append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200
+
+        await client.get("/ping", headers=headers)  # warm up
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=200, help="requests per concurrent client")
+    args = parser.parse_args()
+
+    token = create_access_token(subject="bench-user", tenant_id="bench-tenant", role="user")
+    headers = {"Authorization": f"Bearer {token}"}
+    for name, app in (("BaseHTTPMiddleware", build_base_http_app()), ("pure ASGI", build_pure_asgi_app())):
+        r = await run_load(app, args.concurrency, args.requests, headers)
+        print(f"{name:20s} {r['rps']:9.0f} req/s   p50 {r['p50_ms']:7.2f} ms   p99 {r['p99_ms']:7.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+"""
+Event-loop blocking under concurrent checkouts: the sync stripe SDK inline (before) vs BillingGateway (after).
+
+    cd backend && python -m benchmarks.stripe_gateway [--checkouts 200] [--concurrency 32] [--latency 0.05]
+
+Each checkout is what POST /billing/checkout does against Stripe: create a customer, then a
+checkout session, against the local fake server (tests/fake_stripe.py, started as a separate
+process so it does not compete for the GIL) answering after --latency seconds. A probe task
+wakes every millisecond and records how late it was; lateness is time the loop could not run
+anything else. "blocked" sums the lateness beyond 1 ms. With the gateway what remains is the
+SDK's own CPU per call (encoding the request, parsing the response), not waiting on the network.
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import stripe
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.services.billing_gateway import BillingGateway
+
+PROBE_INTERVAL = 0.001
+
+
+@contextmanager
+def fake_stripe_process(latency: float) -> Iterator[str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, "-m", "tests.fake_stripe", "--port", str(port), "--latency", str(latency)]
+    )
+    try:
+        for _ in range(500):
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.01)
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def probe_loop(lags: list[float]) -> None:
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - started - PROBE_INTERVAL) * 1000)
+
+
+async def checkout_sync_sdk(n: int) -> None:
+    """The handlers before: module-level SDK calls, each a blocking HTTP round trip."""
+    customer = stripe.Customer.create(email=f"bench{n}@example.com", metadata={"tenant_id": str(n)})
+    stripe.checkout.Session.create(mode="subscription", customer=customer.id, line_items=[{"price": "price_x", "quantity": 1}])
+
+
+def checkout_gateway(gateway: BillingGateway):
+    async def checkout(n: int) -> None:
+        customer = await gateway.create_customer(email=f"bench{n}@example.com", metadata={"tenant_id": str(n)})
+        await gateway.create_checkout_session(
+            mode="subscription", customer=customer.id, line_items=[{"price": "price_x", "quantity": 1}]
+        )
+
+    return checkout
+
+
+async def run(checkout, checkouts: int, concurrency: int) -> dict[str, float]:
+    lags: list[float] = []
+    probe = asyncio.create_task(probe_loop(lags))
+    await asyncio.sleep(0.05)
+    lags.clear()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(n: int) -> None:
+        async with semaphore:
+            await checkout(n)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(n) for n in range(checkouts)))
+    wall = time.perf_counter() - started
+    await asyncio.sleep(PROBE_INTERVAL * 5)  # let the probe record a wake-up it was blocked from
+    probe.cancel()
+    lags.sort()
+    return {
+        "wall_s": wall,
+        "checkouts_per_s": checkouts / wall,
+        "loop_blocked_ms": sum(lag - 1 for lag in lags if lag > 1),
+        "lag_p50_ms": statistics.median(lags),
+        "lag_p99_ms": lags[int(len(lags) * 0.99) - 1],
+        "lag_max_ms": lags[-1],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checkouts", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.05, help="fake Stripe response time in seconds")
+    args = parser.parse_args()
+
+    with fake_stripe_process(args.latency) as url:
+        stripe.api_key, stripe.api_base = "sk_test_fake", url
+        gateway = BillingGateway(
+            api_key="sk_test_fake",
+            api_base=url,
+            timeout=30,
+            connect_timeout=3,
+            max_connections=args.concurrency,
+            max_network_retries=0,
+            breaker=CircuitBreaker(5, 30),
+        )
+        results = {}
+        try:
+            await run(checkout_gateway(gateway), args.concurrency, args.concurrency)  # warm the pool
+            results["before: sync SDK"] = await run(checkout_sync_sdk, args.checkouts, args.concurrency)
+            results["after: gateway"] = await run(checkout_gateway(gateway), args.checkouts, args.concurrency)
+        finally:
+            await gateway.close()
+
+    columns = list(next(iter(results.values())))
+    print(f"{'':18s} " + " ".join(f"{c:>16s}" for c in columns))
+    for label, row in results.items():
+        print(f"{label:18s} " + " ".join(f"{row[c]:16.2f}" for c in columns))
+    print(f"({args.checkouts} checkouts, 2 Stripe calls each, {args.concurrency} concurrent, {args.latency * 1000:.0f} ms per call)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,7 +4,9 @@ Sets up an async test database, test client, and auth helpers.
 """
 import os
 import asyncio
-from collections.abc import AsyncGenerator
+import uuid
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 
 import pytest
 import pytest_asyncio
@@ -18,14 +20,17 @@ os.environ.setdefault("JWT_ALGORITHM", "HS256")
 os.environ.setdefault("JWT_ACCESS_EXPIRE_MINUTES", "60")
 
 from app.main import app
-from app.database import get_db
+from app.database import get_db, get_read_sessionmaker
+from app.models import Asset, Company, Project, Role, User
 from app.models.base import Base
+from app.core.instrumentation import QueryStats, install_query_instrumentation, track_queries
 from app.core.security import create_access_token, get_password_hash
 
 # Test database
 TEST_DB_URL = os.environ["DATABASE_URL"]
 test_engine = create_async_engine(TEST_DB_URL, echo=False)
 TestSessionLocal = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+install_query_instrumentation(test_engine.sync_engine)
 
 
 @pytest.fixture(scope="session")
@@ -54,13 +59,24 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+def shared_sessionmaker(session: AsyncSession):
+    """Stands in for an async_sessionmaker whose every session is the test's own, left open."""
+    @asynccontextmanager
+    async def open_session():
+        yield session
+
+    return open_session
+
+
 @pytest_asyncio.fixture
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Async test client with overridden DB dependency."""
     async def override_get_db():
         yield db_session
 
+    # Reads share the test transaction too (routing itself is covered in test_read_routing.py)
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_sessionmaker] = lambda: shared_sessionmaker(db_session)
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -75,3 +91,73 @@ def make_auth_header(user_id: str = "test-user-id", tenant_id: str = "test-tenan
         role=role,
     )
     return {"Authorization": f"Bearer {token}"}
+
+
+# Role code per user created by seed_tenant: auth_for() must not touch User.role (lazy="raise")
+_seeded_roles: dict[uuid.UUID, str] = {}
+
+
+async def seed_tenant(session: AsyncSession, role_code: str = "admin") -> User:
+    """
+    A new company (unique name and slug) with one role, a user holding it, and 3 projects
+    with 2 assets each. Flushed, not committed.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    company = Company(name=f"Tenant {suffix}", slug=f"tenant-{suffix}")
+    session.add(company)
+    await session.flush()
+    role = Role(company_id=company.id, name=role_code.title(), code=role_code)
+    session.add(role)
+    await session.flush()
+    user = User(
+        company_id=company.id,
+        role_id=role.id,
+        email=f"{role_code}@{company.slug}.example.com",
+        hashed_password="not-a-real-hash",
+        full_name=f"{role_code.title()} {suffix}",
+    )
+    session.add(user)
+    await session.flush()
+    for i in range(3):
+        project = Project(company_id=company.id, name=f"Project {i}", created_by=user.id)
+        session.add(project)
+        await session.flush()
+        for j in range(2):
+            session.add(Asset(company_id=company.id, project_id=project.id, name=f"Machine {i}-{j}", asset_type="cnc"))
+    await session.flush()
+    _seeded_roles[user.id] = role_code
+    return user
+
+
+def auth_for(user: User) -> dict:
+    """Authorization header for user, with the role it was seeded with ("user" if not from seed_tenant)."""
+    role = _seeded_roles.get(user.id, "user")
+    return make_auth_header(user_id=str(user.id), tenant_id=str(user.company_id), role=role)
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fail the test when the wrapped block exceeds a statement-count or DB-time budget.
+
+        with query_budget(max_queries=3, max_db_ms=200) as stats:
+            await client.get("/api/v1/assets", headers=...)
+        assert stats.statements == 3  # optional exact check
+    """
+
+    @contextmanager
+    def _budget(max_queries: int | None = None, max_db_ms: float | None = None) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        if max_queries is not None and stats.statements > max_queries:
+            pytest.fail(
+                f"Query budget exceeded: {stats.statements} statements > {max_queries} "
+                f"(slowest {stats.slowest_ms:.1f} ms: {stats.slowest_sql})"
+            )
+        if max_db_ms is not None and stats.total_ms > max_db_ms:
+            pytest.fail(
+                f"DB time budget exceeded: {stats.total_ms:.1f} ms > {max_db_ms} ms "
+                f"(slowest {stats.slowest_ms:.1f} ms: {stats.slowest_sql})"
+            )
+
+    return _budget
@@ -0,0 +1,140 @@
+"""
+Local stand-in for the Stripe API (the endpoints BillingGateway uses), for tests and benchmarks.
+
+    with FakeStripe(latency=0.05) as fake:
+        gateway = BillingGateway(api_key="sk_test_fake", api_base=fake.url, ...)
+
+Runs uvicorn on 127.0.0.1 (random port) in its own thread and event loop, so its work never
+shows up as blocking on the caller's loop. latency delays every response; fail_status makes every
+call fail with that HTTP status (an outage); a payment method id starting with pm_card_declined
+is refused with a 402 card_error like Stripe's test cards. New subscriptions get subscription_status
+("incomplete": the first invoice needs SCA and carries a confirmation_secret, as on API versions
+since basil). requests records (path, form) per call.
+
+Benchmarks run it as its own process so it does not compete for the GIL with the code measured:
+
+    python -m tests.fake_stripe --port 12111 [--latency 0.05]
+"""
+import argparse
+import asyncio
+import itertools
+import socket
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qsl
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+class FakeStripe:
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.fail_status: int | None = None
+        self.subscription_status = "active"
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self._ids = itertools.count(1)
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+        self.url = ""
+
+    def _app(self) -> FastAPI:
+        app = FastAPI()
+
+        def object_id(prefix: str) -> str:
+            return f"{prefix}_fake_{next(self._ids)}"
+
+        @app.middleware("http")
+        async def simulate(request: Request, call_next: Any):
+            # Parsed from the body, which BaseHTTPMiddleware replays to the endpoint (a form() here would not be)
+            self.requests.append((request.url.path, dict(parse_qsl((await request.body()).decode()))))
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.fail_status is not None:
+                error = {"type": "api_error", "message": "Fake Stripe outage"}
+                return JSONResponse({"error": error}, status_code=self.fail_status)
+            return await call_next(request)
+
+        @app.post("/v1/customers")
+        async def create_customer(request: Request):
+            form = await request.form()
+            return {"id": object_id("cus"), "object": "customer", "email": form.get("email")}
+
+        @app.post("/v1/customers/{customer_id}")
+        async def update_customer(customer_id: str):
+            return {"id": customer_id, "object": "customer"}
+
+        @app.post("/v1/payment_methods/{payment_method_id}/attach")
+        async def attach_payment_method(payment_method_id: str, request: Request):
+            if payment_method_id.startswith("pm_card_declined"):
+                error = {"type": "card_error", "code": "card_declined", "message": "Your card was declined."}
+                return JSONResponse({"error": error}, status_code=402)
+            form = await request.form()
+            return {"id": payment_method_id, "object": "payment_method", "customer": form.get("customer")}
+
+        @app.post("/v1/subscriptions")
+        async def create_subscription(request: Request):
+            form = await request.form()
+            expand = [value for key, value in form.multi_items() if key.startswith("expand[")]
+            if "latest_invoice.payment_intent" in expand:
+                # As on API versions since basil, where invoices no longer have a payment_intent
+                message = "This property cannot be expanded (payment_intent)."
+                error = {"type": "invalid_request_error", "message": message}
+                return JSONResponse({"error": error}, status_code=400)
+            invoice = {"id": object_id("in"), "object": "invoice"}
+            if "latest_invoice.confirmation_secret" in expand:
+                confirmation = None
+                if self.subscription_status == "incomplete":
+                    confirmation = {"type": "payment_intent", "client_secret": f"{object_id('pi')}_secret_fake"}
+                invoice["confirmation_secret"] = confirmation
+            return {
+                "id": object_id("sub"),
+                "object": "subscription",
+                "status": self.subscription_status,
+                "latest_invoice": invoice,
+            }
+
+        @app.post("/v1/checkout/sessions")
+        async def create_checkout_session():
+            session_id = object_id("cs")
+            return {"id": session_id, "object": "checkout.session", "url": f"https://checkout.fake/{session_id}"}
+
+        @app.post("/v1/billing_portal/sessions")
+        async def create_portal_session():
+            session_id = object_id("bps")
+            return {"id": session_id, "object": "billing_portal.session", "url": f"https://billing.fake/{session_id}"}
+
+        return app
+
+    def start(self) -> None:
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        self.url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        self._server = uvicorn.Server(uvicorn.Config(self._app(), log_level="warning", lifespan="off"))
+        self._thread = threading.Thread(target=self._server.run, kwargs={"sockets": [sock]}, daemon=True)
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+            self._thread.join()
+            self._server = self._thread = None
+
+    def __enter__(self) -> "FakeStripe":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=12111)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+    uvicorn.run(FakeStripe(args.latency)._app(), host="127.0.0.1", port=args.port, log_level="warning", lifespan="off")
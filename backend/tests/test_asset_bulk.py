@@ -0,0 +1,101 @@
+"""POST /assets/bulk/update and /bulk/delete: one company-scoped statement per call, bounded by limit."""
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Asset
+from app.repositories.tenant_stats import tenant_stats_repository
+from tests.conftest import auth_for, seed_tenant
+
+BULK_UPDATE = "/api/v1/assets/bulk/update"
+BULK_DELETE = "/api/v1/assets/bulk/delete"
+
+
+async def _assets(db_session: AsyncSession, company_id: uuid.UUID) -> list[Asset]:
+    result = await db_session.execute(
+        select(Asset).where(Asset.company_id == company_id).order_by(Asset.name),
+        execution_options={"populate_existing": True},
+    )
+    return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_update_by_ids_is_one_statement_and_reports_unknown_ids(
+    client: AsyncClient, db_session: AsyncSession, query_budget
+):
+    user = await seed_tenant(db_session)
+    other = await seed_tenant(db_session, role_code="member")
+    mine = await _assets(db_session, user.company_id)
+    theirs = (await _assets(db_session, other.company_id))[0]
+    await client.get("/api/v1/auth/me", headers=auth_for(user))  # warm the principal cache
+
+    ids = [str(a.id) for a in mine[:3]] + [str(theirs.id)]
+    with query_budget(max_queries=1) as stats:
+        response = await client.post(
+            BULK_UPDATE, json={"ids": ids, "values": {"status": "retired", "location": "Yard"}}, headers=auth_for(user)
+        )
+    assert response.status_code == 200
+    assert response.json() == {"affected": 3, "not_found": [str(theirs.id)], "next_cursor": None}
+    assert stats.statements == 1
+
+    statuses = [(a.status, a.location) for a in await _assets(db_session, user.company_id)]
+    assert statuses.count(("retired", "Yard")) == 3
+    assert (await _assets(db_session, other.company_id))[0].status == "active"
+
+
+@pytest.mark.asyncio
+async def test_filter_update_walks_large_selections_by_cursor(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    other = await seed_tenant(db_session, role_code="member")
+    payload = {"filter": {"asset_type": "cnc"}, "values": {"metadata": {"audited": True}}, "limit": 4}
+
+    first = (await client.post(BULK_UPDATE, json=payload, headers=auth_for(user))).json()
+    assert (first["affected"], first["next_cursor"] is not None) == (4, True)
+    second = (
+        await client.post(BULK_UPDATE, json={**payload, "cursor": first["next_cursor"]}, headers=auth_for(user))
+    ).json()
+    assert (second["affected"], second["next_cursor"]) == (2, None)
+
+    assert all(a.metadata_ == {"audited": True} for a in await _assets(db_session, user.company_id))
+    assert all(a.metadata_ is None for a in await _assets(db_session, other.company_id))
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_is_counted(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    project_id = (await _assets(db_session, user.company_id))[0].project_id
+
+    response = await client.post(BULK_DELETE, json={"filter": {"project_id": str(project_id)}}, headers=auth_for(user))
+    assert response.json() == {"affected": 2, "not_found": [], "next_cursor": None}
+    remaining = await db_session.scalar(select(func.count()).select_from(Asset).where(Asset.company_id == user.company_id))
+    assert remaining == 4
+    counts = await tenant_stats_repository.counts(db_session, user.company_id, ["assets"])
+    assert counts == {"assets": {"active": 4}}
+
+
+@pytest.mark.asyncio
+async def test_bulk_requests_are_validated(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    other = await seed_tenant(db_session, role_code="member")
+    asset_id = str((await _assets(db_session, user.company_id))[0].id)
+
+    both = {"ids": [asset_id], "filter": {}, "values": {"status": "x"}}
+    assert (await client.post(BULK_UPDATE, json=both, headers=auth_for(user))).status_code == 422
+    no_values = {"ids": [asset_id], "values": {}}
+    assert (await client.post(BULK_UPDATE, json=no_values, headers=auth_for(user))).status_code == 422
+    null_name = {"filter": {}, "values": {"name": None}}
+    assert (await client.post(BULK_UPDATE, json=null_name, headers=auth_for(user))).status_code == 422
+    too_many = {"filter": {}, "limit": 5001}
+    assert (await client.post(BULK_DELETE, json=too_many, headers=auth_for(user))).status_code == 422
+
+    bad_project = {"ids": [asset_id], "values": {"project_id": "nope"}}
+    assert (await client.post(BULK_UPDATE, json=bad_project, headers=auth_for(user))).status_code == 422
+
+    foreign_project = (await _assets(db_session, other.company_id))[0].project_id
+    response = await client.post(
+        BULK_UPDATE, json={"ids": [asset_id], "values": {"project_id": str(foreign_project)}}, headers=auth_for(user)
+    )
+    assert response.status_code == 404
@@ -0,0 +1,131 @@
+"""POST /assets/import: streamed CSV/NDJSON, validated per row, inserted in batched multi-row INSERTs."""
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Asset
+from app.repositories.tenant_stats import tenant_stats_repository
+from app.services import asset_import as asset_import_module
+from app.services.asset_import import ImportFileError, ImportFormat, asset_import_service
+from tests.conftest import auth_for, seed_tenant
+
+IMPORT_URL = "/api/v1/assets/import"
+
+
+async def _project_id(client: AsyncClient, user) -> str:
+    return (await client.get("/api/v1/projects", headers=auth_for(user))).json()["results"][0]["id"]
+
+
+async def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+@pytest.mark.asyncio
+async def test_csv_import_inserts_valid_rows_and_reports_the_rest(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    project_id = await _project_id(client, user)
+    body = (
+        "﻿Name,asset_type,serial_number,location,status,project_id,metadata\r\n"
+        f'Lathe,cnc,SN-1,"Hall 1\nBay 2",,{project_id},"{{""axis"": 5}}"\r\n'
+        ",cnc,,,,,\r\n"  # name missing
+        "Press,press,,,,00000000-0000-0000-0000-000000000001,\r\n"  # not this tenant's project
+        "Drill,drill,,,,,{broken\r\n"
+        "Too,few\r\n"
+        "\r\n"
+        "Mill,cnc,,,inactive,,\r\n"
+        "Saw,saw,,,,not-a-uuid,\r\n"
+    )
+    response = await client.post(
+        IMPORT_URL, content=body.encode(), headers={**auth_for(user), "Content-Type": "text/csv; charset=utf-8"}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["inserted"], report["failed"], report["errors_truncated"]) == (2, 5, False)
+    # Project ids are checked per batch, so that error arrives after the batch's parse errors
+    assert sorted((e["row"], e["errors"][0]["field"] or "") for e in report["errors"]) == [
+        (2, "name"),
+        (3, "project_id"),
+        (4, ""),
+        (5, ""),
+        (7, "project_id"),
+    ]
+
+    rows = (await db_session.execute(select(Asset).where(Asset.name.in_(["Lathe", "Mill"])))).scalars().all()
+    by_name = {a.name: a for a in rows}
+    assert by_name["Lathe"].location == "Hall 1\nBay 2"
+    assert by_name["Lathe"].metadata_ == {"axis": 5}
+    assert str(by_name["Lathe"].project_id) == project_id
+    assert (by_name["Lathe"].status, by_name["Mill"].status) == ("active", "inactive")  # empty cell: default
+
+
+@pytest.mark.asyncio
+async def test_ndjson_import_counts_assets_against_usage(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    lines = [{"name": f"Robot {i}", "asset_type": "robot"} for i in range(5)] + [["not", "an", "object"]]
+    body = "\n".join(json.dumps(line) for line in lines) + "\n{nope\n"
+    response = await client.post(
+        f"{IMPORT_URL}?format=ndjson", content=body.encode(), headers=auth_for(user)
+    )
+    assert response.status_code == 200
+    assert (response.json()["inserted"], response.json()["failed"]) == (5, 2)
+    counts = await tenant_stats_repository.counts(db_session, user.company_id, ["assets"])
+    assert sum(counts["assets"].values()) == 11  # 6 seeded + 5
+
+
+@pytest.mark.asyncio
+async def test_whole_file_errors(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    missing_column = await client.post(
+        IMPORT_URL, content=b"name,serial_number\nLathe,SN\n", headers={**auth_for(user), "Content-Type": "text/csv"}
+    )
+    assert missing_column.status_code == 400
+    assert "asset_type" in missing_column.json()["detail"]
+
+    unterminated = await client.post(
+        IMPORT_URL, content=b'name,asset_type\n"Lathe,cnc\n', headers={**auth_for(user), "Content-Type": "text/csv"}
+    )
+    assert unterminated.status_code == 400
+
+    unsupported = await client.post(IMPORT_URL, content=b"{}", headers={**auth_for(user), "Content-Type": "application/xml"})
+    assert unsupported.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_line_limit_counts_utf8_bytes_of_every_line(db_session: AsyncSession, monkeypatch):
+    user = await seed_tenant(db_session)
+    monkeypatch.setattr(asset_import_module.settings, "import_max_line_bytes", 40)
+    fits = b'{"name": "Lathe", "asset_type": "cnc"}\n'  # 38 bytes
+    long_line = '{"name": "Dr\u00e9\u00e9\u00e9\u00e9l", "asset_type": "x"}\n'.encode()  # 38 characters, 42 bytes
+    # The long line arrives whole inside one chunk, never as the unterminated tail
+    report = await asset_import_service.import_stream(
+        db_session, user.company_id, _chunks(fits, 1024), ImportFormat.NDJSON
+    )
+    assert report.inserted == 1
+    with pytest.raises(ImportFileError, match="40 bytes"):
+        await asset_import_service.import_stream(
+            db_session, user.company_id, _chunks(fits + long_line + fits, 1024), ImportFormat.NDJSON
+        )
+
+
+@pytest.mark.asyncio
+async def test_batches_and_error_cap(db_session: AsyncSession, query_budget):
+    user = await seed_tenant(db_session)
+    rows = [f"Asset {i},cnc" if i % 10 else f"Asset {i}," for i in range(250)]  # every 10th lacks asset_type
+    body = ("name,asset_type\n" + "\n".join(rows) + "\n").encode()
+
+    with query_budget(max_queries=100) as stats:
+        report = await asset_import_service.import_stream(
+            db_session, user.company_id, _chunks(body, 97), ImportFormat.CSV, batch_rows=100, max_errors=10
+        )
+    assert (report.inserted, report.failed, len(report.errors), report.errors_truncated) == (225, 25, 10, True)
+    # Per batch of 100 valid rows: subscription + counter UPDATE + one INSERT; seeding the counters once
+    assert stats.statements <= 3 * 4 + 2
+
+    count = await db_session.scalar(
+        select(func.count()).select_from(Asset).where(Asset.company_id == user.company_id, Asset.asset_type == "cnc")
+    )
+    assert count == 6 + 225
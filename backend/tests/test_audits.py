@@ -0,0 +1,141 @@
+"""/api/v1/audits: company-scoped CRUD, calendar ranges with keyset paging, bulk scheduling."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Asset
+from tests.conftest import auth_for, seed_tenant
+
+AUDITS = "/api/v1/audits"
+MONTH = datetime(2026, 11, 1, tzinfo=timezone.utc)
+
+
+async def _asset_ids(db_session: AsyncSession, company_id) -> list[str]:
+    result = await db_session.execute(select(Asset.id).where(Asset.company_id == company_id).order_by(Asset.name))
+    return [str(i) for i in result.scalars()]
+
+
+async def _schedule(client: AsyncClient, user, asset_ids: list[str], days: int) -> list[dict]:
+    audits = [
+        {
+            "audit_type": "iso9001" if day % 2 else "safety",
+            "asset_id": asset_ids[day % len(asset_ids)],
+            "auditor_id": str(user.id),
+            "scheduled_at": (MONTH + timedelta(days=day, hours=9)).isoformat(),
+        }
+        for day in range(days)
+    ]
+    response = await client.post(f"{AUDITS}/bulk", json={"audits": audits}, headers=auth_for(user))
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_crud(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    asset_id = (await _asset_ids(db_session, user.company_id))[0]
+    created = await client.post(
+        AUDITS,
+        json={"audit_type": "iso9001", "asset_id": asset_id, "auditor_id": str(user.id), "scheduled_at": MONTH.isoformat()},
+        headers=auth_for(user),
+    )
+    assert created.status_code == 201
+    audit = created.json()
+    assert (audit["company_id"], audit["status"], audit["asset_id"]) == (str(user.company_id), "scheduled", asset_id)
+    assert audit["created_at"]
+
+    url = f"{AUDITS}/{audit['id']}"
+    completed_at = (MONTH + timedelta(hours=3)).isoformat()
+    patched = await client.patch(
+        url, json={"status": "completed", "completed_at": completed_at, "findings": {"nc": 0}}, headers=auth_for(user)
+    )
+    assert (patched.json()["status"], patched.json()["findings"]) == ("completed", {"nc": 0})
+    assert (await client.get(url, headers=auth_for(user))).json()["completed_at"].startswith("2026-11-01T03:00")
+    for field in ("status", "audit_type"):
+        assert (await client.patch(url, json={field: None}, headers=auth_for(user))).status_code == 422
+
+    assert (await client.delete(url, headers=auth_for(user))).status_code == 204
+    assert (await client.get(url, headers=auth_for(user))).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_references_must_belong_to_the_company(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    other = await seed_tenant(db_session, role_code="member")
+    foreign_asset = (await _asset_ids(db_session, other.company_id))[0]
+
+    response = await client.post(AUDITS, json={"audit_type": "x", "asset_id": foreign_asset}, headers=auth_for(user))
+    assert response.status_code == 404
+    assert response.json()["detail"] == f"Asset not found: {foreign_asset}"
+    response = await client.post(AUDITS, json={"audit_type": "x", "auditor_id": str(other.id)}, headers=auth_for(user))
+    assert response.status_code == 404
+
+    mine = await _asset_ids(db_session, user.company_id)
+    bulk = {"audits": [{"audit_type": "x", "asset_id": mine[0]}, {"audit_type": "x", "asset_id": foreign_asset}]}
+    assert (await client.post(f"{AUDITS}/bulk", json=bulk, headers=auth_for(user))).status_code == 404
+    listing = await client.get(AUDITS, headers=auth_for(user))
+    assert listing.json()["count"] == 0  # all or nothing
+
+
+@pytest.mark.asyncio
+async def test_bulk_schedule_is_one_insert(client: AsyncClient, db_session: AsyncSession, query_budget):
+    user = await seed_tenant(db_session)
+    asset_ids = await _asset_ids(db_session, user.company_id)
+    await client.get("/api/v1/auth/me", headers=auth_for(user))  # warm the principal cache
+    with query_budget(max_queries=3) as stats:
+        created = await _schedule(client, user, asset_ids, days=30)
+    assert stats.statements == 3  # asset ids + auditor ids + one INSERT ... RETURNING
+    assert len(created) == 30
+    assert [a["scheduled_at"][:10] for a in created[:2]] == ["2026-11-01", "2026-11-02"]  # request order
+
+
+@pytest.mark.asyncio
+async def test_calendar_range_pages_in_date_order(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    asset_ids = await _asset_ids(db_session, user.company_id)
+    await _schedule(client, user, asset_ids, days=45)  # Nov 1 .. Dec 15
+
+    params = {"from": MONTH.isoformat(), "to": (MONTH + timedelta(days=30)).isoformat(), "per_page": 7}
+    seen, cursor = [], None
+    while True:
+        response = await client.get(
+            f"{AUDITS}/calendar", params={**params, **({"cursor": cursor} if cursor else {})}, headers=auth_for(user)
+        )
+        body = response.json()
+        seen += [a["scheduled_at"] for a in body["results"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    assert len(seen) == 30  # November only
+    assert seen == sorted(seen)
+    assert body["count"] is None
+
+    one_asset = await client.get(
+        f"{AUDITS}/calendar", params={**params, "asset_id": asset_ids[0], "status": "scheduled"}, headers=auth_for(user)
+    )
+    assert len(one_asset.json()["results"]) == 5  # every 6th day
+    completed = await client.get(f"{AUDITS}/calendar", params={**params, "field": "completed_at"}, headers=auth_for(user))
+    assert completed.json()["results"] == []
+
+    backwards = {"from": params["to"], "to": params["from"]}
+    assert (await client.get(f"{AUDITS}/calendar", params=backwards, headers=auth_for(user))).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_filters_and_keyset(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    asset_ids = await _asset_ids(db_session, user.company_id)
+    await _schedule(client, user, asset_ids, days=12)
+
+    safety = await client.get(AUDITS, params={"audit_type": "safety"}, headers=auth_for(user))
+    assert safety.json()["count"] == 6
+    first = await client.get(AUDITS, params={"cursor": "", "per_page": 10, "auditor_id": str(user.id)}, headers=auth_for(user))
+    second = await client.get(
+        AUDITS, params={"cursor": first.json()["next_cursor"], "per_page": 10}, headers=auth_for(user)
+    )
+    ids = [a["id"] for a in first.json()["results"] + second.json()["results"]]
+    assert len(ids) == len(set(ids)) == 12
+    assert second.json()["next_cursor"] is None
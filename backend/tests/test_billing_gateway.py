@@ -0,0 +1,176 @@
+"""Async Stripe gateway against the local fake server: pooling, timeouts, circuit breaking, no loop blocking."""
+import asyncio
+import time
+
+import pytest
+import stripe
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1 import billing
+from app.core.circuit_breaker import CircuitBreaker
+from app.services.billing_gateway import BillingGateway, BillingUnavailable
+from tests.conftest import auth_for, seed_tenant
+from tests.fake_stripe import FakeStripe
+
+
+@pytest.fixture
+def fake_stripe():
+    with FakeStripe() as fake:
+        yield fake
+
+
+def _gateway(fake: FakeStripe, timeout: float = 2.0, failures: int = 3, reset_seconds: float = 30.0) -> BillingGateway:
+    return BillingGateway(
+        api_key="sk_test_fake",
+        api_base=fake.url,
+        timeout=timeout,
+        connect_timeout=1.0,
+        max_connections=4,
+        max_network_retries=0,
+        breaker=CircuitBreaker(failures, reset_seconds),
+    )
+
+
+@pytest.mark.asyncio
+async def test_calls_round_trip_through_the_fake(fake_stripe):
+    gateway = _gateway(fake_stripe)
+    try:
+        customer = await gateway.create_customer(email="a@example.com", metadata={"tenant_id": "t1"})
+        session = await gateway.create_checkout_session(mode="subscription", customer=customer.id)
+    finally:
+        await gateway.close()
+    assert customer.id.startswith("cus_fake_") and session.id.startswith("cs_fake_")
+    assert fake_stripe.requests[0] == ("/v1/customers", {"email": "a@example.com", "metadata[tenant_id]": "t1"})
+    assert gateway.status()["breaker"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_slow_stripe_times_out_without_blocking_the_loop(fake_stripe):
+    fake_stripe.latency = 1.0
+    gateway = _gateway(fake_stripe, timeout=5.0)
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    try:
+        with pytest.raises(BillingUnavailable):
+            await gateway.create_customer(email="a@example.com", timeout=0.2)  # per-call override
+    finally:
+        task.cancel()
+        await gateway.close()
+    elapsed = time.perf_counter() - started
+    assert elapsed < 0.5
+    assert ticks >= elapsed / 0.01 * 0.5  # the loop kept running while the call was in flight
+
+
+@pytest.mark.asyncio
+async def test_calls_in_flight_are_capped_at_max_connections(fake_stripe):
+    fake_stripe.latency = 0.1
+    gateway = _gateway(fake_stripe)  # max_connections=4
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(gateway.create_customer(email=f"{i}@example.com") for i in range(12)))
+    finally:
+        await gateway.close()
+    assert time.perf_counter() - started >= 0.3  # three waves of four, not one of twelve
+    assert len(fake_stripe.requests) == 12
+
+
+@pytest.mark.asyncio
+async def test_outage_opens_the_circuit_then_a_trial_closes_it(fake_stripe):
+    gateway = _gateway(fake_stripe, failures=3, reset_seconds=0.2)
+    fake_stripe.fail_status = 500
+    try:
+        for _ in range(3):
+            with pytest.raises(BillingUnavailable):
+                await gateway.create_customer(email="a@example.com")
+        calls = len(fake_stripe.requests)
+        with pytest.raises(BillingUnavailable, match="circuit open"):
+            await gateway.create_customer(email="a@example.com")
+        assert len(fake_stripe.requests) == calls  # failed fast, Stripe not called
+        assert gateway.status()["breaker"]["state"] == "open"
+
+        await asyncio.sleep(0.25)
+        fake_stripe.fail_status = None
+        assert (await gateway.create_customer(email="a@example.com")).id
+        assert gateway.status()["breaker"]["state"] == "closed"
+    finally:
+        await gateway.close()
+
+
+@pytest.mark.asyncio
+async def test_card_errors_pass_through_and_do_not_trip_the_breaker(fake_stripe):
+    gateway = _gateway(fake_stripe, failures=1)
+    try:
+        for _ in range(2):
+            with pytest.raises(stripe.CardError):
+                await gateway.attach_payment_method("pm_card_declined", customer="cus_1")
+    finally:
+        await gateway.close()
+    assert gateway.status()["breaker"]["state"] == "closed"
+
+
+def test_half_open_lets_one_trial_through():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    now[0] = 10
+    assert breaker.allow() and not breaker.allow()  # second caller fails fast while the trial runs
+    breaker.record_failure()
+    assert breaker.state == "open"
+    now[0] = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_checkout_endpoint_uses_the_gateway(
+    client: AsyncClient, db_session: AsyncSession, fake_stripe, monkeypatch
+):
+    gateway = _gateway(fake_stripe, failures=1)
+    monkeypatch.setattr(billing, "STRIPE_CONFIGURED", True)
+    monkeypatch.setattr(billing, "billing_gateway", gateway)
+    user = await seed_tenant(db_session)
+    try:
+        response = await client.post("/api/v1/billing/checkout", json={"plan_id": "standard"}, headers=auth_for(user))
+        assert response.status_code == 200
+        assert response.json()["session_id"].startswith("cs_fake_")
+        assert [path for path, _ in fake_stripe.requests] == ["/v1/customers", "/v1/checkout/sessions"]
+
+        fake_stripe.fail_status = 503
+        response = await client.post("/api/v1/billing/portal", headers=auth_for(user))
+        assert (response.status_code, response.headers["retry-after"]) == (503, "5")
+    finally:
+        await gateway.close()
+
+
+@pytest.mark.asyncio
+async def test_create_subscription_returns_the_sca_confirmation_secret(
+    client: AsyncClient, db_session: AsyncSession, fake_stripe, monkeypatch
+):
+    gateway = _gateway(fake_stripe)
+    monkeypatch.setattr(billing, "STRIPE_CONFIGURED", True)
+    monkeypatch.setattr(billing, "billing_gateway", gateway)
+    user = await seed_tenant(db_session)
+    payload = {"plan_id": "standard", "payment_method_id": "pm_card_threeDSecure2Required"}
+    fake_stripe.subscription_status = "incomplete"
+    try:
+        response = await client.post("/api/v1/billing/create-subscription", json=payload, headers=auth_for(user))
+    finally:
+        await gateway.close()
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "incomplete"
+    assert body["client_secret"].startswith("pi_fake_") and body["client_secret"].endswith("_secret_fake")
+    assert fake_stripe.requests[-1][1]["expand[0]"] == "latest_invoice.confirmation_secret"
@@ -0,0 +1,142 @@
+"""GET /dashboard/summary: trigger-appended tenant_stat_deltas, compacted and reconciled by the worker."""
+import asyncio
+import logging
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Asset, Company, Project, TenantStatDelta, TenantStats
+from app.repositories.tenant_stats import tenant_stats_repository
+from app.services.tenant_stats import TenantStatsWorker
+from tests.conftest import TestSessionLocal, auth_for, seed_tenant
+
+SUMMARY = "/api/v1/dashboard/summary"
+
+
+def _by_status(body: dict) -> dict:
+    return {table: body[table]["by_status"] for table in ("projects", "assets", "audits", "rfqs")}
+
+
+@pytest.mark.asyncio
+async def test_summary_follows_every_write_path(client: AsyncClient, db_session: AsyncSession, query_budget):
+    user = await seed_tenant(db_session)
+    other = await seed_tenant(db_session, role_code="member")
+    headers = auth_for(user)
+    await client.get("/api/v1/auth/me", headers=headers)  # warm the principal cache
+
+    with query_budget(max_queries=1) as stats:
+        body = (await client.get(SUMMARY, headers=headers)).json()
+    assert stats.statements == 1
+    assert body["assets"] == {"total": 6, "by_status": {"active": 6}}
+    assert body["users"] == {"total": 1, "by_status": {"active": 1}}
+    assert _by_status(body) == {"projects": {"draft": 3}, "assets": {"active": 6}, "audits": {}, "rfqs": {}}
+
+    asset_ids = (await db_session.execute(select(Asset.id).where(Asset.company_id == user.company_id))).scalars().all()
+    project_id = (await db_session.execute(select(Project.id).where(Project.company_id == user.company_id))).scalar()
+    bulk = {"ids": [str(i) for i in asset_ids[:2]], "values": {"status": "retired"}}
+    await client.post("/api/v1/assets/bulk/update", json=bulk, headers=headers)
+    await client.post("/api/v1/assets/bulk/delete", json={"ids": [str(asset_ids[2])]}, headers=headers)
+    audits = {"audits": [{"audit_type": "iso", "asset_id": str(i)} for i in asset_ids[3:]]}
+    created = (await client.post("/api/v1/audits/bulk", json=audits, headers=headers)).json()
+    await client.patch(f"/api/v1/audits/{created[0]['id']}", json={"status": "completed"}, headers=headers)
+    await client.patch(f"/api/v1/audits/{created[1]['id']}", json={"findings": {"ok": True}}, headers=headers)
+    await client.post("/api/v1/rfqs", json={"title": "Spares", "rfq_number": "D-1"}, headers=headers)
+    await client.delete(f"/api/v1/projects/{project_id}", headers=headers)
+
+    body = (await client.get(SUMMARY, headers=headers)).json()
+    assert _by_status(body) == {
+        "projects": {"draft": 2},
+        "assets": {"active": 3, "retired": 2},
+        "audits": {"scheduled": 2, "completed": 1},
+        "rfqs": {"draft": 1},
+    }
+    assert body["audits"]["total"] == 3
+    other_body = (await client.get(SUMMARY, headers=auth_for(other))).json()
+    assert _by_status(other_body)["assets"] == {"active": 6}
+
+
+async def _company(session: AsyncSession, name: str) -> Company:
+    company = Company(name=name, slug=f"{name.lower().replace(' ', '-')}-{uuid.uuid4().hex[:8]}")
+    session.add(company)
+    await session.flush()
+    return company
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_of_a_tenant_do_not_wait_on_each_other():
+    async with TestSessionLocal() as session:
+        company = await _company(session, "Dashboard Concurrent")
+        await session.commit()
+    try:
+        async with TestSessionLocal() as first, TestSessionLocal() as second:
+            first.add(Asset(company_id=company.id, name="Lathe", asset_type="lathe"))
+            await first.flush()  # holds its transaction open
+            await second.execute(text("SET LOCAL lock_timeout = '1s'"))
+            second.add(Asset(company_id=company.id, name="Mill", asset_type="mill"))
+            await asyncio.wait_for(second.flush(), timeout=5)
+            await second.commit()
+            await first.commit()
+
+        async with TestSessionLocal() as session:
+            deltas = (
+                await session.execute(select(TenantStatDelta.n).where(TenantStatDelta.company_id == company.id))
+            ).scalars().all()
+            assert deltas == [1, 1]
+            counts = await tenant_stats_repository.counts(session, company.id, ["assets"])
+        assert counts == {"assets": {"active": 2}}
+    finally:
+        async with TestSessionLocal() as session:
+            await session.execute(delete(Company).where(Company.id == company.id))
+            await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_worker_compacts_deltas_and_repairs_drift(caplog):
+    async with TestSessionLocal() as session:
+        company = await _company(session, "Dashboard Drift")
+        session.add_all(Asset(company_id=company.id, name=f"Press {i}", asset_type="press") for i in range(3))
+        session.add(Project(company_id=company.id, name="Tracked"))
+        await session.flush()
+        await session.execute(update(Asset).where(Asset.company_id == company.id, Asset.name == "Press 0").values(status="retired"))
+        await session.commit()
+    worker = TenantStatsWorker(TestSessionLocal)
+    worker.reconcile_batch_size = 1000
+    try:
+        while await worker.compact_once():
+            pass
+        async with TestSessionLocal() as session:
+            pending = await session.execute(select(TenantStatDelta.id).where(TenantStatDelta.company_id == company.id))
+            assert pending.first() is None
+            rows = await session.execute(
+                select(TenantStats.entity, TenantStats.status, TenantStats.n).where(TenantStats.company_id == company.id)
+            )
+            assert sorted(rows.tuples()) == [("assets", "active", 2), ("assets", "retired", 1), ("projects", "draft", 1)]
+
+            # Writes that bypassed the triggers: a wrong compacted count and a stray delta
+            await session.execute(
+                update(TenantStats)
+                .where(TenantStats.company_id == company.id, TenantStats.entity == "projects")
+                .values(n=7)
+            )
+            session.add(TenantStatDelta(company_id=company.id, entity="rfqs", status="draft", n=2))
+            await session.commit()
+
+        with caplog.at_level(logging.WARNING, logger="app.services.tenant_stats"):
+            assert await worker.reconcile_once() >= 1
+        assert any(str(company.id) in r.getMessage() for r in caplog.records)
+        async with TestSessionLocal() as session:
+            counts = await tenant_stats_repository.counts(session, company.id)
+        assert counts == {
+            "projects": {"draft": 1},
+            "users": {},
+            "assets": {"active": 2, "retired": 1},
+            "audits": {},
+            "rfqs": {},
+        }
+    finally:
+        async with TestSessionLocal() as session:
+            await session.execute(delete(Company).where(Company.id == company.id))
+            await session.commit()
@@ -0,0 +1,127 @@
+"""Plan entitlements: limits enforced on create from the trigger-maintained tenant_stats counts."""
+import asyncio
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Company, Project, TenantStatDelta
+from app.repositories.tenant_stats import tenant_stats_repository
+from app.services.entitlements import EntitlementExceeded, Resource, entitlement_service
+from app.services.subscription import subscription_service
+from tests.conftest import TestSessionLocal, auth_for, seed_tenant
+
+PROJECTS_URL = "/api/v1/projects"
+
+
+@pytest.mark.asyncio
+async def test_free_plan_project_limit_is_enforced_and_freed_by_delete(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)  # 3 projects inserted directly, counted by the triggers
+    response = await client.post(PROJECTS_URL, json={"name": "Fourth"}, headers=auth_for(user))
+    assert response.status_code == 403
+    assert response.json()["detail"] == {
+        "code": "plan_limit_reached",
+        "message": "The start plan allows 3 projects",
+        "resource": "projects",
+        "limit": 3,
+        "usage": 3,
+        "plan_id": "start",
+        "subscription_status": "active",
+        "upgrade_to": "basic",
+    }
+
+    project_id = (await client.get(PROJECTS_URL, headers=auth_for(user))).json()["results"][0]["id"]
+    assert (await client.delete(f"{PROJECTS_URL}/{project_id}", headers=auth_for(user))).status_code == 204
+    assert (await client.post(PROJECTS_URL, json={"name": "Fourth"}, headers=auth_for(user))).status_code == 201
+
+    usage = (await client.get("/api/v1/billing/usage", headers=auth_for(user))).json()
+    assert usage["usage"] == {"projects": 3, "users": 1, "assets": 6}
+    assert usage["limits"] == {"projects": 3, "users": 1, "assets": None}
+
+
+@pytest.mark.asyncio
+async def test_checks_read_the_counter_not_the_table(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    db_session.add(TenantStatDelta(company_id=user.company_id, entity="projects", status="draft", n=-3))
+    await db_session.flush()
+    response = await client.post(PROJECTS_URL, json={"name": "Counted"}, headers=auth_for(user))
+    assert response.status_code == 201  # 4 rows exist, but the counter said 0
+    counts = await tenant_stats_repository.counts(db_session, user.company_id, ["projects"])
+    assert counts == {"projects": {"draft": 1}}
+
+
+@pytest.mark.asyncio
+async def test_paid_plan_lifts_the_limit_and_lapsed_payment_is_402(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    await subscription_service.update(db_session, user.company_id, plan_id="standard", status="active")
+    assert (await client.post(PROJECTS_URL, json={"name": "Fourth"}, headers=auth_for(user))).status_code == 201
+
+    await subscription_service.update(db_session, user.company_id, status="past_due")
+    response = await client.post(PROJECTS_URL, json={"name": "Fifth"}, headers=auth_for(user))
+    assert response.status_code == 402
+    detail = response.json()["detail"]
+    assert (detail["code"], detail["plan_id"], detail["limit"], detail["subscription_status"]) == (
+        "payment_required", "standard", 3, "past_due",
+    )
+
+
+@pytest.mark.asyncio
+async def test_user_limit_on_create(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    payload = {"email": "second@example.com", "company_id": str(user.company_id), "password": "StrongPass1"}
+    response = await client.post("/api/v1/users", json=payload, headers=auth_for(user))
+    assert response.status_code == 403
+    assert (response.json()["detail"]["resource"], response.json()["detail"]["upgrade_to"]) == ("users", "basic")
+
+    await subscription_service.update(db_session, user.company_id, plan_id="basic")
+    assert (await client.post("/api/v1/users", json=payload, headers=auth_for(user))).status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_user_limit_on_self_signup_into_an_existing_company(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)  # start plan, 1 user
+    company = await db_session.get(Company, user.company_id)  # "Tenant <suffix>", slugified to its slug
+    payload = {"full_name": "Joiner", "email": "joiner@example.com", "password": "StrongPass1"}
+    response = await client.post("/api/v1/auth/register", json={**payload, "company_name": company.name})
+    assert response.status_code == 403
+    assert response.json()["detail"]["resource"] == "users"
+
+    # The default company is shared by standalone signups and has no seat limit
+    for i in range(2):
+        standalone = {**payload, "email": f"standalone-{i}@example.com"}
+        assert (await client.post("/api/v1/auth/register", json=standalone)).status_code == 200
+
+    await subscription_service.update(db_session, user.company_id, plan_id="basic")
+    response = await client.post("/api/v1/auth/register", json={**payload, "company_name": company.name})
+    assert response.status_code == 200
+    assert response.json()["tenant"]["id"] == str(user.company_id)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creates_cannot_both_take_the_last_slot():
+    company = Company(name="Entitlements Race", slug=f"entitlements-race-{uuid.uuid4().hex[:8]}")
+    async with TestSessionLocal() as session:
+        session.add(company)
+        await session.commit()
+    try:
+        async with TestSessionLocal() as first, TestSessionLocal() as second:
+            await entitlement_service.consume(first, company.id, Resource.PROJECTS, n=2)
+            first.add_all(Project(company_id=company.id, name=f"Project {i}") for i in range(2))
+            await first.commit()  # 2 of 3 used
+
+            await entitlement_service.consume(first, company.id, Resource.PROJECTS)
+            first.add(Project(company_id=company.id, name="Last slot"))
+            await first.flush()
+            racer = asyncio.create_task(entitlement_service.consume(second, company.id, Resource.PROJECTS))
+            await asyncio.sleep(0.1)
+            assert not racer.done()  # waits on the advisory lock instead of reading a stale count
+            await first.commit()
+            with pytest.raises(EntitlementExceeded) as exc:
+                await racer
+            assert (exc.value.usage, exc.value.status_code) == (3, 403)
+    finally:
+        async with TestSessionLocal() as session:
+            await session.execute(delete(Company).where(Company.id == company.id))
+            await session.commit()
@@ -0,0 +1,104 @@
+"""GET /assets/export and /projects/export: list filters, streamed in batches from a server-side cursor."""
+import csv
+import io
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Asset
+from app.services import asset as asset_module
+from app.services.asset import asset_service
+from app.services.export import ExportFormat
+from app.services.project import project_service
+from tests.conftest import auth_for, seed_tenant, shared_sessionmaker
+
+
+@pytest.mark.asyncio
+async def test_asset_ndjson_export_applies_list_filters(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    db_session.add(Asset(company_id=user.company_id, name="Robot", asset_type="robot", metadata_={"axes": 6}))
+    await db_session.flush()
+
+    response = await client.get("/api/v1/assets/export", headers=auth_for(user))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="assets.ndjson"'
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 7
+    listing = (await client.get("/api/v1/assets?per_page=100", headers=auth_for(user))).json()["results"]
+    assert [r["id"] for r in rows] == [a["id"] for a in listing]  # same order as the list endpoint
+    assert set(rows[0]) == {
+        "id", "company_id", "project_id", "name", "asset_type", "serial_number",
+        "location", "status", "metadata", "created_at", "updated_at",
+    }
+
+    robots = await client.get("/api/v1/assets/export?asset_type=robot", headers=auth_for(user))
+    [robot] = [json.loads(line) for line in robots.text.splitlines()]
+    assert (robot["name"], robot["metadata"]) == ("Robot", {"axes": 6})
+
+
+@pytest.mark.asyncio
+async def test_asset_csv_export_can_be_imported_again(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    db_session.add(
+        Asset(company_id=user.company_id, name='Press "B", line 2', asset_type="press", metadata_={"t": [1, 2]})
+    )
+    await db_session.flush()
+
+    exported = await client.get("/api/v1/assets/export?format=csv&asset_type=press", headers=auth_for(user))
+    assert exported.headers["content-type"] == "text/csv; charset=utf-8"
+    [row] = list(csv.DictReader(io.StringIO(exported.text)))
+    assert (row["name"], json.loads(row["metadata"]), row["serial_number"]) == ('Press "B", line 2', {"t": [1, 2]}, "")
+
+    imported = await client.post(
+        "/api/v1/assets/import", content=exported.content, headers={**auth_for(user), "Content-Type": "text/csv"}
+    )
+    assert (imported.json()["inserted"], imported.json()["failed"]) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_project_export_csv_header_only_when_nothing_matches(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    all_projects = await client.get("/api/v1/projects/export?format=csv", headers=auth_for(user))
+    assert len(list(csv.DictReader(io.StringIO(all_projects.text)))) == 3
+
+    none = await client.get("/api/v1/projects/export?format=csv&status=archived", headers=auth_for(user))
+    assert none.status_code == 200
+    assert none.text == (
+        "id,company_id,name,code,description,status,start_date,end_date,created_by,created_at,updated_at\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_yields_one_chunk_per_batch_without_orm_objects(
+    db_session: AsyncSession, monkeypatch
+):
+    user = await seed_tenant(db_session)
+    db_session.expunge_all()
+    monkeypatch.setattr(asset_module.settings, "export_batch_rows", 4)
+    body = asset_service.export(shared_sessionmaker(db_session), user.company_id, ExportFormat.NDJSON)
+    chunks = [c async for c in body]
+    assert [c.count(b"\n") for c in chunks] == [4, 2]
+    assert len(db_session.identity_map) == 0
+
+
+@pytest.mark.asyncio
+async def test_export_body_opens_and_closes_its_own_session(db_session: AsyncSession):
+    """The body must not rely on the request's session still being open while it streams."""
+    user = await seed_tenant(db_session)
+    events = []
+
+    @asynccontextmanager
+    async def recording_sessionmaker():
+        events.append("open")
+        yield db_session
+        events.append("close")
+
+    body = project_service.export(recording_sessionmaker, user.company_id, ExportFormat.CSV)
+    assert events == []  # nothing runs until StreamingResponse iterates the body
+    chunks = [c async for c in body]
+    assert events == ["open", "close"]
+    assert b"".join(chunks).count(b"\n") == 4  # header + 3 projects
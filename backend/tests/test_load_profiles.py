@@ -0,0 +1,102 @@
+"""Query budgets per endpoint: relationships are lazy="raise" and loaded only via load profiles."""
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.conftest import auth_for, seed_tenant, test_engine
+
+
+@contextmanager
+def _returning_columns(table: str) -> Iterator[dict[str, list[str]]]:
+    """RETURNING column lists of the INSERT/UPDATE statements on table, keyed by verb."""
+    returned: dict[str, list[str]] = {}
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        verb = statement.split(" ", 1)[0]
+        if verb in ("INSERT", "UPDATE") and f" {table} " in statement and " RETURNING " in statement:
+            returned[verb] = [c.strip() for c in statement.rsplit(" RETURNING ", 1)[1].split(",")]
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        yield returned
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+
+
+@pytest.mark.asyncio
+async def test_me_is_a_single_query(client: AsyncClient, db_session: AsyncSession, query_budget):
+    user = await seed_tenant(db_session)
+    with query_budget(max_queries=1) as stats:
+        response = await client.get("/api/v1/auth/me", headers=auth_for(user))
+    assert response.status_code == 200
+    assert response.json()["role"] == "admin"
+    assert stats.statements == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("path", "expected_queries"),
+    [
+        ("/api/v1/assets", 2),  # principal (cold cache) + page with count(*) OVER ()
+        ("/api/v1/projects", 2),
+        ("/api/v1/users", 2),  # principal + page
+    ],
+)
+async def test_list_endpoint_query_counts(
+    client: AsyncClient, db_session: AsyncSession, query_budget, path: str, expected_queries: int
+):
+    user = await seed_tenant(db_session)
+    with query_budget(max_queries=expected_queries) as stats:
+        response = await client.get(path, headers=auth_for(user))
+    assert response.status_code == 200
+    assert stats.statements == expected_queries
+
+
+@pytest.mark.asyncio
+async def test_detail_endpoint_query_counts(client: AsyncClient, db_session: AsyncSession, query_budget):
+    user = await seed_tenant(db_session)
+    listing = await client.get("/api/v1/projects", headers=auth_for(user))
+    project_id = listing.json()["results"][0]["id"]
+    with query_budget(max_queries=1) as stats:
+        response = await client.get(f"/api/v1/projects/{project_id}", headers=auth_for(user))
+    assert response.status_code == 200
+    assert stats.statements == 1  # principal is cached by the listing call
+
+
+@pytest.mark.asyncio
+async def test_delete_leaves_child_rows_to_the_database(client: AsyncClient, db_session: AsyncSession, query_budget):
+    """passive_deletes: deleting a project must not load its assets/audits/rfqs first."""
+    user = await seed_tenant(db_session)
+    listing = await client.get("/api/v1/projects", headers=auth_for(user))
+    project_id = listing.json()["results"][0]["id"]
+    with query_budget(max_queries=2) as stats:
+        response = await client.delete(f"/api/v1/projects/{project_id}", headers=auth_for(user))
+    assert response.status_code == 204
+    assert stats.statements == 2  # project + DELETE (principal cached)
+
+
+@pytest.mark.asyncio
+async def test_writes_return_server_defaults_without_a_refresh(client: AsyncClient, db_session: AsyncSession, query_budget):
+    """eager_defaults: INSERT/UPDATE ... RETURNING fill created_at/updated_at, no SELECT after the flush."""
+    user = await seed_tenant(db_session)
+    listing = await client.get("/api/v1/assets", headers=auth_for(user))
+    asset_id = listing.json()["results"][0]["id"]
+    with query_budget(max_queries=2) as stats, _returning_columns("assets") as returned:
+        response = await client.patch(f"/api/v1/assets/{asset_id}", json={"status": "retired"}, headers=auth_for(user))
+    assert response.status_code == 200
+    assert response.json()["status"] == "retired" and response.json()["updated_at"]
+    assert stats.statements == 2  # asset + UPDATE ... RETURNING updated_at
+    assert returned["UPDATE"] == ["assets.updated_at"]  # not the search_vector tsvector
+
+    await client.post("/api/v1/assets", json={"name": "Warm", "asset_type": "cnc"}, headers=auth_for(user))
+    with query_budget(max_queries=2) as stats, _returning_columns("assets") as returned:
+        response = await client.post("/api/v1/assets", json={"name": "Lathe", "asset_type": "cnc"}, headers=auth_for(user))
+    assert response.status_code == 201
+    assert response.json()["created_at"] and response.json()["updated_at"]
+    # subscription (no listener here, so uncached) + INSERT ... RETURNING; assets have no plan limit
+    assert stats.statements == 2
+    assert sorted(returned["INSERT"]) == ["assets.created_at", "assets.updated_at"]
@@ -0,0 +1,153 @@
+"""Keyset (cursor) pagination on /assets and /projects alongside classic page/per_page."""
+import base64
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Asset, Company, Project, Role, User
+from app.repositories.pagination import decode_cursor, encode_cursor
+from app.config import get_settings
+from tests.conftest import make_auth_header
+
+
+async def _seed(db_session: AsyncSession, n: int = 7) -> dict:
+    """All rows share one transaction, hence one created_at: ordering must fall back to id."""
+    company = Company(name="Cursor Co", slug="cursor-co")
+    db_session.add(company)
+    await db_session.flush()
+    role = Role(company_id=company.id, name="Admin", code="admin")
+    db_session.add(role)
+    await db_session.flush()
+    user = User(
+        company_id=company.id,
+        role_id=role.id,
+        email="admin@cursor.example.com",
+        hashed_password="not-a-real-hash",
+        full_name="Cursor Admin",
+    )
+    db_session.add(user)
+    await db_session.flush()
+    for i in range(n):
+        db_session.add(Asset(company_id=company.id, name=f"Asset {i}", asset_type="cnc"))
+        db_session.add(Project(company_id=company.id, name=f"Project {i}"))
+    await db_session.flush()
+    return make_auth_header(user_id=str(user.id), tenant_id=str(company.id), role="admin")
+
+
+async def _walk(client: AsyncClient, path: str, headers: dict, per_page: int) -> list[list[str]]:
+    pages, cursor = [], ""
+    while cursor is not None:
+        response = await client.get(path, params={"cursor": cursor, "per_page": per_page}, headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["count"] == 7
+        pages.append([r["id"] for r in body["results"]])
+        cursor = body["next_cursor"]
+    return pages
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/api/v1/assets", "/api/v1/projects"])
+async def test_cursor_walk_matches_offset_order(client: AsyncClient, db_session: AsyncSession, path: str):
+    headers = await _seed(db_session)
+    pages = await _walk(client, path, headers, per_page=3)
+    assert [len(p) for p in pages] == [3, 3, 1]
+
+    offset = await client.get(path, params={"per_page": 100}, headers=headers)
+    body = offset.json()
+    assert body["next_cursor"] is None
+    assert [r["id"] for r in body["results"]] == [i for page in pages for i in page]
+
+
+@pytest.mark.asyncio
+async def test_exact_last_page_has_no_next_cursor(client: AsyncClient, db_session: AsyncSession):
+    headers = await _seed(db_session)
+    pages = await _walk(client, "/api/v1/assets", headers, per_page=7)
+    assert [len(p) for p in pages] == [7]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    ["not a cursor", base64.urlsafe_b64encode(b'{"created_at": 1}').decode(), "WyJ4IiwieSJd"],
+)
+async def test_malformed_cursor_is_400(client: AsyncClient, db_session: AsyncSession, cursor: str):
+    headers = await _seed(db_session, n=1)
+    response = await client.get("/api/v1/assets", params={"cursor": cursor}, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_cursor_round_trip():
+    created_at, row_id = datetime.now(timezone.utc), uuid.uuid4()
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/api/v1/assets", "/api/v1/projects"])
+async def test_page_and_total_in_one_query(client: AsyncClient, db_session: AsyncSession, query_budget, path: str):
+    headers = await _seed(db_session)
+    await client.get(path, headers=headers)  # warm the principal cache
+    with query_budget(max_queries=1):
+        response = await client.get(path, params={"per_page": 2, "q": "1"}, headers=headers)
+    body = response.json()
+    assert body["count"] == 1
+    assert body["count_estimated"] is False
+    assert len(body["results"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_offset_past_the_end_still_counts(client: AsyncClient, db_session: AsyncSession):
+    headers = await _seed(db_session)
+    response = await client.get("/api/v1/assets", params={"page": 5, "per_page": 3}, headers=headers)
+    body = response.json()
+    assert body["results"] == []
+    assert body["count"] == 7
+
+
+@pytest.mark.asyncio
+async def test_count_false_skips_counting(client: AsyncClient, db_session: AsyncSession, query_budget):
+    headers = await _seed(db_session)
+    await client.get("/api/v1/assets", headers=headers)
+    with query_budget(max_queries=1) as stats:
+        response = await client.get("/api/v1/assets", params={"count": "false", "per_page": 3}, headers=headers)
+    body = response.json()
+    assert body["count"] is None
+    assert len(body["results"]) == 3
+    assert "count(*)" not in stats.slowest_sql.lower()
+
+
+@pytest.mark.asyncio
+async def test_estimate_is_exact_for_small_tenants(client: AsyncClient, db_session: AsyncSession):
+    headers = await _seed(db_session)
+    response = await client.get("/api/v1/projects", params={"count": "estimate"}, headers=headers)
+    body = response.json()
+    assert body["count"] == 7
+    assert body["count_estimated"] is False
+
+
+@pytest.mark.asyncio
+async def test_estimate_uses_planner_for_large_tenants(
+    client: AsyncClient, db_session: AsyncSession, query_budget, monkeypatch
+):
+    headers = await _seed(db_session)
+    monkeypatch.setattr(get_settings(), "list_count_exact_below", 0)
+    await client.get("/api/v1/assets", headers=headers)
+    with query_budget(max_queries=2):  # EXPLAIN + page
+        response = await client.get(
+            "/api/v1/assets", params={"count": "estimate", "q": "Asset"}, headers=headers
+        )
+    body = response.json()
+    assert body["count_estimated"] is True
+    assert isinstance(body["count"], int) and body["count"] >= 0
+    assert len(body["results"]) == 7
+
+
+@pytest.mark.asyncio
+async def test_unknown_count_mode_is_422(client: AsyncClient, db_session: AsyncSession):
+    headers = await _seed(db_session, n=1)
+    response = await client.get("/api/v1/assets", params={"count": "maybe"}, headers=headers)
+    assert response.status_code == 422
@@ -0,0 +1,68 @@
+"""Password hashing off the event loop: round trip, cost upgrades and load shedding."""
+import asyncio
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core.passwords import PasswordHasher, PasswordHashingBusy
+
+
+def _hasher(rounds: int = 4, max_workers: int = 2, max_queue: int = 4) -> PasswordHasher:
+    context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+    return PasswordHasher(context, max_workers=max_workers, max_queue=max_queue)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_round_trip():
+    hasher = _hasher()
+    hashed = await hasher.hash("StrongPass1")
+    assert await hasher.verify("StrongPass1", hashed)
+    assert not await hasher.verify("WrongPass1", hashed)
+    metrics = hasher.metrics()
+    assert metrics["queue_wait_ms"]["count"] == 3
+    assert metrics["outstanding"] == 0
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_verify_and_update_rehashes_when_cost_changes():
+    old_hash = await _hasher(rounds=4).hash("StrongPass1")
+    valid, new_hash = await _hasher(rounds=5).verify_and_update("StrongPass1", old_hash)
+    assert valid
+    assert new_hash is not None and new_hash.startswith("$2b$05$")
+    assert await _hasher(rounds=5).verify_and_update("StrongPass1", new_hash) == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_sheds_load():
+    hasher = _hasher(rounds=10, max_workers=1, max_queue=1)
+    results = await asyncio.gather(*(hasher.hash("StrongPass1") for _ in range(3)), return_exceptions=True)
+    assert sum(isinstance(r, PasswordHashingBusy) for r in results) == 1
+    assert hasher.metrics()["rejected"] == 1
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_capacity_until_the_job_ends():
+    hasher = _hasher(rounds=12, max_workers=1, max_queue=0)
+    caller = asyncio.create_task(hasher.hash("StrongPass1"))
+    await asyncio.sleep(0.01)  # the job is running on the worker
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    assert hasher.metrics()["outstanding"] == 1
+    with pytest.raises(PasswordHashingBusy):
+        await hasher.hash("StrongPass1")
+    hasher.shutdown()  # waits for the abandoned job
+    assert hasher.metrics()["outstanding"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_submit_releases_its_slot():
+    hasher = _hasher(max_workers=1, max_queue=0)
+    hasher._get_executor().shutdown()
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await hasher.hash("StrongPass1")
+    assert hasher.metrics()["outstanding"] == 0
+    assert hasher.metrics()["rejected"] == 0
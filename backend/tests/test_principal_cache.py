@@ -0,0 +1,149 @@
+"""Principal cache: warm requests skip the user lookup, committed user changes invalidate it, claims-only skips the DB."""
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import database
+from app.config import get_settings
+from app.core.principal import invalidate_company_principals, invalidate_principal, principal_cache
+from app.core.read_routing import SESSION_ON_REPLICA
+from app.main import app
+from app.models import Company, User
+from app.repositories.user import user_repository
+from app.services.auth import auth_service
+from tests.conftest import TestSessionLocal, auth_for, seed_tenant
+
+
+@pytest.mark.asyncio
+async def test_warm_principal_skips_user_lookup(client: AsyncClient, db_session: AsyncSession, query_budget):
+    user = await seed_tenant(db_session)
+    with query_budget(max_queries=2):
+        await client.get("/api/v1/assets", headers=auth_for(user))
+    with query_budget(max_queries=1) as stats:
+        response = await client.get("/api/v1/assets", headers=auth_for(user))
+    assert response.status_code == 200
+    assert stats.statements == 1  # page with its total
+
+
+@pytest.mark.asyncio
+async def test_deactivated_user_is_rejected_once_committed():
+    async with TestSessionLocal() as session:
+        admin = await seed_tenant(session)
+        member = User(
+            company_id=admin.company_id,
+            email="member@example.com",
+            hashed_password="not-a-real-hash",
+        )
+        session.add(member)
+        await session.commit()
+    try:
+        # The real get_db, so the PATCH commits
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            assert (await client.get("/api/v1/projects", headers=auth_for(member))).status_code == 200
+            response = await client.patch(f"/api/v1/users/{member.id}", json={"is_active": False}, headers=auth_for(admin))
+            assert response.status_code == 200
+            assert (await client.get("/api/v1/projects", headers=auth_for(member))).status_code == 401
+    finally:
+        async with TestSessionLocal() as session:
+            await session.execute(delete(Company).where(Company.id == admin.company_id))
+            await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_replica_request_caches_the_principal_from_the_primary(monkeypatch):
+    """A replica that has not replayed a deactivation must not put the active user back in the cache."""
+    async with TestSessionLocal() as session:
+        user = await seed_tenant(session)
+        await session.commit()
+    key = (str(user.id), str(user.company_id))
+    claims = {"sub": str(user.id), "tenant_id": str(user.company_id)}
+    real_get = user_repository.get_by_id
+
+    async def lagging_replica(session, user_id, company_id, **kwargs):
+        found = await real_get(session, user_id, company_id, **kwargs)
+        if found is not None and session.info.get(SESSION_ON_REPLICA):
+            found.is_active = True  # the row as it was before the deactivation
+        return found
+
+    monkeypatch.setattr(user_repository, "get_by_id", lagging_replica)
+    replica_factory = database._sessionmaker(
+        database.engine.execution_options(postgresql_readonly=True), info={SESSION_ON_REPLICA: True}
+    )
+    try:
+        async with TestSessionLocal() as session:
+            await session.execute(update(User).where(User.id == user.id).values(is_active=False))
+            invalidate_principal(session, user.id, user.company_id)
+            await session.commit()
+        async with replica_factory() as session:
+            assert await auth_service.get_principal_from_claims(session, claims) is None
+            assert await auth_service.get_user_from_claims(session, claims) is not None  # what the replica says
+        assert not principal_cache.get(key).is_active
+    finally:
+        principal_cache.pop(key)
+        async with TestSessionLocal() as session:
+            await session.execute(delete(Company).where(Company.id == user.company_id))
+            await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_waits_for_commit_and_is_dropped_on_rollback():
+    user_id, company_id, other_user_id, other_company_id = (uuid.uuid4() for _ in range(4))
+    key, other_key = (str(user_id), str(company_id)), (str(other_user_id), str(other_company_id))
+    principal_cache.set(key, "cached")
+    principal_cache.set(other_key, "cached")
+    try:
+        async with TestSessionLocal() as session:
+            await session.execute(text("SELECT 1"))
+            invalidate_principal(session, other_user_id, other_company_id)
+            assert principal_cache.get(other_key) is not None  # not before commit
+            await session.rollback()
+
+            await session.execute(text("SELECT 1"))
+            invalidate_company_principals(session, company_id)
+            await session.commit()
+        assert principal_cache.get(key) is None
+        assert principal_cache.get(other_key) is not None  # its transaction rolled back
+    finally:
+        principal_cache.pop(key)
+        principal_cache.pop(other_key)
+
+
+@pytest.mark.asyncio
+async def test_company_slug_or_deactivation_drops_its_principals():
+    async with TestSessionLocal() as session:
+        user = await seed_tenant(session)
+        await session.commit()
+    key = (str(user.id), str(user.company_id))
+    claims = {"sub": str(user.id), "tenant_id": str(user.company_id)}
+    try:
+        for change in ({"slug": f"renamed-{uuid.uuid4().hex[:8]}"}, {"is_active": False}):
+            async with TestSessionLocal() as session:
+                assert await auth_service.get_principal_from_claims(session, claims) is not None
+                assert principal_cache.get(key) is not None
+                company = await session.get(Company, user.company_id)
+                for name, value in change.items():
+                    setattr(company, name, value)
+                await session.flush()
+                assert principal_cache.get(key) is not None  # not before commit
+                await session.commit()
+            assert principal_cache.get(key) is None
+    finally:
+        principal_cache.pop(key)
+        async with TestSessionLocal() as session:
+            await session.execute(delete(Company).where(Company.id == user.company_id))
+            await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_claims_only_company_id_skips_db(
+    client: AsyncClient, db_session: AsyncSession, query_budget, monkeypatch
+):
+    user = await seed_tenant(db_session)
+    monkeypatch.setattr(get_settings(), "auth_claims_only_company_id", True)
+    with query_budget(max_queries=1) as stats:
+        response = await client.get("/api/v1/assets", headers=auth_for(user))
+    assert response.status_code == 200
+    assert stats.statements == 1  # page with its total, no principal lookup
@@ -0,0 +1,91 @@
+"""Server-side rfq_number allocation: per-company sequences reserved in blocks per worker."""
+import asyncio
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Company, RfqNumberSequence, Role, User
+from app.services.rfq_numbers import RfqNumberAllocator, rfq_number_allocator
+from tests.conftest import TestSessionLocal, auth_for
+
+
+@pytest_asyncio.fixture
+async def committed_user(db_session: AsyncSession) -> AsyncGenerator[User, None]:
+    """A committed tenant: allocations commit in their own transactions, which must see the company."""
+    suffix = uuid.uuid4().hex[:8]
+    async with TestSessionLocal() as session:
+        company = Company(name="RFQ Numbers", slug=f"rfq-numbers-{suffix}")
+        session.add(company)
+        await session.flush()
+        role = Role(company_id=company.id, name="Admin", code="admin")
+        session.add(role)
+        await session.flush()
+        user = User(company_id=company.id, role_id=role.id, email=f"rfq-{suffix}@example.com", hashed_password="x")
+        session.add(user)
+        await session.commit()
+    try:
+        yield user
+    finally:
+        await db_session.rollback()  # release the request session's locks on the company first
+        async with TestSessionLocal() as session:
+            await session.execute(delete(Company).where(Company.id == company.id))
+            await session.commit()
+
+
+async def _next_value(company_id: uuid.UUID, period: int) -> int:
+    async with TestSessionLocal() as session:
+        result = await session.execute(
+            select(RfqNumberSequence.next_value).where(
+                RfqNumberSequence.company_id == company_id, RfqNumberSequence.period == period
+            )
+        )
+        return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_workers_reserve_blocks_and_never_collide(committed_user: User):
+    workers = [RfqNumberAllocator(TestSessionLocal, "RFQ-{year}-{seq:06d}", block_size=5) for _ in range(2)]
+    numbers = await asyncio.gather(
+        *(worker.next_number(committed_user.company_id) for worker in workers for _ in range(40))
+    )
+    year = workers[0].period()
+    assert len(set(numbers)) == 80
+    assert sorted(numbers) == [f"RFQ-{year}-{seq:06d}" for seq in range(1, 81)]
+    assert await _next_value(committed_user.company_id, year) == 81  # 16 reservations of 5, not 80 row updates
+
+    workers[0].period = lambda: year + 1  # type: ignore[method-assign]
+    assert await workers[0].next_number(committed_user.company_id) == f"RFQ-{year + 1}-000001"
+
+
+def test_format_must_have_a_seq_field():
+    assert RfqNumberAllocator(TestSessionLocal, "Q{seq:04d}", 10).render(0, 7) == "Q0007"
+    assert RfqNumberAllocator(TestSessionLocal, "Q{seq}", 10).period() == 0  # no {year}: one sequence forever
+    for bad in ("RFQ-{year}", "RFQ-{n}", "RFQ-{seq"):
+        with pytest.raises(ValueError):
+            RfqNumberAllocator(TestSessionLocal, bad, 10)
+
+
+@pytest.mark.asyncio
+async def test_create_allocates_and_skips_hand_numbered(
+    client: AsyncClient, committed_user: User, monkeypatch
+):
+    monkeypatch.setattr(rfq_number_allocator, "block_size", 3)
+    year = rfq_number_allocator.period()
+    headers = auth_for(committed_user)
+
+    first = await client.post("/api/v1/rfqs", json={"title": "Auto"}, headers=headers)
+    assert (first.status_code, first.json()["rfq_number"]) == (201, f"RFQ-{year}-000001")
+    manual = await client.post("/api/v1/rfqs", json={"title": "Manual", "rfq_number": f"RFQ-{year}-000002"}, headers=headers)
+    assert manual.status_code == 201
+    second = await client.post("/api/v1/rfqs", json={"title": "Auto"}, headers=headers)
+    assert second.json()["rfq_number"] == f"RFQ-{year}-000003"  # 000002 taken by hand: skipped, no 409
+
+    replaced = await client.put(f"/api/v1/rfqs/{second.json()['id']}", json={"title": "Auto rev B"}, headers=headers)
+    assert replaced.json()["rfq_number"] == f"RFQ-{year}-000003"
+    cleared = await client.patch(f"/api/v1/rfqs/{second.json()['id']}", json={"rfq_number": None}, headers=headers)
+    assert cleared.json()["rfq_number"] == f"RFQ-{year}-000003"
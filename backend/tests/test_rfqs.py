@@ -0,0 +1,156 @@
+"""/api/v1/rfqs: RFQ + line items written in one request as batched upserts, lines read by keyset or stream."""
+import csv
+import io
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Project
+from app.models.rfq import RfqLineItem
+from app.repositories.rfq import rfq_repository
+from app.services import rfq as rfq_module
+from tests.conftest import auth_for, seed_tenant
+
+RFQS = "/api/v1/rfqs"
+
+
+def _lines(numbers, quantity: str = "1") -> list[dict]:
+    return [{"line_number": n, "description": f"Part {n}", "quantity": quantity, "unit": "pcs"} for n in numbers]
+
+
+async def _lines_in_db(db_session: AsyncSession, rfq_id: str) -> dict[int, RfqLineItem]:
+    result = await db_session.execute(
+        select(RfqLineItem).where(RfqLineItem.rfq_id == rfq_id).execution_options(populate_existing=True)
+    )
+    return {item.line_number: item for item in result.scalars()}
+
+
+@pytest.mark.asyncio
+async def test_create_writes_lines_in_batches_and_pages_them(
+    client: AsyncClient, db_session: AsyncSession, query_budget, monkeypatch
+):
+    user = await seed_tenant(db_session)
+    monkeypatch.setattr(rfq_module.settings, "rfq_line_item_batch_rows", 1000)
+    body = {"rfq_number": "RFQ-1", "title": "Frame BOM", "line_items": _lines(range(1, 2501))}
+    await client.get("/api/v1/auth/me", headers=auth_for(user))  # warm the principal cache
+    with query_budget(max_queries=4) as stats:
+        created = await client.post(RFQS, json=body, headers=auth_for(user))
+    assert created.status_code == 201
+    assert stats.statements == 4  # INSERT rfq + 3 multi-row line upserts (1000, 1000, 500)
+    rfq = created.json()
+    assert (rfq["company_id"], rfq["created_by"], rfq["status"]) == (str(user.company_id), str(user.id), "draft")
+
+    numbers, cursor = [], None
+    while True:
+        params = {"per_page": 1000, **({"cursor": cursor} if cursor is not None else {})}
+        page = (await client.get(f"{RFQS}/{rfq['id']}/line-items", params=params, headers=auth_for(user))).json()
+        numbers += [item["line_number"] for item in page["results"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert numbers == list(range(1, 2501))
+    assert page["results"][-1]["description"] == "Part 2500"
+
+
+@pytest.mark.asyncio
+async def test_replace_upserts_changed_lines_and_deletes_missing(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    rfq = (await client.post(RFQS, json={"rfq_number": "P-1", "title": "Pump", "line_items": _lines(range(1, 6))}, headers=auth_for(user))).json()
+    before = await _lines_in_db(db_session, rfq["id"])
+    ctids = text("SELECT line_number, ctid::text FROM rfq_line_items WHERE rfq_id = :rfq_id")
+    ctid_before = dict((await db_session.execute(ctids, {"rfq_id": rfq["id"]})).all())
+
+    replacement = {
+        "title": "Pump rev B",
+        "status": "issued",
+        "line_items": _lines([1]) + _lines([2], quantity="7.5") + _lines([6]),
+    }
+    response = await client.put(f"{RFQS}/{rfq['id']}", json=replacement, headers=auth_for(user))
+    assert (response.json()["title"], response.json()["status"]) == ("Pump rev B", "issued")
+
+    after = await _lines_in_db(db_session, rfq["id"])
+    assert sorted(after) == [1, 2, 6]
+    assert str(after[2].quantity) == "7.5000"
+    assert after[1].id == before[1].id
+    ctid_after = dict((await db_session.execute(ctids, {"rfq_id": rfq["id"]})).all())
+    assert ctid_after[1] == ctid_before[1]  # identical line: no new row version written
+    assert ctid_after[2] != ctid_before[2]
+
+    cleared = await client.put(f"{RFQS}/{rfq['id']}", json={"title": "Pump rev C"}, headers=auth_for(user))
+    assert cleared.status_code == 200
+    assert await _lines_in_db(db_session, rfq["id"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_write_errors(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    other = await seed_tenant(db_session, role_code="member")
+    foreign_project = (
+        await db_session.execute(select(Project.id).where(Project.company_id == other.company_id).limit(1))
+    ).scalar_one()
+
+    first = await client.post(RFQS, json={"rfq_number": "RFQ-7", "title": "A"}, headers=auth_for(user))
+    assert first.status_code == 201
+    taken = await client.post(RFQS, json={"rfq_number": "RFQ-7", "title": "B"}, headers=auth_for(user))
+    assert taken.status_code == 409
+    # Same number in another company is fine; the 409 left the transaction usable
+    assert (await client.post(RFQS, json={"rfq_number": "RFQ-7", "title": "C"}, headers=auth_for(other))).status_code == 201
+    second = await client.post(RFQS, json={"rfq_number": "RFQ-8", "title": "D"}, headers=auth_for(user))
+    patched = await client.patch(f"{RFQS}/{second.json()['id']}", json={"rfq_number": "RFQ-7"}, headers=auth_for(user))
+    assert patched.status_code == 409
+    assert (await client.get(f"{RFQS}/{second.json()['id']}", headers=auth_for(user))).json()["rfq_number"] == "RFQ-8"
+    for field in ("title", "status"):
+        nulled = await client.patch(
+            f"{RFQS}/{second.json()['id']}", json={field: None, "rfq_number": "X-1"}, headers=auth_for(user)
+        )
+        assert nulled.status_code == 422
+
+    project = await client.post(RFQS, json={"title": "E", "project_id": str(foreign_project)}, headers=auth_for(user))
+    assert (project.status_code, project.json()["detail"]) == (404, "Project not found")
+    duplicate = await client.post(RFQS, json={"title": "F", "line_items": _lines([1, 2, 1])}, headers=auth_for(user))
+    assert duplicate.status_code == 422
+
+    listing = await client.get(RFQS, headers=auth_for(user))
+    assert sorted(r["rfq_number"] for r in listing.json()["results"]) == ["RFQ-7", "RFQ-8"]
+
+
+@pytest.mark.asyncio
+async def test_line_item_export_and_tenant_isolation(client: AsyncClient, db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    other = await seed_tenant(db_session, role_code="member")
+    rfq = (
+        await client.post(
+            RFQS, json={"rfq_number": "RFQ-9", "title": "Gearbox", "line_items": _lines([3, 1, 2])}, headers=auth_for(user)
+        )
+    ).json()
+
+    exported = await client.get(f"{RFQS}/{rfq['id']}/line-items/export?format=csv", headers=auth_for(user))
+    assert exported.headers["content-disposition"] == 'attachment; filename="rfq-RFQ-9-lines.csv"'
+    rows = list(csv.DictReader(io.StringIO(exported.text)))
+    assert [(r["line_number"], r["unit"]) for r in rows] == [("1", "pcs"), ("2", "pcs"), ("3", "pcs")]
+
+    renamed = await client.patch(f"{RFQS}/{rfq['id']}", json={"rfq_number": 'Angebot-Ü€"1'}, headers=auth_for(user))
+    assert renamed.status_code == 200
+    exported = await client.get(f"{RFQS}/{rfq['id']}/line-items/export", headers=auth_for(user))
+    assert exported.headers["content-disposition"] == (
+        "attachment; filename=\"rfq-Angebot-___1-lines.ndjson\"; "
+        "filename*=UTF-8''rfq-Angebot-%C3%9C%E2%82%AC%221-lines.ndjson"
+    )
+
+    for path in ("", "/line-items", "/line-items/export"):
+        assert (await client.get(f"{RFQS}/{rfq['id']}{path}", headers=auth_for(other))).status_code == 404
+    assert (await client.delete(f"{RFQS}/{rfq['id']}", headers=auth_for(other))).status_code == 404
+    assert (await client.delete(f"{RFQS}/{rfq['id']}", headers=auth_for(user))).status_code == 204
+    assert await _lines_in_db(db_session, rfq["id"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_update_reports_only_number_conflicts_as_taken(db_session: AsyncSession):
+    """Other integrity errors in the rfq_number savepoint propagate instead of becoming a bogus 409."""
+    user = await seed_tenant(db_session)
+    rfq = await rfq_repository.create(db_session, user.company_id, rfq_number="RFQ-1", title="A")
+    with pytest.raises(IntegrityError):
+        await rfq_repository.update(db_session, rfq, rfq_number="X-1", title=None)
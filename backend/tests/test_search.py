@@ -0,0 +1,124 @@
+"""Search modes on /assets and /projects: contains, fuzzy (pg_trgm), fulltext (tsvector)."""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Asset, Company, Project, Role, User
+from app.repositories.search import highlight
+from tests.conftest import make_auth_header
+
+
+async def _seed(db_session: AsyncSession) -> dict:
+    company = Company(name="Search Co", slug="search-co")
+    db_session.add(company)
+    await db_session.flush()
+    role = Role(company_id=company.id, name="Admin", code="admin")
+    db_session.add(role)
+    await db_session.flush()
+    user = User(
+        company_id=company.id,
+        role_id=role.id,
+        email="admin@search.example.com",
+        hashed_password="not-a-real-hash",
+        full_name="Search Admin",
+    )
+    db_session.add(user)
+    db_session.add_all(
+        [
+            Asset(company_id=company.id, name="Hydraulic press", asset_type="press", serial_number="HP-100"),
+            Asset(company_id=company.id, name="Press brake <b>", asset_type="press", serial_number="PB-7"),
+            Asset(company_id=company.id, name="Lathe", asset_type="cnc", serial_number="LT-3"),
+            Project(company_id=company.id, name="Line retrofit", code="RF-1", description="Replace the press line"),
+            Project(company_id=company.id, name="Press upgrade", code="PU-2", description="Press press press"),
+            Project(company_id=company.id, name="Warehouse", code="WH-9", description="Racking"),
+        ]
+    )
+    await db_session.flush()
+    return make_auth_header(user_id=str(user.id), tenant_id=str(company.id), role="admin")
+
+
+@pytest.mark.asyncio
+async def test_contains_keeps_newest_first_and_highlights(client: AsyncClient, db_session: AsyncSession):
+    headers = await _seed(db_session)
+    response = await client.get("/api/v1/assets", params={"q": "press"}, headers=headers)
+    body = response.json()
+    assert body["count"] == 2
+    assert all(r["rank"] is None for r in body["results"])
+    highlights = sorted(r["highlight"] for r in body["results"])
+    # Field text is HTML-escaped; only the <mark> tags are markup
+    assert highlights == ["<mark>Press</mark> brake &lt;b&gt;", "Hydraulic <mark>press</mark>"]
+
+
+@pytest.mark.asyncio
+async def test_fulltext_ranks_and_covers_description(client: AsyncClient, db_session: AsyncSession):
+    headers = await _seed(db_session)
+    response = await client.get(
+        "/api/v1/projects", params={"q": "press", "search_mode": "fulltext"}, headers=headers
+    )
+    body = response.json()
+    assert body["count"] == 2
+    names = [r["name"] for r in body["results"]]
+    assert names == ["Press upgrade", "Line retrofit"]  # more occurrences rank higher
+    ranks = [r["rank"] for r in body["results"]]
+    assert ranks[0] > ranks[1] > 0
+    assert body["results"][1]["highlight"] == "Replace the <mark>press</mark> line"
+
+
+@pytest.mark.asyncio
+async def test_fulltext_websearch_syntax(client: AsyncClient, db_session: AsyncSession):
+    headers = await _seed(db_session)
+    response = await client.get(
+        "/api/v1/assets", params={"q": "press -hydraulic", "search_mode": "fulltext"}, headers=headers
+    )
+    assert [r["name"] for r in response.json()["results"]] == ["Press brake <b>"]
+
+
+@pytest.mark.asyncio
+async def test_cursor_with_ranked_search_is_400(client: AsyncClient, db_session: AsyncSession):
+    headers = await _seed(db_session)
+    response = await client.get(
+        "/api/v1/assets", params={"q": "press", "search_mode": "fulltext", "cursor": ""}, headers=headers
+    )
+    assert response.status_code == 400
+    # contains keeps newest-first order, so cursors still work there
+    response = await client.get("/api/v1/assets", params={"q": "press", "cursor": ""}, headers=headers)
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_search_vector_follows_updates(client: AsyncClient, db_session: AsyncSession):
+    headers = await _seed(db_session)
+    created = await client.post("/api/v1/assets", json={"name": "Milling centre", "asset_type": "cnc"}, headers=headers)
+    assert created.status_code == 201
+    asset_id = created.json()["id"]
+    patched = await client.patch(f"/api/v1/assets/{asset_id}", json={"name": "Grinding centre"}, headers=headers)
+    assert patched.status_code == 200
+    response = await client.get(
+        "/api/v1/assets", params={"q": "grinding", "search_mode": "fulltext"}, headers=headers
+    )
+    assert [r["id"] for r in response.json()["results"]] == [asset_id]
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_tolerates_typos(client: AsyncClient, db_session: AsyncSession):
+    try:
+        async with db_session.begin_nested():
+            await db_session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except DBAPIError:
+        pytest.skip("pg_trgm extension not available on the test server")
+    headers = await _seed(db_session)
+    response = await client.get("/api/v1/assets", params={"q": "hydraulik", "search_mode": "fuzzy"}, headers=headers)
+    body = response.json()
+    assert [r["name"] for r in body["results"]][0] == "Hydraulic press"
+    assert body["results"][0]["rank"] > 0
+
+
+def test_highlight_trims_long_values_around_the_match():
+    value = "x" * 300 + " needle " + "y" * 300
+    result = highlight([None, "no match here", value], "needle")
+    assert result is not None
+    assert "<mark>needle</mark>" in result
+    assert result.startswith("…") and result.endswith("…")
+    assert highlight(["abc"], "zzz") is None
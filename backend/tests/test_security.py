@@ -0,0 +1,50 @@
+"""JWT verification: verified-token cache and one verification per request."""
+import jwt
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import security
+from app.core.security import create_access_token, decode_token
+from tests.conftest import auth_for, seed_tenant
+
+
+@pytest.fixture
+def jwt_decode_calls(monkeypatch):
+    """Count real signature verifications; starts from an empty verified-token cache."""
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    security._verified_tokens.clear()
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_repeat_decode_hits_verified_cache(jwt_decode_calls):
+    token = create_access_token(subject="u1", tenant_id="t1", role="user")
+    assert decode_token(token)["sub"] == "u1"
+    assert decode_token(token)["sub"] == "u1"
+    assert len(jwt_decode_calls) == 1
+
+
+def test_tampered_token_is_not_served_from_cache(jwt_decode_calls):
+    token = create_access_token(subject="u1", tenant_id="t1", role="user")
+    assert decode_token(token) is not None
+    tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+    assert decode_token(tampered) is None
+
+
+@pytest.mark.asyncio
+async def test_token_verified_once_per_request(client: AsyncClient, db_session: AsyncSession, jwt_decode_calls):
+    user = await seed_tenant(db_session)
+    security._verified_tokens.maxsize = 0  # disable the cache: only the per-request reuse is measured
+    try:
+        response = await client.get("/api/v1/projects", headers=auth_for(user))
+    finally:
+        security._verified_tokens.maxsize = security.settings.jwt_verified_cache_size
+    assert response.status_code == 200
+    assert len(jwt_decode_calls) == 1
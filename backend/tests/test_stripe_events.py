@@ -0,0 +1,260 @@
+"""
+Stripe webhook events: queued once by id, applied per tenant in Stripe's order, customers resolved
+by index; the inbox processor drains the queue with SKIP LOCKED, retries and backoff.
+"""
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1 import billing
+from app.core.notifications import PgListener
+from app.models import Company, StripeEvent
+from app.repositories.stripe_event import stripe_event_repository
+from app.services.stripe_events import EventOutcome, stripe_event_service
+from app.services.stripe_inbox import StripeInboxProcessor
+from app.services.subscription import subscription_service
+from tests.conftest import TEST_DB_URL, TestSessionLocal, seed_tenant
+
+WEBHOOK_SECRET = "whsec_test"
+
+
+def _event(event_type: str, created: int, obj: dict, event_id: str | None = None) -> dict:
+    return {
+        "id": event_id or f"evt_{uuid.uuid4().hex}",
+        "type": event_type,
+        "created": created,
+        "data": {"object": obj},
+    }
+
+
+def _checkout(company_id: uuid.UUID, created: int, customer: str = "cus_1") -> dict:
+    return _event(
+        "checkout.session.completed",
+        created,
+        {
+            "customer": customer,
+            "subscription": "sub_1",
+            "metadata": {"tenant_id": str(company_id), "plan_id": "standard"},
+        },
+    )
+
+
+async def _handle(session: AsyncSession, event: dict) -> EventOutcome:
+    """What the webhook plus the inbox processor do, inside the test transaction."""
+    if not await stripe_event_service.receive(session, event):
+        return EventOutcome.DUPLICATE
+    return await stripe_event_service.apply(session, await session.get(StripeEvent, event["id"]))
+
+
+@pytest.mark.asyncio
+async def test_redelivered_event_is_applied_once(db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    event = _checkout(user.company_id, created=1_000)
+    assert await _handle(db_session, event) is EventOutcome.APPLIED
+    await subscription_service.update(db_session, user.company_id, plan_id="basic")  # changed since
+    assert await _handle(db_session, event) is EventOutcome.DUPLICATE
+    assert (await subscription_service.get(db_session, user.company_id)).plan_id == "basic"
+
+
+@pytest.mark.asyncio
+async def test_older_event_does_not_overwrite_newer_state(db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    await _handle(db_session, _checkout(user.company_id, created=1_000))
+    renewed = _event(
+        "customer.subscription.updated",
+        3_000,
+        {"status": "active", "current_period_end": 9_000, "metadata": {"tenant_id": str(user.company_id)}},
+    )
+    failed = _event("invoice.payment_failed", 2_000, {"customer": "cus_1"})
+    assert await _handle(db_session, renewed) is EventOutcome.APPLIED
+    assert await _handle(db_session, failed) is EventOutcome.STALE  # delivered late
+    state = await subscription_service.get(db_session, user.company_id)
+    assert (state.plan_id, state.status) == ("standard", "active")
+
+    history = await stripe_event_repository.list_by_company(db_session, user.company_id)
+    assert [(e.type, e.outcome) for e in history] == [
+        ("customer.subscription.updated", "applied"),
+        ("invoice.payment_failed", "stale"),
+        ("checkout.session.completed", "applied"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_late_checkout_still_sets_the_plan(db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    updated = _event(
+        "customer.subscription.updated",
+        2_000,
+        {"status": "trialing", "current_period_end": 9_000, "metadata": {"tenant_id": str(user.company_id)}},
+    )
+    assert await _handle(db_session, updated) is EventOutcome.APPLIED
+    assert await _handle(db_session, _checkout(user.company_id, created=1_000)) is EventOutcome.APPLIED
+    state = await subscription_service.get(db_session, user.company_id)
+    assert (state.plan_id, state.status) == ("standard", "trialing")  # plan from checkout, status from the newer event
+
+    stale = _event("invoice.payment_failed", 1_500, {"customer": "cus_1"})
+    assert await _handle(db_session, stale) is EventOutcome.STALE
+
+
+@pytest.mark.asyncio
+async def test_payment_failure_resolves_tenant_by_customer(db_session: AsyncSession):
+    user = await seed_tenant(db_session)
+    await _handle(db_session, _checkout(user.company_id, created=1_000, customer="cus_pf"))
+    failed = _event("invoice.payment_failed", 2_000, {"customer": "cus_pf"})
+    assert await _handle(db_session, failed) is EventOutcome.APPLIED
+    assert (await subscription_service.get(db_session, user.company_id)).status == "past_due"
+
+    unknown = _event("invoice.payment_failed", 2_000, {"customer": "cus_nobody"})
+    assert await _handle(db_session, unknown) is EventOutcome.IGNORED
+
+
+@pytest.mark.asyncio
+async def test_unhandled_and_unknown_tenant_events_are_recorded_as_ignored(db_session: AsyncSession):
+    other = _event("charge.refunded", 1_000, {"id": "ch_1"})
+    ghost = _checkout(uuid.uuid4(), created=1_000)  # metadata names a company that does not exist
+    for event in (other, ghost):
+        assert await _handle(db_session, event) is EventOutcome.IGNORED
+        assert await _handle(db_session, event) is EventOutcome.DUPLICATE
+
+
+@pytest.mark.asyncio
+async def test_signed_webhook_is_handled_and_acknowledged(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch
+):
+    monkeypatch.setattr(billing, "STRIPE_CONFIGURED", True)
+    monkeypatch.setattr(billing, "STRIPE_WEBHOOK_SECRET", WEBHOOK_SECRET)
+    user = await seed_tenant(db_session)
+    body = json.dumps(_checkout(user.company_id, created=int(time.time()))).encode()
+    timestamp = int(time.time())
+    signature = hmac.new(WEBHOOK_SECRET.encode(), f"{timestamp}.".encode() + body, hashlib.sha256).hexdigest()
+    headers = {"stripe-signature": f"t={timestamp},v1={signature}", "content-type": "application/json"}
+
+    first = await client.post("/api/v1/billing/webhook", content=body, headers=headers)
+    again = await client.post("/api/v1/billing/webhook", content=body, headers=headers)
+    assert (first.status_code, first.json()["outcome"]) == (200, "queued")
+    assert (again.status_code, again.json()["outcome"]) == (200, "duplicate")
+    queued = await db_session.get(StripeEvent, json.loads(body)["id"])
+    assert (queued.processed_at, queued.attempts) == (None, 0)  # left for the inbox processor
+
+    bad = await client.post("/api/v1/billing/webhook", content=body, headers={"stripe-signature": "t=1,v1=00"})
+    assert bad.status_code == 400
+
+
+@pytest_asyncio.fixture
+async def inbox_company():
+    """A committed company plus cleanup of whatever events the test queued (the processor commits)."""
+    company = Company(name="Inbox Co", slug=f"inbox-{uuid.uuid4().hex[:8]}")
+    async with TestSessionLocal() as session:
+        session.add(company)
+        await session.commit()
+    yield company
+    async with TestSessionLocal() as session:
+        await session.execute(delete(StripeEvent).where(StripeEvent.payload["test_run"].astext == str(company.id)))
+        await session.execute(delete(Company).where(Company.id == company.id))
+        await session.commit()
+
+
+async def _queue(company: Company, *events: dict) -> None:
+    async with TestSessionLocal() as session:
+        for event in events:
+            await stripe_event_service.receive(session, {**event, "test_run": str(company.id)})
+        await session.commit()
+
+
+async def _stored(event_id: str) -> StripeEvent:
+    async with TestSessionLocal() as session:
+        return await session.get(StripeEvent, event_id)
+
+
+@pytest.mark.asyncio
+async def test_processor_applies_queued_events(inbox_company):
+    checkout = _checkout(inbox_company.id, created=1_000, customer=f"cus_{uuid.uuid4().hex}")
+    await _queue(inbox_company, checkout)
+    processor = StripeInboxProcessor(TestSessionLocal, PgListener(TEST_DB_URL))
+    assert await processor.drain_once() >= 1
+    stored = await _stored(checkout["id"])
+    assert (stored.outcome, stored.company_id, stored.attempts) == ("applied", inbox_company.id, 0)
+    assert stored.processed_at is not None
+    async with TestSessionLocal() as session:
+        assert (await subscription_service.get(session, inbox_company.id)).plan_id == "standard"
+
+
+@pytest.mark.asyncio
+async def test_failing_event_backs_off_then_gives_up(inbox_company, monkeypatch):
+    async def boom(session, event):
+        raise RuntimeError("handler exploded")
+
+    monkeypatch.setattr(stripe_event_service, "apply", boom)
+    event = _checkout(inbox_company.id, created=1_000)
+    await _queue(inbox_company, event)
+    processor = StripeInboxProcessor(TestSessionLocal, PgListener(TEST_DB_URL))
+    processor.max_attempts = 2
+
+    await processor.drain_once()
+    stored = await _stored(event["id"])
+    assert (stored.attempts, stored.processed_at, stored.outcome) == (1, None, None)
+    assert stored.last_error == "RuntimeError: handler exploded"
+    assert stored.next_attempt_at > datetime.now(timezone.utc)  # not due again until the backoff passes
+
+    async with TestSessionLocal() as session:
+        stored.next_attempt_at = datetime.now(timezone.utc)
+        await session.merge(stored)
+        await session.commit()
+    await processor.drain_once()
+    stored = await _stored(event["id"])
+    assert (stored.attempts, stored.outcome) == (2, "failed")
+    assert stored.processed_at is not None
+
+
+def test_retry_delay_doubles_up_to_the_cap():
+    processor = StripeInboxProcessor(TestSessionLocal, PgListener(TEST_DB_URL))
+    delays = [processor.retry_delay(n).total_seconds() for n in (1, 2, 3)]
+    assert delays == [5, 10, 20]
+    assert processor.retry_delay(50).total_seconds() == 3600
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_never_overlap(inbox_company):
+    events = [_event("charge.refunded", 1_000 + i, {"id": f"ch_{i}"}) for i in range(6)]
+    await _queue(inbox_company, *events)
+    ids = {e["id"] for e in events}
+    async with TestSessionLocal() as first, TestSessionLocal() as second:
+        claimed_first = {e.id for e in await stripe_event_repository.claim_due(first, 3)} & ids
+        claimed_second = {e.id for e in await stripe_event_repository.claim_due(second, 10)} & ids
+        await first.rollback()
+        await second.rollback()
+    assert len(claimed_first) == 3
+    assert claimed_first.isdisjoint(claimed_second)
+    assert claimed_first | claimed_second == ids
+
+
+@pytest.mark.asyncio
+async def test_notify_wakes_a_running_processor(inbox_company):
+    listener = PgListener(TEST_DB_URL)
+    processor = StripeInboxProcessor(TestSessionLocal, listener)
+    processor.poll_seconds = 60  # only the NOTIFY can wake it in time
+    await listener.start(wait_seconds=5)
+    processor.start()
+    try:
+        await asyncio.sleep(0.1)  # first pass finds nothing and starts waiting
+        event = _event("charge.refunded", 1_000, {"id": "ch_wake"})
+        await _queue(inbox_company, event)
+        for _ in range(200):
+            if (await _stored(event["id"])).processed_at is not None:
+                break
+            await asyncio.sleep(0.01)
+        else:
+            pytest.fail("processor was not woken by the inbox NOTIFY")
+    finally:
+        await processor.stop()
+        await listener.stop()